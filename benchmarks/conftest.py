@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import pytest
+
+from benchmarks.helpers.tournaments import get_trf, write_trf
+from py4swiss.trf import ParsedTrf
+
+NUMBERS_OF_PLAYERS = (50, 200, 1000, 5000)
+NUMBERS_OF_ROUNDS = (5, 10, 15)
+DEFAULT_MAX_PLAYERS = 200
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the command line options of the benchmark suite."""
+    parser.addoption(
+        "--max-players",
+        type=int,
+        default=DEFAULT_MAX_PLAYERS,
+        help=f"skip benchmarks of fields with more players than this (default: {DEFAULT_MAX_PLAYERS})",
+    )
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize the benchmarks by the size of the benchmarked tournament."""
+    if "number_of_players" in metafunc.fixturenames:
+        max_players = metafunc.config.getoption("--max-players")
+        numbers = [number for number in NUMBERS_OF_PLAYERS if number <= max_players]
+        metafunc.parametrize("number_of_players", numbers, ids=[f"{number}p" for number in numbers])
+    if "number_of_rounds" in metafunc.fixturenames:
+        metafunc.parametrize("number_of_rounds", NUMBERS_OF_ROUNDS, ids=[f"{number}r" for number in NUMBERS_OF_ROUNDS])
+
+
+@pytest.fixture
+def trf(number_of_players: int, number_of_rounds: int) -> ParsedTrf:
+    """Return the TRF of the benchmarked tournament."""
+    return get_trf(number_of_players, number_of_rounds)
+
+
+@pytest.fixture
+def trf_file(number_of_players: int, number_of_rounds: int, tmp_path: Path) -> Path:
+    """Return the path to a file containing the TRF of the benchmarked tournament."""
+    file_path = tmp_path / "tournament.trf"
+    write_trf(number_of_players, number_of_rounds, file_path)
+    return file_path
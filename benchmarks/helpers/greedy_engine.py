@@ -0,0 +1,44 @@
+from py4swiss.engines.common import Pairing, PairingEngine
+from py4swiss.trf import ParsedTrf
+from py4swiss.trf.results import ColorToken
+
+
+class GreedyEngine(PairingEngine):
+    """
+    A pairing engine greedily pairing players with equal or similar scores.
+
+    This engine does not implement any pairing system. It only serves the purpose of generating tournament histories of
+    realistic shape for large fields in little time, such that the actual engines can be benchmarked on them. Rematches
+    are avoided whenever the greedy choice allows it.
+    """
+
+    @classmethod
+    def generate_pairings(cls, trf: ParsedTrf) -> list[Pairing]:
+        """Return the round pairing of the next round for the given TRF."""
+        round_number = min(len(section.results) for section in trf.player_sections) + 1
+        sections = [section for section in trf.player_sections if len(section.results) < round_number]
+        sections.sort(key=lambda section: (-section.points_times_ten, section.starting_number))
+
+        opponents = {section.starting_number: {result.id for result in section.results} for section in sections}
+        whites = {
+            section.starting_number: sum(result.color == ColorToken.WHITE for result in section.results)
+            for section in sections
+        }
+        unpaired = [section.starting_number for section in sections]
+        pairings = []
+
+        # The lowest ranked player receives the pairing-allocated bye.
+        if len(unpaired) % 2 == 1:
+            pairings.append(Pairing(white=unpaired.pop(), black=0))
+
+        while unpaired:
+            player = unpaired.pop(0)
+            opponent = next((other for other in unpaired if other not in opponents[player]), unpaired[0])
+            unpaired.remove(opponent)
+
+            if whites[player] <= whites[opponent]:
+                pairings.append(Pairing(white=player, black=opponent))
+            else:
+                pairings.append(Pairing(white=opponent, black=player))
+
+        return pairings
@@ -0,0 +1,30 @@
+from functools import cache
+from pathlib import Path
+
+from benchmarks.helpers.greedy_engine import GreedyEngine
+from py4swiss.simulation import SimulationSettings, TournamentSimulator
+from py4swiss.trf import ParsedTrf
+
+SEED = 2025
+
+
+@cache
+def _get_trf(number_of_players: int, number_of_rounds: int) -> ParsedTrf:
+    """Return the TRF of a tournament with the given number of players after the given number of rounds."""
+    settings = SimulationSettings(number_of_players=number_of_players, number_of_rounds=number_of_rounds + 1, seed=SEED)
+    return TournamentSimulator(settings).simulate(GreedyEngine, number_of_rounds).trf
+
+
+def get_trf(number_of_players: int, number_of_rounds: int) -> ParsedTrf:
+    """
+    Return the TRF of a tournament with the given number of players after the given number of rounds.
+
+    The tournament has one more round left to be paired. The history is generated by a greedy engine, such that large
+    fields can be set up quickly. Each call returns a fresh copy, since pairing engines may modify the given TRF.
+    """
+    return _get_trf(number_of_players, number_of_rounds).model_copy(deep=True)
+
+
+def write_trf(number_of_players: int, number_of_rounds: int, file_path: Path) -> None:
+    """Write the TRF of a tournament with the given number of players after the given number of rounds to a file."""
+    _get_trf(number_of_players, number_of_rounds).write_to_file(file_path)
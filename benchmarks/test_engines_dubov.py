@@ -0,0 +1,24 @@
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from py4swiss.engines.dubov import Engine
+from py4swiss.engines.dubov.player import get_player_infos_from_trf
+from py4swiss.profiling import Profiler
+from py4swiss.trf import ParsedTrf
+
+
+@pytest.mark.benchmark(group="dubov-player-infos")
+def test_get_player_infos_from_trf(benchmark: BenchmarkFixture, trf: ParsedTrf) -> None:
+    """Benchmark building the players of the Dubov engine."""
+    benchmark(get_player_infos_from_trf, trf)
+
+
+@pytest.mark.benchmark(group="dubov-generate-pairings")
+def test_generate_pairings(benchmark: BenchmarkFixture, trf: ParsedTrf) -> None:
+    """Benchmark generating the round pairing with the Dubov engine."""
+    benchmark(Engine.generate_pairings, trf)
+
+    # Store the counters of a profiled run, including those of the matching computers, along with the timings.
+    with Profiler() as profiler:
+        Engine.generate_pairings(trf)
+    benchmark.extra_info.update(profiler.profile.counters)
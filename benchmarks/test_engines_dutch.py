@@ -0,0 +1,137 @@
+from collections import Counter
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from py4swiss.engines.dutch import Engine
+from py4swiss.engines.dutch.bracket import Bracket, BracketPairer, Brackets
+from py4swiss.engines.dutch.bracket.bracket_matcher import BracketMatcher
+from py4swiss.engines.dutch.criteria.absolute import C1, C3
+from py4swiss.engines.dutch.player import Player, get_player_infos_from_trf
+from py4swiss.engines.dutch.validity_matcher import ValidityMatcher
+from py4swiss.engines.matching import Compatibility
+from py4swiss.profiling import Profiler
+from py4swiss.trf import ParsedTrf
+
+# The stages of the bracket pairer in the order in which they are performed by the engine.
+STAGES = (
+    "determine_heterogeneous_s1",
+    "determine_heterogeneous_s2",
+    "determine_homogeneous_exchanges",
+    "determine_moves_from_s1_to_s2",
+    "determine_moves_from_s2_to_s1",
+    "perform_homogeneous_exchanges",
+    "transpose_homogeneous_s2",
+    "check_completion_criterium",
+    "get_player_pairs",
+)
+# The number of rounds for benchmarks which need to set up a fresh state for each round.
+ROUNDS = 3
+
+
+def _get_players(trf: ParsedTrf) -> list[Player]:
+    """Return the players of the given TRF in the order used by the engine."""
+    players = get_player_infos_from_trf(trf)
+    players.sort(reverse=True)
+    return players
+
+
+def _get_compatibility(trf: ParsedTrf, players: list[Player]) -> Compatibility[Player]:
+    """Return the compatibility of the given players of the given TRF as determined by the engine."""
+    return Compatibility(players, (C1, C3), trf.x_section.forbidden_pairs)
+
+
+def _get_largest_bracket(trf: ParsedTrf) -> tuple[Bracket, ValidityMatcher]:
+    """
+    Return the bracket of the largest scoregroup along with the corresponding validity matcher.
+
+    All previous brackets are paired just like the engine would pair them.
+    """
+    players = _get_players(trf)
+    round_number = min(len(section.results) for section in trf.player_sections) + 1
+    initial_color = trf.x_section.configuration.first_round_color
+    largest_scoregroup = max(Counter(player.points_with_acceleration for player in players).values())
+
+    validity_matcher = ValidityMatcher(players, _get_compatibility(trf, players))
+    brackets = Brackets(players, round_number)
+
+    while True:
+        bracket = brackets.get_current_bracket()
+        if len(bracket.resident_list) == largest_scoregroup or bracket.last_pairing_bracket:
+            return bracket, validity_matcher
+
+        bracket_pairer = BracketPairer(bracket, validity_matcher, initial_color)
+        for stage in STAGES[:-2]:
+            getattr(bracket_pairer, stage)()
+
+        if bracket_pairer.check_completion_criterium():
+            brackets.apply_bracket_pairings(bracket_pairer.get_player_pairs())
+        else:
+            brackets.collapse()
+
+
+@pytest.mark.benchmark(group="dutch-player-infos")
+def test_get_player_infos_from_trf(benchmark: BenchmarkFixture, trf: ParsedTrf) -> None:
+    """Benchmark building the players of the Dutch engine."""
+    benchmark(get_player_infos_from_trf, trf)
+
+
+@pytest.mark.benchmark(group="dutch-validity-matcher-setup")
+def test_validity_matcher_setup(benchmark: BenchmarkFixture, trf: ParsedTrf) -> None:
+    """Benchmark setting up the validity matcher."""
+    players = _get_players(trf)
+    benchmark(ValidityMatcher, players, _get_compatibility(trf, players))
+
+
+@pytest.mark.benchmark(group="dutch-compatibility-setup")
+def test_compatibility_setup(benchmark: BenchmarkFixture, trf: ParsedTrf) -> None:
+    """Benchmark determining which players are allowed to be paired with each other."""
+    players = _get_players(trf)
+    benchmark(_get_compatibility, trf, players)
+
+
+@pytest.mark.benchmark(group="dutch-validity-matcher-check")
+def test_validity_matcher_check(benchmark: BenchmarkFixture, trf: ParsedTrf) -> None:
+    """Benchmark checking whether the round can be paired."""
+    players = _get_players(trf)
+    validity_matcher = ValidityMatcher(players, _get_compatibility(trf, players))
+    benchmark(validity_matcher.is_valid_matching)
+
+
+@pytest.mark.benchmark(group="dutch-bracket-matcher-setup")
+def test_bracket_matcher_setup(benchmark: BenchmarkFixture, trf: ParsedTrf) -> None:
+    """Benchmark setting up the bracket matcher for the bracket of the largest scoregroup."""
+    bracket, validity_matcher = _get_largest_bracket(trf)
+    benchmark(BracketMatcher, bracket, validity_matcher)
+
+
+@pytest.mark.parametrize("stage", STAGES)
+def test_bracket_pairer_stage(benchmark: BenchmarkFixture, trf: ParsedTrf, stage: str) -> None:
+    """Benchmark a single stage of the bracket pairer for the bracket of the largest scoregroup."""
+    initial_color = trf.x_section.configuration.first_round_color
+    benchmark.group = f"dutch-bracket-pairer-{stage}"
+
+    def setup() -> tuple[tuple[BracketPairer], dict[str, object]]:
+        """Set up a bracket pairer which has performed all stages prior to the benchmarked one."""
+        bracket, validity_matcher = _get_largest_bracket(trf)
+        bracket_pairer = BracketPairer(bracket, validity_matcher, initial_color)
+        for previous_stage in STAGES[: STAGES.index(stage)]:
+            getattr(bracket_pairer, previous_stage)()
+        return (bracket_pairer,), {}
+
+    def perform_stage(bracket_pairer: BracketPairer) -> None:
+        """Perform the benchmarked stage."""
+        getattr(bracket_pairer, stage)()
+
+    benchmark.pedantic(perform_stage, setup=setup, rounds=ROUNDS)  # type: ignore[no-untyped-call]
+
+
+@pytest.mark.benchmark(group="dutch-generate-pairings")
+def test_generate_pairings(benchmark: BenchmarkFixture, trf: ParsedTrf) -> None:
+    """Benchmark generating the round pairing with the Dutch engine."""
+    benchmark(Engine.generate_pairings, trf)
+
+    # Store the counters of a profiled run, including those of the matching computers, along with the timings.
+    with Profiler() as profiler:
+        Engine.generate_pairings(trf)
+    benchmark.extra_info.update(profiler.profile.counters)
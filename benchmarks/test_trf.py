@@ -0,0 +1,18 @@
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from py4swiss.trf import ParsedTrf, TrfParser
+
+
+@pytest.mark.benchmark(group="trf-parse")
+def test_parse(benchmark: BenchmarkFixture, trf_file: Path) -> None:
+    """Benchmark parsing a TRF file."""
+    benchmark(TrfParser.parse, trf_file)
+
+
+@pytest.mark.benchmark(group="trf-write")
+def test_write_to_file(benchmark: BenchmarkFixture, trf: ParsedTrf, tmp_path: Path) -> None:
+    """Benchmark writing a TRF to a file."""
+    benchmark(trf.write_to_file, tmp_path / "tournament.trf")
@@ -2,7 +2,9 @@
 #define COMPUTER_H
 
 #include <cstdint>
+#include <cstddef>
 #include <memory>
+#include <utility>
 #include <vector>
 
 #include <utility/uinttypes.h>
@@ -12,6 +14,8 @@
 
 namespace matching
 {
+  class TraceWriter;
+
   /**
    * A class used for constructing instances of the weighted matching problem
    * and solving them. It is implemented in time O(n^3) using the basic
@@ -35,6 +39,7 @@ namespace matching
     Computer(Computer &) = delete;
 
     typedef detail::vertex_index vertex_index;
+    typedef detail::Statistics Statistics;
     /**
      * Edges can have weight at most
      * std::numeric_limits<edge_weight>::max() >> 2.
@@ -44,14 +49,27 @@ namespace matching
     size_type size() const;
 
     void addVertex() &;
-    void setEdgeWeight(vertex_index, vertex_index, edge_weight) &;
+    void setEdgeWeight(vertex_index, vertex_index, const edge_weight &) &;
 
     void computeMatching() const &;
 
     std::vector<vertex_index> getMatching() const;
 
+    size_type getCapacity() const;
+    edge_weight getMaxEdgeWeight() const;
+    edge_weight getEdgeWeight(vertex_index, vertex_index) const;
+
+    const Statistics &getStatistics() const &;
+    std::pair<std::size_t, std::size_t> getPeakPoolSizes() const;
+
+    void record(const std::shared_ptr<TraceWriter> &) &;
+
   private:
     const std::unique_ptr<detail::Graph<edge_weight>> graph;
+    const size_type capacity;
+
+    std::shared_ptr<TraceWriter> traceWriter;
+    std::uint32_t traceId{ };
   };
 
   namespace
@@ -48,6 +48,8 @@ namespace matching
        */
       edge_weight aboveMaxEdgeWeight;
 
+      Statistics statistics;
+
       Graph(typename Graph<edge_weight>::size_type, const edge_weight &);
       Graph(Graph &) = delete;
 
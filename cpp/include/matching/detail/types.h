@@ -12,7 +12,13 @@ namespace matching
 {
   namespace detail
   {
-    typedef utility::uinttypes::uint_least_for_value<9999> vertex_index;
+    /**
+     * The maximum number of Vertexes of a Graph. Since a Graph stores an edge
+     * weight for each pair of Vertexes, this also bounds its memory usage.
+     */
+    constexpr std::uintmax_t maxVertexCount{ 9999u };
+
+    typedef utility::uinttypes::uint_least_for_value<maxVertexCount> vertex_index;
 
     /**
      * A RootBlossom has label LABEL_ZERO iff it is exposed and its base has
@@ -23,6 +29,42 @@ namespace matching
       LABEL_OUTER, LABEL_ZERO, LABEL_INNER, LABEL_FREE
     };
 
+    /**
+     * Counters describing the work performed by all matching computations of a
+     * Graph so far. They are always updated, since incrementing them is
+     * negligible compared to the work they count.
+     */
+    struct Statistics
+    {
+      /**
+       * The number of calls to computeMatching.
+       */
+      std::uintmax_t computations{ };
+      /**
+       * The number of augmenting paths applied to the matching.
+       */
+      std::uintmax_t augmentations{ };
+      /**
+       * The number of nonzero adjustments of the dual variables.
+       */
+      std::uintmax_t dualAdjustments{ };
+      /**
+       * The number of OUTER blossoms formed.
+       */
+      std::uintmax_t blossomsFormed{ };
+      /**
+       * The number of INNER blossoms dissolved because their dual variable
+       * reached zero.
+       */
+      std::uintmax_t blossomsExpanded{ };
+      /**
+       * The number of Vertexes whose edge weights were modified between
+       * computations, i.e. which needed to be re-labeled by an incremental
+       * update.
+       */
+      std::uintmax_t relabeledVertices{ };
+    };
+
     /**
      * A class acting as a vector of multiple DynamicUints that all have the
      * same size, but using only a single block of memory.
@@ -32,8 +74,8 @@ namespace matching
     public:
       using std::vector<std::uintmax_t>::size_type;
 
-      typedef utility::uinttypes::DynamicUintView<iterator> view;
-      typedef utility::uinttypes::DynamicUintView<const_iterator> const_view;
+      typedef utility::uinttypes::DynamicUint::view view;
+      typedef utility::uinttypes::DynamicUint::const_view const_view;
 
       typedef view reference;
 
@@ -53,15 +95,15 @@ namespace matching
       {
         return
           view(
-            begin() + index * elementSize,
-            begin() + (index + 1u) * elementSize);
+            data() + index * elementSize,
+            data() + (index + 1u) * elementSize);
       }
       const_view operator[](const size_type index) const &
       {
         return
           const_view(
-            begin() + index * elementSize,
-            begin() + (index + 1u) * elementSize);
+            data() + index * elementSize,
+            data() + (index + 1u) * elementSize);
       }
 
       template <typename Iterator>
@@ -47,6 +47,11 @@ namespace matching
        */
       Vertex<edge_weight> *nextVertex{ };
       const vertex_index vertexIndex;
+      /**
+       * Whether the edge weights of this Vertex were modified since the last
+       * computation.
+       */
+      bool modified{ };
 
       Vertex(vertex_index, Graph<edge_weight> &);
 
@@ -0,0 +1,110 @@
+#ifndef MATCHINGTRACE_H
+#define MATCHINGTRACE_H
+
+#include <cstddef>
+#include <cstdint>
+#include <fstream>
+#include <string>
+#include <vector>
+
+#include <utility/dynamicuint.h>
+
+#include "detail/types.h"
+
+namespace matching
+{
+  /**
+   * The operations stored in a trace. Each operation is written as a single
+   * byte followed by the id of the Computer it was performed on and its
+   * arguments:
+   *
+   * - OPERATION_CREATE: the type of the edge weights (zero for integers, one
+   *   for DynamicUints), the capacity and the maximum edge weight
+   * - OPERATION_ADD_VERTEX: nothing
+   * - OPERATION_SET_EDGE_WEIGHT: both vertex indices and the edge weight
+   * - OPERATION_COMPUTE_MATCHING: the resulting matching
+   *
+   * All integers are unsigned and little-endian. Vertex indices are stored in
+   * two bytes, ids, sizes and capacities in four bytes. Edge weights are stored
+   * as the number of their 64-bit words in two bytes followed by the words
+   * themselves, least significant first.
+   */
+  enum TraceOperation : std::uint8_t
+  {
+    OPERATION_CREATE,
+    OPERATION_ADD_VERTEX,
+    OPERATION_SET_EDGE_WEIGHT,
+    OPERATION_COMPUTE_MATCHING
+  };
+
+  /**
+   * A class used for writing the operations performed on any number of
+   * Computers to a single binary trace file, such that they can be replayed
+   * later on without the code that originally performed them.
+   */
+  class TraceWriter
+  {
+  public:
+    explicit TraceWriter(const std::string &);
+    TraceWriter(TraceWriter &) = delete;
+
+    template <typename edge_weight>
+    std::uint32_t writeCreate(std::size_t, const edge_weight &);
+    void writeAddVertex(std::uint32_t);
+    template <typename edge_weight>
+    void writeSetEdgeWeight(
+      std::uint32_t,
+      detail::vertex_index,
+      detail::vertex_index,
+      const edge_weight &);
+    void writeComputeMatching(
+      std::uint32_t,
+      const std::vector<detail::vertex_index> &);
+
+    void close();
+
+  private:
+    std::ofstream stream;
+    std::uint32_t numberOfComputers{ };
+
+    void writeInteger(std::uintmax_t, unsigned int);
+    void writeWeight(std::uintmax_t);
+    void writeWeight(const utility::uinttypes::DynamicUint &);
+  };
+
+  /**
+   * The result of replaying a trace.
+   */
+  struct ReplayResult
+  {
+    /**
+     * The number of Computers created.
+     */
+    std::uintmax_t computers{ };
+    /**
+     * The number of operations performed.
+     */
+    std::uintmax_t operations{ };
+    /**
+     * The number of calls to computeMatching.
+     */
+    std::uintmax_t computations{ };
+    /**
+     * The number of calls to computeMatching whose result differed from the
+     * recorded one.
+     */
+    std::uintmax_t mismatches{ };
+    /**
+     * The wall time in seconds spent in computeMatching.
+     */
+    double computeSeconds{ };
+    /**
+     * The wall time in seconds spent on all operations.
+     */
+    double totalSeconds{ };
+  };
+
+  ReplayResult replayTrace(const std::string &);
+}
+
+#endif
@@ -2,11 +2,12 @@
 #define DYNAMICUINT_H
 
 #include <cassert>
+#include <cstddef>
 #include <cstdint>
 #include <limits>
 #include <utility>
-#include <vector>
 
+#include "smallvector.h"
 #include "typesizes.h"
 
 namespace utility
@@ -401,6 +402,106 @@ namespace utility
         return *this;
       }
 
+      /**
+       * Set the bit at the specified position, counting from the least
+       * significant bit. Positions beyond the size of *this are ignored, in the
+       * same way as bits shifted out by operator<<=.
+       */
+      template <typename Position>
+      const DynamicUintView<Iterator> &setBit(const Position position) const &
+      {
+        Position bit = position;
+        const Iterator iterator = wordAt(bit);
+        if (iterator != endIterator)
+        {
+          *iterator |= std::uintmax_t{ 1u } << bit;
+        }
+        return *this;
+      }
+      template <typename Position>
+      DynamicUintView<Iterator> setBit(const Position position) const &&
+      {
+        setBit(position);
+        return *this;
+      }
+
+      /**
+       * Add value, shifted to the left by the specified offset, to *this
+       * without creating a shifted copy of it. Carries beyond the size of *this
+       * are ignored.
+       */
+      template <typename Offset>
+      const DynamicUintView<Iterator>
+        &addAt(const std::uintmax_t value, const Offset offset) const &
+      {
+        Offset bit = offset;
+        Iterator iterator = wordAt(bit);
+        if (iterator == endIterator)
+        {
+          return *this;
+        }
+        // The shifted value spans at most two words. The upper one is less than
+        // 2^bit, so adding a carry to it can not overflow.
+        std::uintmax_t addend = value << bit;
+        std::uintmax_t nextAddend =
+          bit ? value >> (std::numeric_limits<std::uintmax_t>::digits - bit)
+            : 0u;
+        while (iterator != endIterator && (addend || nextAddend))
+        {
+          *iterator += addend;
+          const bool carry = *iterator < addend;
+          addend = nextAddend + carry;
+          nextAddend = 0u;
+          ++iterator;
+        }
+        return *this;
+      }
+      template <typename Offset>
+      DynamicUintView<Iterator>
+        addAt(const std::uintmax_t value, const Offset offset) const &&
+      {
+        addAt(value, offset);
+        return *this;
+      }
+
+      /**
+       * Subtract value, shifted to the left by the specified offset, from
+       * *this without creating a shifted copy of it. Borrows beyond the size of
+       * *this are ignored, i.e. the result wraps around.
+       */
+      template <typename Offset>
+      const DynamicUintView<Iterator>
+        &subtractAt(const std::uintmax_t value, const Offset offset) const &
+      {
+        Offset bit = offset;
+        Iterator iterator = wordAt(bit);
+        if (iterator == endIterator)
+        {
+          return *this;
+        }
+        std::uintmax_t subtrahend = value << bit;
+        std::uintmax_t nextSubtrahend =
+          bit ? value >> (std::numeric_limits<std::uintmax_t>::digits - bit)
+            : 0u;
+        while (iterator != endIterator && (subtrahend || nextSubtrahend))
+        {
+          const std::uintmax_t originalValue = *iterator;
+          *iterator -= subtrahend;
+          const bool borrow = originalValue < subtrahend;
+          subtrahend = nextSubtrahend + borrow;
+          nextSubtrahend = 0u;
+          ++iterator;
+        }
+        return *this;
+      }
+      template <typename Offset>
+      DynamicUintView<Iterator>
+        subtractAt(const std::uintmax_t value, const Offset offset) const &&
+      {
+        subtractAt(value, offset);
+        return *this;
+      }
+
       const DynamicUintView<Iterator> &operator++() const &
       {
         for (
@@ -498,6 +599,25 @@ namespace utility
     private:
       const Iterator beginIterator;
       const Iterator endIterator;
+
+      /**
+       * Return an iterator to the piece containing the bit at the specified
+       * position and reduce the position to one within that piece. The end
+       * iterator is returned if the position is beyond the size of *this.
+       */
+      template <typename Position>
+      Iterator wordAt(Position &bit) const
+      {
+        Iterator iterator = beginIterator;
+        while (
+          bit >= std::numeric_limits<std::uintmax_t>::digits
+            && iterator != endIterator)
+        {
+          ++iterator;
+          bit -= std::numeric_limits<std::uintmax_t>::digits;
+        }
+        return iterator;
+      }
     };
 
     template <typename Iterator>
@@ -626,21 +746,32 @@ namespace utility
       return !(value0 < value1);
     }
 
+    /**
+     * The number of pieces a DynamicUint can consist of before they are stored
+     * on the heap. Edge weights and dual variables of typical sizes thus do not
+     * require any allocation.
+     */
+    constexpr std::size_t dynamicUintInlineSize{ 4u };
+
     /**
      * A class used to store a single instance of a number compatible with the
      * DynamicUintView interface.
      */
-    class DynamicUint : private std::vector<std::uintmax_t>
+    class DynamicUint
+      : private memory::SmallVector<std::uintmax_t, dynamicUintInlineSize>
     {
+      typedef memory::SmallVector<std::uintmax_t, dynamicUintInlineSize>
+        storage;
+
     public:
       typedef DynamicUintView<iterator> view;
       typedef DynamicUintView<const_iterator> const_view;
 
       explicit DynamicUint(const std::uintmax_t value = 0)
-        : std::vector<std::uintmax_t>{ value } { }
+        : storage{ value } { }
       template <typename Iterator>
       explicit DynamicUint(const DynamicUintView<Iterator> that)
-        : std::vector<std::uintmax_t>(that.begin(), that.end()) { }
+        : storage(that.begin(), that.end()) { }
       DynamicUint(const DynamicUint &that) = default;
       DynamicUint(DynamicUint &&that) = default;
 
@@ -832,6 +963,25 @@ namespace utility
         return *this;
       }
 
+      template <typename Position>
+      DynamicUint &setBit(const Position position) &
+      {
+        view(*this).setBit(position);
+        return *this;
+      }
+      template <typename Offset>
+      DynamicUint &addAt(const std::uintmax_t value, const Offset offset) &
+      {
+        view(*this).addAt(value, offset);
+        return *this;
+      }
+      template <typename Offset>
+      DynamicUint &subtractAt(const std::uintmax_t value, const Offset offset) &
+      {
+        view(*this).subtractAt(value, offset);
+        return *this;
+      }
+
       DynamicUint &operator++() &
       {
         ++view(*this);
@@ -39,6 +39,7 @@ namespace utility
       IterablePoolIterator<T> end() const &;
 
       size_type getIndex(const T &value) const;
+      size_type getPeakSize() const;
 
       template <typename... Targs>
       T &construct(Targs &&...) &;
@@ -80,6 +81,14 @@ namespace utility
        * The head of the linked list of unallocated elements.
        */
       T *unallocatedHead;
+      /**
+       * The number of currently allocated elements.
+       */
+      size_type allocatedSize{ };
+      /**
+       * The largest number of simultaneously allocated elements so far.
+       */
+      size_type peakSize{ };
 
       template <class>
       friend class IterablePoolIterator;
@@ -219,6 +228,16 @@ namespace utility
       return &value - &storage;
     }
 
+    /**
+     * Return the largest number of elements that were allocated at the same
+     * time during the lifetime of the pool.
+     */
+    template <class T>
+    inline auto IterablePool<T>::getPeakSize() const -> size_type
+    {
+      return peakSize;
+    }
+
     /**
      * Construct a new object of type T in an unallocated memory location, and
      * add it to the linked list.
@@ -248,6 +267,11 @@ namespace utility
       tail = pointer.release();
       forwardLinks[tail - &storage] = nullptr;
 
+      if (++allocatedSize > peakSize)
+      {
+        peakSize = allocatedSize;
+      }
+
       if (!head)
       {
         head = tail;
@@ -335,6 +359,7 @@ namespace utility
 
       allocator allocator;
       allocator_traits::destroy(allocator, &value);
+      --allocatedSize;
 
       forwardLink = unallocatedHead;
       unallocatedHead = &value;
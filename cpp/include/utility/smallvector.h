@@ -0,0 +1,172 @@
+#ifndef SMALLVECTOR_H
+#define SMALLVECTOR_H
+
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+#include <initializer_list>
+#include <memory>
+#include <type_traits>
+#include <utility>
+
+namespace utility
+{
+  namespace memory
+  {
+    /**
+     * A class storing a sequence of trivially copyable elements of type T.
+     * Sequences of up to inlineSize elements are stored within the object
+     * itself, such that creating, copying and destroying them does not require
+     * any heap allocation. Longer sequences are moved to the heap.
+     */
+    template <typename T, std::size_t inlineSize>
+    class SmallVector
+    {
+      static_assert(
+        std::is_trivially_copyable<T>::value,
+        "Elements need to be trivially copyable.");
+      static_assert(inlineSize > 0u, "The inline size needs to be positive.");
+
+    public:
+      typedef T value_type;
+      typedef std::uint32_t size_type;
+      typedef T *iterator;
+      typedef const T *const_iterator;
+
+      SmallVector(const std::initializer_list<T> values)
+        : SmallVector(values.begin(), values.end()) { }
+      template <typename Iterator>
+      SmallVector(Iterator first, const Iterator last)
+      {
+        for (; first != last; ++first)
+        {
+          push_back(*first);
+        }
+      }
+      SmallVector(const SmallVector &that)
+        : SmallVector(that.begin(), that.end()) { }
+      SmallVector(SmallVector &&that) noexcept
+      {
+        *this = std::move(that);
+      }
+
+      SmallVector &operator=(const SmallVector &that) &
+      {
+        if (this != &that)
+        {
+          numberOfElements = 0u;
+          reserve(that.numberOfElements);
+          std::copy(that.begin(), that.end(), data());
+          numberOfElements = that.numberOfElements;
+        }
+        return *this;
+      }
+      SmallVector &operator=(SmallVector &&that) & noexcept
+      {
+        if (this != &that)
+        {
+          if (that.heapStorage)
+          {
+            heapStorage = std::move(that.heapStorage);
+            capacity = that.capacity;
+          }
+          else
+          {
+            heapStorage.reset();
+            capacity = inlineSize;
+            std::copy(that.begin(), that.end(), inlineStorage);
+          }
+          numberOfElements = that.numberOfElements;
+
+          that.capacity = inlineSize;
+          that.numberOfElements = 0u;
+        }
+        return *this;
+      }
+
+      iterator begin() &
+      {
+        return data();
+      }
+      const_iterator begin() const &
+      {
+        return data();
+      }
+      iterator end() &
+      {
+        return data() + numberOfElements;
+      }
+      const_iterator end() const &
+      {
+        return data() + numberOfElements;
+      }
+
+      size_type size() const
+      {
+        return numberOfElements;
+      }
+
+      /**
+       * Return whether the elements are stored within the object itself.
+       */
+      bool isInline() const
+      {
+        return !heapStorage;
+      }
+
+      void push_back(const T value) &
+      {
+        if (numberOfElements == capacity)
+        {
+          reserve(2u * capacity);
+        }
+        data()[numberOfElements++] = value;
+      }
+
+    private:
+      /**
+       * The elements if there are too many of them to be stored inline.
+       */
+      std::unique_ptr<T[]> heapStorage;
+      /**
+       * The number of elements.
+       */
+      size_type numberOfElements{ };
+      /**
+       * The number of elements that fit into the current storage.
+       */
+      size_type capacity{ inlineSize };
+      /**
+       * The elements if there are few enough of them.
+       */
+      T inlineStorage[inlineSize];
+
+      T *data()
+      {
+        return heapStorage ? heapStorage.get() : inlineStorage;
+      }
+      const T *data() const
+      {
+        return heapStorage ? heapStorage.get() : inlineStorage;
+      }
+
+      /**
+       * Make sure that the storage fits at least the specified number of
+       * elements, keeping the current ones.
+       */
+      void reserve(const size_type newCapacity) &
+      {
+        if (newCapacity <= capacity)
+        {
+          return;
+        }
+        std::unique_ptr<T[]> newStorage(new T[newCapacity]);
+        std::copy(begin(), end(), newStorage.get());
+        heapStorage = std::move(newStorage);
+        capacity = newCapacity;
+      }
+    };
+  }
+}
+
+#endif
@@ -1,9 +1,12 @@
 #include <cassert>
 #include <limits>
+#include <memory>
+#include <stdexcept>
 #include <vector>
 
 #include "computer.h"
 #include "templateinstantiation.h"
+#include "trace.h"
 
 #include "detail/graphimpl.h"
 #include "detail/rootblossomimpl.h"
@@ -25,7 +28,8 @@ namespace matching
   Computer<edge_weight>::Computer(
       const Computer<edge_weight>::size_type capacity,
       const edge_weight &maxEdgeWeight)
-    : graph(new Graph<edge_weight>(capacity, maxEdgeWeight)) { }
+    : graph(new Graph<edge_weight>(capacity, maxEdgeWeight)),
+      capacity(capacity) { }
   template <typename edge_weight>
   Computer<edge_weight>::~Computer() noexcept = default;
 
@@ -62,6 +66,11 @@ namespace matching
       }
       graph->back().edgeWeights.push_back(graph->aboveMaxEdgeWeight & 0u);
     }
+
+    if (traceWriter)
+    {
+      traceWriter->writeAddVertex(traceId);
+    }
   }
 
   /**
@@ -77,7 +86,7 @@ namespace matching
   void Computer<edge_weight>::setEdgeWeight(
     const vertex_index modifiedVertex,
     const vertex_index neighbor,
-    edge_weight edgeWeight) &
+    const edge_weight &edgeWeight) &
   {
     assert(modifiedVertex != neighbor);
     assert(modifiedVertex < graph->size());
@@ -85,12 +94,23 @@ namespace matching
     assert((graph->aboveMaxEdgeWeight - 1u) >> 2 >= edgeWeight);
     assert(edgeWeight << 2 < graph->aboveMaxEdgeWeight);
 
-    edgeWeight <<= 1;
+    if (traceWriter)
+    {
+      traceWriter->writeSetEdgeWeight(
+        traceId,
+        modifiedVertex,
+        neighbor,
+        edgeWeight);
+    }
+
+    (*graph)[modifiedVertex].modified = true;
     (*graph)[modifiedVertex]
       .rootBlossom
       ->prepareVertexForWeightAdjustments((*graph)[modifiedVertex], *graph);
-    (*graph)[modifiedVertex].edgeWeights[neighbor] = edgeWeight;
-    (*graph)[neighbor].edgeWeights[modifiedVertex] = std::move(edgeWeight);
+    auto &&storedEdgeWeight = (*graph)[modifiedVertex].edgeWeights[neighbor];
+    storedEdgeWeight = edgeWeight;
+    storedEdgeWeight <<= 1;
+    (*graph)[neighbor].edgeWeights[modifiedVertex] = storedEdgeWeight;
   }
 
   template <typename edge_weight>
@@ -104,6 +124,55 @@ namespace matching
     {
       rootBlossomIterator->putVerticesInMatchingOrder();
     }
+
+    if (traceWriter)
+    {
+      traceWriter->writeComputeMatching(traceId, getMatching());
+    }
+  }
+
+  /**
+   * Return the counters of all matching computations performed so far.
+   */
+  template <typename edge_weight>
+  const Statistics &Computer<edge_weight>::getStatistics() const &
+  {
+    return graph->statistics;
+  }
+
+  /**
+   * Return the largest number of RootBlossoms and ParentBlossoms,
+   * respectively, that existed at the same time so far.
+   */
+  template <typename edge_weight>
+  std::pair<std::size_t, std::size_t> Computer<edge_weight>::getPeakPoolSizes()
+    const
+  {
+    return
+      std::make_pair(
+        graph->rootBlossomPool.getPeakSize(),
+        graph->parentBlossomPool.getPeakSize());
+  }
+
+  /**
+   * Write all subsequent operations to the specified trace. This must be called
+   * before any vertices are added, such that the trace contains everything
+   * needed to reproduce the state of the Computer.
+   */
+  template <typename edge_weight>
+  void Computer<edge_weight>::record(
+    const std::shared_ptr<TraceWriter> &writer) &
+  {
+    if (graph->size())
+    {
+      throw std::logic_error("Only empty computers can be recorded");
+    }
+
+    traceWriter = writer;
+    traceId =
+      traceWriter->writeCreate(
+        capacity,
+        edge_weight(graph->aboveMaxEdgeWeight >> 2));
   }
 
   /**
@@ -163,6 +232,42 @@ namespace matching
     return result;
   }
 
+  /**
+   * Return the maximum number of nodes supported.
+   */
+  template <typename edge_weight>
+  auto Computer<edge_weight>::getCapacity() const
+    -> Computer<edge_weight>::size_type
+  {
+    return capacity;
+  }
+
+  /**
+   * Return the maximum edge weight as passed to the constructor.
+   */
+  template <typename edge_weight>
+  edge_weight Computer<edge_weight>::getMaxEdgeWeight() const
+  {
+    return edge_weight(graph->aboveMaxEdgeWeight >> 2);
+  }
+
+  /**
+   * Return the weight of the edge between the specified vertices as last
+   * passed to setEdgeWeight (zero if there is no edge).
+   */
+  template <typename edge_weight>
+  edge_weight Computer<edge_weight>::getEdgeWeight(
+    const vertex_index vertex,
+    const vertex_index neighbor) const
+  {
+    assert(vertex < graph->size());
+    assert(neighbor < graph->size());
+
+    edge_weight result((*graph)[vertex].edgeWeights[neighbor]);
+    result >>= 1;
+    return result;
+  }
+
 #define COMPUTER_INSTANTIATION(a) template class Computer<a>;
     INSTANTIATE_MATCHING_EDGE_WEIGHT_TEMPLATES(COMPUTER_INSTANTIATION)
 }
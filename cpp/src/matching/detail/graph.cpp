@@ -459,6 +459,7 @@ typename std::conditional<std::is_trivially_copyable<a>::value, a, a &>::type);
           );
         if (dualAdjustment)
         {
+          ++statistics.dualAdjustments;
           edge_weight twiceAdjustment = dualAdjustment << 1;
           minOuterDualVariable -= dualAdjustment;
           minInnerOuterEdgeResistance -= dualAdjustment;
@@ -518,6 +519,7 @@ typename std::conditional<std::is_trivially_copyable<a>::value, a, a &>::type);
         if (!minOuterDualVariable) {
           // An OUTER blossom has a Vertex with dualVariable 0.
           augmentToSource<edge_weight>(minOuterDualVariableVertex, nullptr);
+          ++statistics.augmentations;
           return true;
         }
         if (
@@ -534,6 +536,7 @@ typename std::conditional<std::is_trivially_copyable<a>::value, a, a &>::type);
           augmentToSource(
             minInnerOuterEdgeResistanceVertex,
             minInnerOuterEdgeResistanceVertex->minOuterEdge);
+          ++statistics.augmentations;
 
           return true;
         }
@@ -607,6 +610,7 @@ typename std::conditional<std::is_trivially_copyable<a>::value, a, a &>::type);
             assert(path.front()->rootBlossom->label == LABEL_OUTER);
             RootBlossom<edge_weight> &newBlossom =
               rootBlossomPool.construct(path.cbegin(), path.cend(), *this);
+            ++statistics.blossomsFormed;
 
             assert(newBlossom.label == LABEL_OUTER);
             for (
@@ -631,6 +635,7 @@ typename std::conditional<std::is_trivially_copyable<a>::value, a, a &>::type);
             // Augment from vertex0 to vertex1.
             augmentToSource(vertex0, vertex1);
             augmentToSource(vertex1, vertex0);
+            ++statistics.augmentations;
 
             return true;
           }
@@ -680,6 +685,7 @@ typename std::conditional<std::is_trivially_copyable<a>::value, a, a &>::type);
         else if (!minInnerDualVariable)
         {
           rootBlossomPool.hide(*minInnerDualVariableBlossom->rootBlossom);
+          ++statistics.blossomsExpanded;
 
           // An INNER RootBlossom has dualVariable zero. Dissolve it.
           Vertex<edge_weight> &rootVertex =
@@ -790,6 +796,16 @@ typename std::conditional<std::is_trivially_copyable<a>::value, a, a &>::type);
     template <typename edge_weight>
     void Graph<edge_weight>::computeMatching() &
     {
+      ++statistics.computations;
+      for (Vertex<edge_weight> &vertex : *this)
+      {
+        if (vertex.modified)
+        {
+          ++statistics.relabeledVertices;
+          vertex.modified = false;
+        }
+      }
+
       // Make sure all exposed Vertex dualVariables have the same parity.
       for (
         auto rootBlossomIterator = rootBlossomPool.begin();
@@ -0,0 +1,418 @@
+#include <algorithm>
+#include <chrono>
+#include <cstddef>
+#include <cstdint>
+#include <fstream>
+#include <iterator>
+#include <map>
+#include <memory>
+#include <stdexcept>
+#include <string>
+#include <type_traits>
+#include <utility>
+#include <vector>
+
+#include <utility/dynamicuint.h>
+
+#include "computer.h"
+#include "templateinstantiation.h"
+#include "trace.h"
+
+namespace matching
+{
+  namespace
+  {
+    using utility::uinttypes::DynamicUint;
+
+    /**
+     * The bytes at the start of every trace, followed by the version of the
+     * format.
+     */
+    const char traceMagic[4]{ 'P', '4', 'S', 'T' };
+    const std::uint8_t traceVersion{ 1u };
+
+    const std::uint8_t weightTypeInteger{ 0u };
+    const std::uint8_t weightTypeDynamicUint{ 1u };
+
+    /**
+     * A class used for reading the contents of a trace written by a
+     * TraceWriter.
+     */
+    class TraceReader
+    {
+    public:
+      explicit TraceReader(const std::string &filename)
+        : stream(filename, std::ios::binary)
+      {
+        if (!stream)
+        {
+          throw std::runtime_error("Could not open trace '" + filename + "'");
+        }
+
+        char magic[sizeof traceMagic];
+        stream.read(magic, sizeof magic);
+        if (
+          !stream
+            || !std::equal(std::begin(magic), std::end(magic), traceMagic)
+            || readInteger(1u) != traceVersion)
+        {
+          throw std::runtime_error("Invalid trace '" + filename + "'");
+        }
+      }
+
+      /**
+       * Read the next operation into the provided variable and return whether
+       * the end of the trace has not been reached yet.
+       */
+      bool readOperation(std::uint8_t &operation)
+      {
+        const int character = stream.get();
+        if (character == std::char_traits<char>::eof())
+        {
+          return false;
+        }
+        operation = static_cast<std::uint8_t>(character);
+        return true;
+      }
+
+      std::uintmax_t readInteger(const unsigned int bytes)
+      {
+        std::uintmax_t result{ };
+        for (unsigned int byte{ }; byte < bytes; ++byte)
+        {
+          const int character = stream.get();
+          if (character == std::char_traits<char>::eof())
+          {
+            throw std::runtime_error("Unexpected end of trace");
+          }
+          result |= std::uintmax_t{ static_cast<unsigned char>(character) }
+            << 8u * byte;
+        }
+        return result;
+      }
+
+      /**
+       * Read an edge weight as a vector of its words, least significant first.
+       */
+      std::vector<std::uintmax_t> readWords()
+      {
+        std::vector<std::uintmax_t> words(readInteger(2u));
+        for (std::uintmax_t &word : words)
+        {
+          word = readInteger(8u);
+        }
+        return words;
+      }
+
+    private:
+      std::ifstream stream;
+    };
+
+    validity_edge_weight toValidityWeight(
+      const std::vector<std::uintmax_t> &words)
+    {
+      if (words.size() != 1u)
+      {
+        throw std::runtime_error("Invalid edge weight in trace");
+      }
+      return static_cast<validity_edge_weight>(words.front());
+    }
+
+    optimality_edge_weight toOptimalityWeight(
+      const std::vector<std::uintmax_t> &words)
+    {
+      if (words.empty())
+      {
+        throw std::runtime_error("Invalid edge weight in trace");
+      }
+      return
+        DynamicUint(
+          utility::uinttypes::DynamicUintView<
+            std::vector<std::uintmax_t>::const_iterator
+          >(words.begin(), words.end()));
+    }
+
+    /**
+     * A helper struct holding the Computers of a trace by their ids.
+     */
+    struct ReplayComputers
+    {
+      std::map<std::uintmax_t, std::unique_ptr<Computer<validity_edge_weight>>>
+        validity;
+      std::map<
+        std::uintmax_t,
+        std::unique_ptr<Computer<optimality_edge_weight>>
+      > optimality;
+    };
+
+    template <typename edge_weight>
+    Computer<edge_weight> &getComputer(
+      std::map<std::uintmax_t, std::unique_ptr<Computer<edge_weight>>>
+        &computers,
+      const std::uintmax_t id)
+    {
+      const auto iterator = computers.find(id);
+      if (iterator == computers.end())
+      {
+        throw std::runtime_error("Unknown computer in trace");
+      }
+      return *iterator->second;
+    }
+
+    template <typename edge_weight>
+    void replayOperation(
+      TraceReader &reader,
+      const std::uint8_t operation,
+      Computer<edge_weight> &computer,
+      edge_weight (&toWeight)(const std::vector<std::uintmax_t> &),
+      ReplayResult &result)
+    {
+      switch (operation)
+      {
+      case OPERATION_ADD_VERTEX:
+        if (computer.size() >= detail::maxVertexCount)
+        {
+          throw std::runtime_error("Too many vertices in trace");
+        }
+        computer.addVertex();
+        break;
+      case OPERATION_SET_EDGE_WEIGHT:
+        {
+          const auto modifiedVertex =
+            static_cast<detail::vertex_index>(reader.readInteger(2u));
+          const auto neighbor =
+            static_cast<detail::vertex_index>(reader.readInteger(2u));
+          edge_weight edgeWeight = toWeight(reader.readWords());
+          if (modifiedVertex >= computer.size() || neighbor >= computer.size())
+          {
+            throw std::runtime_error("Invalid edge in trace");
+          }
+          computer.setEdgeWeight(
+            modifiedVertex,
+            neighbor,
+            std::move(edgeWeight));
+        }
+        break;
+      case OPERATION_COMPUTE_MATCHING:
+        {
+          std::vector<detail::vertex_index> expected(reader.readInteger(4u));
+          for (detail::vertex_index &vertex : expected)
+          {
+            vertex = static_cast<detail::vertex_index>(reader.readInteger(2u));
+          }
+
+          const auto start = std::chrono::steady_clock::now();
+          computer.computeMatching();
+          result.computeSeconds +=
+            std::chrono::duration<double>(
+              std::chrono::steady_clock::now() - start
+            ).count();
+
+          ++result.computations;
+          if (computer.getMatching() != expected)
+          {
+            ++result.mismatches;
+          }
+        }
+        break;
+      default:
+        throw std::runtime_error("Invalid operation in trace");
+      }
+    }
+  }
+
+  /**
+   * Create a new trace, overwriting the specified file if it exists.
+   */
+  TraceWriter::TraceWriter(const std::string &filename)
+    : stream(filename, std::ios::binary | std::ios::trunc)
+  {
+    if (!stream)
+    {
+      throw std::runtime_error("Could not open trace '" + filename + "'");
+    }
+    stream.write(traceMagic, sizeof traceMagic);
+    writeInteger(traceVersion, 1u);
+  }
+
+  /**
+   * Write the creation of a new Computer with the specified capacity and
+   * maximum edge weight, and return the id by which its operations are
+   * written.
+   */
+  template <typename edge_weight>
+  std::uint32_t TraceWriter::writeCreate(
+    const std::size_t capacity,
+    const edge_weight &maxEdgeWeight)
+  {
+    const std::uint32_t id = numberOfComputers++;
+    writeInteger(OPERATION_CREATE, 1u);
+    writeInteger(id, 4u);
+    writeInteger(
+      std::is_same<edge_weight, DynamicUint>::value
+        ? weightTypeDynamicUint
+        : weightTypeInteger,
+      1u);
+    writeInteger(capacity, 4u);
+    writeWeight(maxEdgeWeight);
+    return id;
+  }
+
+  void TraceWriter::writeAddVertex(const std::uint32_t id)
+  {
+    writeInteger(OPERATION_ADD_VERTEX, 1u);
+    writeInteger(id, 4u);
+  }
+
+  template <typename edge_weight>
+  void TraceWriter::writeSetEdgeWeight(
+    const std::uint32_t id,
+    const detail::vertex_index modifiedVertex,
+    const detail::vertex_index neighbor,
+    const edge_weight &edgeWeight)
+  {
+    writeInteger(OPERATION_SET_EDGE_WEIGHT, 1u);
+    writeInteger(id, 4u);
+    writeInteger(modifiedVertex, 2u);
+    writeInteger(neighbor, 2u);
+    writeWeight(edgeWeight);
+  }
+
+  /**
+   * Write a call to computeMatching along with the resulting matching, such
+   * that a replay can verify that it arrives at the same result.
+   */
+  void TraceWriter::writeComputeMatching(
+    const std::uint32_t id,
+    const std::vector<detail::vertex_index> &matching)
+  {
+    writeInteger(OPERATION_COMPUTE_MATCHING, 1u);
+    writeInteger(id, 4u);
+    writeInteger(matching.size(), 4u);
+    for (const detail::vertex_index vertex : matching)
+    {
+      writeInteger(vertex, 2u);
+    }
+  }
+
+  /**
+   * Flush all operations to the file and close it. Operations written
+   * afterwards are discarded.
+   */
+  void TraceWriter::close()
+  {
+    stream.close();
+  }
+
+  void TraceWriter::writeInteger(
+    const std::uintmax_t value,
+    const unsigned int bytes)
+  {
+    for (unsigned int byte{ }; byte < bytes; ++byte)
+    {
+      stream.put(static_cast<char>(value >> 8u * byte & 0xFFu));
+    }
+  }
+
+  void TraceWriter::writeWeight(const std::uintmax_t value)
+  {
+    writeInteger(1u, 2u);
+    writeInteger(value, 8u);
+  }
+
+  void TraceWriter::writeWeight(const DynamicUint &value)
+  {
+    const DynamicUint::const_view words(value);
+    writeInteger(std::distance(words.begin(), words.end()), 2u);
+    for (const std::uintmax_t word : words)
+    {
+      writeInteger(word, 8u);
+    }
+  }
+
+  /**
+   * Perform all operations of the specified trace on newly created Computers.
+   * The result contains the time spent and whether the matchings computed
+   * agree with the recorded ones.
+   */
+  ReplayResult replayTrace(const std::string &filename)
+  {
+    TraceReader reader(filename);
+    ReplayComputers computers;
+    ReplayResult result;
+
+    const auto start = std::chrono::steady_clock::now();
+    std::uint8_t operation;
+    while (reader.readOperation(operation))
+    {
+      const std::uintmax_t id = reader.readInteger(4u);
+
+      if (operation == OPERATION_CREATE)
+      {
+        const std::uintmax_t weightType = reader.readInteger(1u);
+        const std::uintmax_t capacity = reader.readInteger(4u);
+        const std::vector<std::uintmax_t> maxEdgeWeight = reader.readWords();
+        if (capacity > detail::maxVertexCount)
+        {
+          throw std::runtime_error("Invalid capacity in trace");
+        }
+
+        if (weightType == weightTypeInteger)
+        {
+          computers.validity[id].reset(
+            new Computer<validity_edge_weight>(
+              capacity,
+              toValidityWeight(maxEdgeWeight)));
+        }
+        else if (weightType == weightTypeDynamicUint)
+        {
+          computers.optimality[id].reset(
+            new Computer<optimality_edge_weight>(
+              capacity,
+              toOptimalityWeight(maxEdgeWeight)));
+        }
+        else
+        {
+          throw std::runtime_error("Invalid edge weight type in trace");
+        }
+        ++result.computers;
+      }
+      else if (computers.validity.count(id))
+      {
+        replayOperation(
+          reader,
+          operation,
+          getComputer(computers.validity, id),
+          toValidityWeight,
+          result);
+      }
+      else
+      {
+        replayOperation(
+          reader,
+          operation,
+          getComputer(computers.optimality, id),
+          toOptimalityWeight,
+          result);
+      }
+      ++result.operations;
+    }
+    result.totalSeconds =
+      std::chrono::duration<double>(
+        std::chrono::steady_clock::now() - start
+      ).count();
+
+    return result;
+  }
+
+#define TRACE_WRITER_INSTANTIATION(a) \
+  template std::uint32_t TraceWriter::writeCreate<a>( \
+    std::size_t, \
+    const a &); \
+  template void TraceWriter::writeSetEdgeWeight<a>( \
+    std::uint32_t, \
+    detail::vertex_index, \
+    detail::vertex_index, \
+    const a &);
+  INSTANTIATE_MATCHING_EDGE_WEIGHT_TEMPLATES(TRACE_WRITER_INSTANTIATION)
+}
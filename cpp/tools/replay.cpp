@@ -0,0 +1,36 @@
+#include <exception>
+#include <iostream>
+
+#include <matching/trace.h>
+
+/**
+ * Replay the trace given as the only argument and print the time spent as well
+ * as the number of computations whose matching differed from the recorded one.
+ * Returns a nonzero exit code if the trace is invalid or any matching differs.
+ */
+int main(const int argc, const char *const *const argv)
+{
+  if (argc != 2)
+  {
+    std::cerr << "Usage: " << argv[0] << " TRACE" << std::endl;
+    return 2;
+  }
+
+  try
+  {
+    const matching::ReplayResult result = matching::replayTrace(argv[1]);
+    std::cout
+      << "computers: " << result.computers << '\n'
+      << "operations: " << result.operations << '\n'
+      << "computations: " << result.computations << '\n'
+      << "mismatches: " << result.mismatches << '\n'
+      << "compute_seconds: " << result.computeSeconds << '\n'
+      << "total_seconds: " << result.totalSeconds << std::endl;
+    return result.mismatches ? 1 : 0;
+  }
+  catch (const std::exception &exception)
+  {
+    std::cerr << exception.what() << std::endl;
+    return 2;
+  }
+}
@@ -1,7 +1,11 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <pybind11/numpy.h>
+#include <cstddef>
+#include <iterator>
+#include <memory>
 #include "matching/computer.h"
+#include "matching/trace.h"
 #include <utility/dynamicuint.h>
 
 namespace py = pybind11;
@@ -9,9 +13,111 @@ namespace py = pybind11;
 using validity_edge_weight = matching::computer_supporting_value<1>::type::edge_weight;
 using optimality_edge_weight = utility::uinttypes::DynamicUint;
 
+template <typename edge_weight>
+py::dict get_stats(const matching::Computer<edge_weight> &computer) {
+    const auto &statistics = computer.getStatistics();
+    const auto peak_pool_sizes = computer.getPeakPoolSizes();
+
+    py::dict stats;
+    stats["computations"] = statistics.computations;
+    stats["augmentations"] = statistics.augmentations;
+    stats["dual_adjustments"] = statistics.dualAdjustments;
+    stats["blossoms_formed"] = statistics.blossomsFormed;
+    stats["blossoms_expanded"] = statistics.blossomsExpanded;
+    stats["relabeled_vertices"] = statistics.relabeledVertices;
+    stats["peak_root_blossoms"] = peak_pool_sizes.first;
+    stats["peak_parent_blossoms"] = peak_pool_sizes.second;
+    return stats;
+}
+
+template <typename edge_weight>
+bool fits(const edge_weight &weight, const edge_weight &maxEdgeWeight) {
+    return weight <= maxEdgeWeight;
+}
+
+bool fits(const optimality_edge_weight &weight, const optimality_edge_weight &maxEdgeWeight) {
+    const auto view = optimality_edge_weight::const_view(weight);
+    const auto maxView = optimality_edge_weight::const_view(maxEdgeWeight);
+    return std::distance(view.begin(), view.end()) == std::distance(maxView.begin(), maxView.end())
+        && weight <= maxEdgeWeight;
+}
+
+// The state of a computer consists of its capacity, its maximum edge weight, its number of vertices and its edges with
+// non-zero weights. The internal state of the matching routine is not included, it is recomputed when unpickling.
+template <typename edge_weight>
+py::tuple get_state(const matching::Computer<edge_weight> &computer) {
+    using vertex_index = typename matching::Computer<edge_weight>::vertex_index;
+
+    py::list edges;
+    for (std::size_t u = 0; u < computer.size(); ++u) {
+        for (std::size_t v = u + 1; v < computer.size(); ++v) {
+            const edge_weight weight =
+                computer.getEdgeWeight(static_cast<vertex_index>(u), static_cast<vertex_index>(v));
+            if (weight) {
+                edges.append(py::make_tuple(u, v, weight));
+            }
+        }
+    }
+    return py::make_tuple(computer.getCapacity(), computer.getMaxEdgeWeight(), computer.size(), edges);
+}
+
+template <typename edge_weight>
+std::unique_ptr<matching::Computer<edge_weight>> set_state(const py::tuple &state) {
+    using size_type = typename matching::Computer<edge_weight>::size_type;
+    using vertex_index = typename matching::Computer<edge_weight>::vertex_index;
+
+    if (state.size() != 4) {
+        throw py::value_error("Invalid computer state");
+    }
+    const auto capacity = state[0].cast<size_type>();
+    const auto maxEdgeWeight = state[1].cast<edge_weight>();
+    const auto size = state[2].cast<std::size_t>();
+    if (size > capacity || size > matching::detail::maxVertexCount) {
+        throw py::value_error("Invalid computer state");
+    }
+
+    std::unique_ptr<matching::Computer<edge_weight>> computer(
+        new matching::Computer<edge_weight>(capacity, maxEdgeWeight));
+    for (std::size_t i = 0; i < size; ++i) {
+        computer->addVertex();
+    }
+    for (const py::handle edge : state[3].cast<py::list>()) {
+        const auto u = edge[py::int_(0)].cast<std::size_t>();
+        const auto v = edge[py::int_(1)].cast<std::size_t>();
+        const auto weight = edge[py::int_(2)].cast<edge_weight>();
+        if (u == v || u >= size || v >= size || !fits(weight, maxEdgeWeight)) {
+            throw py::value_error("Invalid computer state");
+        }
+        computer->setEdgeWeight(static_cast<vertex_index>(u), static_cast<vertex_index>(v), weight);
+    }
+
+    // Restore the matching for the given edge weights.
+    computer->computeMatching();
+    return computer;
+}
+
+py::dict replay(const std::string &filename) {
+    const matching::ReplayResult result = matching::replayTrace(filename);
+
+    py::dict replay_result;
+    replay_result["computers"] = result.computers;
+    replay_result["operations"] = result.operations;
+    replay_result["computations"] = result.computations;
+    replay_result["mismatches"] = result.mismatches;
+    replay_result["compute_seconds"] = result.computeSeconds;
+    replay_result["total_seconds"] = result.totalSeconds;
+    return replay_result;
+}
+
 PYBIND11_MODULE(matching_computer, m) {
     m.doc() = "Matching computer python bindings";
 
+    py::class_<matching::TraceWriter, std::shared_ptr<matching::TraceWriter>>(m, "TraceWriter")
+        .def(py::init<const std::string&>())
+        .def("close", &matching::TraceWriter::close);
+
+    m.def("replay", &replay);
+
     py::class_<matching::Computer<validity_edge_weight>>(m, "ComputerDutchValidity")
         .def(py::init<typename matching::Computer<validity_edge_weight>::size_type,
                       const validity_edge_weight&>())
@@ -19,7 +125,10 @@ PYBIND11_MODULE(matching_computer, m) {
         .def("add_vertex", &matching::Computer<validity_edge_weight>::addVertex)
         .def("set_edge_weight", &matching::Computer<validity_edge_weight>::setEdgeWeight)
         .def("compute_matching", &matching::Computer<validity_edge_weight>::computeMatching)
-        .def("get_matching", &matching::Computer<validity_edge_weight>::getMatching);
+        .def("get_matching", &matching::Computer<validity_edge_weight>::getMatching)
+        .def("stats", &get_stats<validity_edge_weight>)
+        .def("record", &matching::Computer<validity_edge_weight>::record)
+        .def(py::pickle(&get_state<validity_edge_weight>, &set_state<validity_edge_weight>));
 
     py::class_<matching::Computer<optimality_edge_weight>>(m, "ComputerDutchOptimality")
         .def(py::init<typename matching::Computer<optimality_edge_weight>::size_type,
@@ -28,5 +137,8 @@ PYBIND11_MODULE(matching_computer, m) {
         .def("add_vertex", &matching::Computer<optimality_edge_weight>::addVertex)
         .def("set_edge_weight", &matching::Computer<optimality_edge_weight>::setEdgeWeight)
         .def("compute_matching", &matching::Computer<optimality_edge_weight>::computeMatching)
-        .def("get_matching", &matching::Computer<optimality_edge_weight>::getMatching);
+        .def("get_matching", &matching::Computer<optimality_edge_weight>::getMatching)
+        .def("stats", &get_stats<optimality_edge_weight>)
+        .def("record", &matching::Computer<optimality_edge_weight>::record)
+        .def(py::pickle(&get_state<optimality_edge_weight>, &set_state<optimality_edge_weight>));
 }
\ No newline at end of file
@@ -1,21 +1,123 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/operators.h>
 #include <sstream>
+#include <algorithm>
 #include <bitset>
+#include <cstring>
+#include <string>
+#include <iterator>
+#include <vector>
 #include <utility/uinttypes.h>
 #include "utility/dynamicuint.h"
 
 namespace py = pybind11;
 using namespace utility::uinttypes;
 
+namespace {
+    constexpr std::size_t wordBytes = sizeof(std::uintmax_t);
+
+    std::size_t numberOfWords(const DynamicUint &value) {
+        const auto v = DynamicUint::const_view(value);
+        return static_cast<std::size_t>(std::distance(v.begin(), v.end()));
+    }
+
+    // Convert a python integer to a single word, raising TypeError or OverflowError like python does.
+    std::uintmax_t toWord(const py::handle value) {
+        const unsigned long long word = PyLong_AsUnsignedLongLong(value.ptr());
+        if (PyErr_Occurred()) {
+            throw py::error_already_set();
+        }
+        return static_cast<std::uintmax_t>(word);
+    }
+
+    // Create a DynamicUint from its words, least significant first.
+    DynamicUint fromWords(const std::vector<std::uintmax_t> &parts) {
+        return DynamicUint(DynamicUintView<std::vector<std::uintmax_t>::const_iterator>(parts.begin(), parts.end()));
+    }
+
+    // Create a DynamicUint from the little-endian representation of its words, as returned by toBytes.
+    DynamicUint fromBytes(const std::string &bytes) {
+        if (bytes.empty() || bytes.size() % wordBytes) {
+            throw py::value_error("Invalid DynamicUint state");
+        }
+        std::vector<std::uintmax_t> parts(bytes.size() / wordBytes);
+        for (std::size_t i = 0; i < bytes.size(); ++i) {
+            parts[i / wordBytes] |= std::uintmax_t{static_cast<unsigned char>(bytes[i])} << 8 * (i % wordBytes);
+        }
+        return fromWords(parts);
+    }
+
+    std::string toBytes(const DynamicUint &value) {
+        std::string bytes;
+        for (const std::uintmax_t part : DynamicUint::const_view(value)) {
+            for (std::size_t i = 0; i < wordBytes; ++i) {
+                bytes.push_back(static_cast<char>(part >> 8 * i & 0xFFu));
+            }
+        }
+        return bytes;
+    }
+
+    // Convert a python integer of arbitrary size to a DynamicUint with the given number of words (or as few as
+    // possible if 0), raising OverflowError if it does not fit.
+    DynamicUint fromInt(const py::int_ &value, std::size_t words) {
+        if (!words) {
+            const std::size_t bits = value.attr("bit_length")().cast<std::size_t>();
+            words = std::max<std::size_t>(1, (bits + 8 * wordBytes - 1) / (8 * wordBytes));
+        }
+        return fromBytes(value.attr("to_bytes")(words * wordBytes, "little").cast<std::string>());
+    }
+
+    py::int_ toInt(const DynamicUint &value) {
+        py::object intType = py::reinterpret_borrow<py::object>(reinterpret_cast<PyObject *>(&PyLong_Type));
+        return intType.attr("from_bytes")(py::bytes(toBytes(value)), "little");
+    }
+
+    // Copy the words of a DynamicUint from a one-dimensional buffer of unsigned 64-bit integers, e.g. a row of a NumPy
+    // array or a slice of shared memory.
+    DynamicUint fromBuffer(const py::buffer &buffer) {
+        const py::buffer_info info = buffer.request();
+        const std::string format = info.format.substr(info.format.find_first_not_of("@=<"));
+        if (
+            info.ndim != 1 || info.shape[0] < 1 || info.itemsize != static_cast<py::ssize_t>(wordBytes)
+                || (format != "Q" && format != "L")
+        ) {
+            throw py::value_error("Buffer needs to be a non-empty one-dimensional sequence of unsigned 64-bit integers");
+        }
+        std::vector<std::uintmax_t> parts(static_cast<std::size_t>(info.shape[0]));
+        const char *data = static_cast<const char *>(info.ptr);
+        for (std::size_t i = 0; i < parts.size(); ++i) {
+            std::memcpy(&parts[i], data + static_cast<py::ssize_t>(i) * info.strides[0], wordBytes);
+        }
+        return fromWords(parts);
+    }
+}
+
 PYBIND11_MODULE(dynamicuint, m) {
     m.doc() = "DynamicUint python bindings";
 
-    py::class_<DynamicUint>(m, "DynamicUint")
+    py::class_<DynamicUint>(m, "DynamicUint", py::buffer_protocol())
         // Constructors
         .def(py::init<>())                                    // empty (zero)
         .def(py::init<std::uintmax_t>())                      // from integer
         .def(py::init<DynamicUint const &>())                 // copy
+        .def(py::init(&fromBuffer))                           // from buffer of words
+
+        // Buffer protocol exposing the words, least significant first, as read-only unsigned 64-bit integers
+        .def_buffer([](const DynamicUint &value) {
+            return py::buffer_info(
+                const_cast<std::uintmax_t *>(DynamicUint::const_view(value).begin()),
+                static_cast<py::ssize_t>(wordBytes),
+                py::format_descriptor<std::uintmax_t>::format(),
+                1,
+                {static_cast<py::ssize_t>(numberOfWords(value))},
+                {static_cast<py::ssize_t>(wordBytes)},
+                true);
+        })
+
+        // Pickling via the little-endian representation of the words
+        .def(py::pickle(
+            [](const DynamicUint &value) { return py::bytes(toBytes(value)); },
+            [](const py::bytes &state) { return fromBytes(state); }))
 
         // Arithmetic operators
         .def(py::self + py::self)
@@ -106,5 +208,37 @@ PYBIND11_MODULE(dynamicuint, m) {
         })
 
         // Expose shiftGrow
-        .def("shift_grow", &DynamicUint::shiftGrow<std::size_t>);
+        .def("shift_grow", &DynamicUint::shiftGrow<std::size_t>)
+
+        // Fused operations for building weights without intermediate instances
+        .def("set_bit", [](DynamicUint &a, std::size_t position) { a.setBit(position); })
+        .def("add_at", [](DynamicUint &a, std::uintmax_t value, std::size_t offset) { a.addAt(value, offset); })
+        .def("subtract_at", [](DynamicUint &a, std::uintmax_t value, std::size_t offset) { a.subtractAt(value, offset); })
+        .def("pack", [](const DynamicUint &a, const py::iterable &fields) {
+            DynamicUint result = a;
+            const std::size_t words = numberOfWords(a);
+            for (const py::handle field : fields) {
+                const py::tuple pair = py::reinterpret_borrow<py::object>(field).cast<py::tuple>();
+                if (pair.size() != 2) {
+                    throw py::value_error("Fields need to be pairs of a value and a bit width");
+                }
+                result <<= pair[1].cast<std::size_t>();
+                if (py::isinstance<DynamicUint>(pair[0])) {
+                    const DynamicUint &value = pair[0].cast<const DynamicUint &>();
+                    if (numberOfWords(value) != words) {
+                        throw py::value_error("Field values need to have the same size");
+                    }
+                    result += value;
+                } else {
+                    result.addAt(toWord(pair[0]), 0u);
+                }
+            }
+            return result;
+        })
+
+        // Conversions from and to python integers of arbitrary size
+        .def_static("from_int", [](const py::int_ &value, const DynamicUint *like) {
+            return fromInt(value, like ? numberOfWords(*like) : 0);
+        }, py::arg("value"), py::arg("like") = py::none())
+        .def("to_int", &toInt);
 }
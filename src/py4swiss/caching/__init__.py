@@ -0,0 +1,6 @@
+from py4swiss.caching.disk_pairing_cache import DiskPairingCache
+from py4swiss.caching.memory_pairing_cache import MemoryPairingCache
+from py4swiss.caching.pairing_cache import PairingCache
+from py4swiss.caching.speculative_pairer import SpeculativePairer
+
+__all__ = ["DiskPairingCache", "MemoryPairingCache", "PairingCache", "SpeculativePairer"]
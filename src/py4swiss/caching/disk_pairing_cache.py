@@ -0,0 +1,48 @@
+import os
+import tempfile
+from pathlib import Path
+
+from pydantic import TypeAdapter, ValidationError
+
+from py4swiss.caching.pairing_cache import PairingCache
+from py4swiss.engines.common import Pairing
+
+_PAIRINGS_ADAPTER: TypeAdapter[list[Pairing]] = TypeAdapter(list[Pairing])
+
+
+class DiskPairingCache(PairingCache):
+    """
+    A cache of round pairings stored as JSON files in a directory.
+
+    Each round pairing is stored in a separate file named after its fingerprint. Files are replaced atomically, such
+    that the directory can be shared by multiple processes.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """Initialize a new cache in the given directory."""
+        self.directory: Path = directory
+
+    def _get_file_path(self, fingerprint: str) -> Path:
+        """Return the path of the file for the given fingerprint."""
+        return self.directory / f"{fingerprint}.json"
+
+    def get(self, fingerprint: str) -> list[Pairing] | None:
+        """Return the round pairing stored for the given fingerprint, if any."""
+        try:
+            return _PAIRINGS_ADAPTER.validate_json(self._get_file_path(fingerprint).read_bytes())
+        except (OSError, ValidationError):
+            # Missing or corrupted files are treated as missing entries.
+            return None
+
+    def set(self, fingerprint: str, pairings: list[Pairing]) -> None:
+        """Store the given round pairing for the given fingerprint."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        fd, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(_PAIRINGS_ADAPTER.dump_json(pairings))
+            Path(temporary_path).replace(self._get_file_path(fingerprint))
+        except BaseException:
+            Path(temporary_path).unlink(missing_ok=True)
+            raise
@@ -0,0 +1,64 @@
+from collections import OrderedDict
+from threading import Lock
+
+from py4swiss.caching.pairing_cache import PairingCache
+from py4swiss.engines.common import Pairing
+
+
+class MemoryPairingCache(PairingCache):
+    """
+    An in-memory cache of round pairings discarding the least recently used entries.
+
+    Optionally, another cache, e.g. on disk, can be placed behind this one. Entries missing in memory are then looked up
+    in the other cache and new entries are stored in both caches.
+    """
+
+    def __init__(self, max_size: int = 128, store: PairingCache | None = None) -> None:
+        """Initialize a new cache holding at most the given number of round pairings."""
+        if max_size < 1:
+            error_message = "Maximum size must be positive"
+            raise ValueError(error_message)
+
+        self.max_size: int = max_size
+        self.store: PairingCache | None = store
+        self._entries: OrderedDict[str, list[Pairing]] = OrderedDict()
+        self._lock: Lock = Lock()
+
+    def __len__(self) -> int:
+        """Return the number of round pairings held in memory."""
+        return len(self._entries)
+
+    def _add(self, fingerprint: str, pairings: list[Pairing]) -> None:
+        """Hold the given round pairing in memory and discard the least recently used one if necessary."""
+        with self._lock:
+            self._entries[fingerprint] = pairings
+            self._entries.move_to_end(fingerprint)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def get(self, fingerprint: str) -> list[Pairing] | None:
+        """Return the round pairing stored for the given fingerprint, if any."""
+        with self._lock:
+            pairings = self._entries.get(fingerprint)
+            if pairings is not None:
+                self._entries.move_to_end(fingerprint)
+                return pairings
+
+        if self.store is None:
+            return None
+
+        pairings = self.store.get(fingerprint)
+        if pairings is not None:
+            self._add(fingerprint, pairings)
+        return pairings
+
+    def set(self, fingerprint: str, pairings: list[Pairing]) -> None:
+        """Store the given round pairing for the given fingerprint."""
+        self._add(fingerprint, pairings)
+        if self.store is not None:
+            self.store.set(fingerprint, pairings)
+
+    def clear(self) -> None:
+        """Discard all round pairings held in memory."""
+        with self._lock:
+            self._entries.clear()
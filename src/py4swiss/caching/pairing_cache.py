@@ -0,0 +1,41 @@
+from abc import ABC, abstractmethod
+
+from py4swiss.engines.common import Pairing, PairingEngine
+from py4swiss.trf import ParsedTrf
+
+
+class PairingCache(ABC):
+    """
+    Abstract base class for caches of round pairings.
+
+    Round pairings are stored by the fingerprint of the pairing-relevant information of a TRF (see
+    'PairingEngine.get_fingerprint'). Thus, resubmitting a TRF that only differs in e.g. the names of the players
+    returns the round pairing without running the engine again.
+    """
+
+    @abstractmethod
+    def get(self, fingerprint: str) -> list[Pairing] | None:
+        """Return the round pairing stored for the given fingerprint, if any."""
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def set(self, fingerprint: str, pairings: list[Pairing]) -> None:
+        """Store the given round pairing for the given fingerprint."""
+        pass  # pragma: no cover
+
+    def generate_pairings(self, engine: type[PairingEngine], trf: ParsedTrf) -> list[Pairing]:
+        """
+        Return the round pairing of the next round for the given TRF generated by the given engine.
+
+        If a round pairing is stored for the fingerprint of the TRF, it is returned without running the engine.
+        Otherwise, the round pairing generated by the engine is stored.
+        """
+        fingerprint = engine.get_fingerprint(trf)
+        pairings = self.get(fingerprint)
+
+        if pairings is None:
+            pairings = engine.generate_pairings(trf)
+            self.set(fingerprint, pairings)
+
+        # Copies are returned such that modifications do not affect the stored round pairing.
+        return [pairing.model_copy() for pairing in pairings]
@@ -0,0 +1,185 @@
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product, repeat
+
+from py4swiss.caching.memory_pairing_cache import MemoryPairingCache
+from py4swiss.caching.pairing_cache import PairingCache
+from py4swiss.engines.common import Pairing, PairingEngine, PairingError
+from py4swiss.trf import ParsedTrf
+from py4swiss.trf.results import ColorToken, ResultToken, RoundResult
+
+# The possible outcomes of a game from the perspective of white and black, respectively.
+GAME_OUTCOMES = (
+    (ResultToken.WIN, ResultToken.LOSS),
+    (ResultToken.DRAW, ResultToken.DRAW),
+    (ResultToken.LOSS, ResultToken.WIN),
+)
+FORFEIT_OUTCOMES = (
+    (ResultToken.FORFEIT_WIN, ResultToken.FORFEIT_LOSS),
+    (ResultToken.FORFEIT_LOSS, ResultToken.FORFEIT_WIN),
+    (ResultToken.FORFEIT_LOSS, ResultToken.FORFEIT_LOSS),
+)
+
+DEFAULT_MAX_SIZE = 1024
+
+
+def _has_pending_result(results: list[RoundResult]) -> bool:
+    """Check whether the latest of the given round results is pending."""
+    return bool(results) and results[-1].result == ResultToken.PENDING
+
+
+def _generate_pairings(engine: type[PairingEngine], trf: ParsedTrf) -> list[Pairing] | None:
+    """Return the round pairing generated by the given engine for the given TRF, if one exists."""
+    try:
+        return engine.generate_pairings(trf)
+    except PairingError:
+        return None
+
+
+class SpeculativePairer:
+    """
+    A class for pairing the next round in advance while games of the current round are still in progress.
+
+    Given a TRF containing all finished games of the current round and the unfinished games, the next round is paired
+    for every possible combination of outcomes of the unfinished games in a process pool. All round pairings are stored
+    in a cache, such that the round pairing is available instantly once the last result is entered. For example:
+
+        pairer = SpeculativePairer(DutchEngine)
+        pairer.prepare(trf, [Pairing(white=12, black=7)])
+        ...
+        pairings = pairer.generate_pairings(final_trf)
+
+    Note that the number of scenarios grows exponentially with the number of unfinished games, i.e. there are 3^k
+    scenarios for k unfinished games or 6^k if forfeits are considered as well.
+    """
+
+    def __init__(
+        self,
+        engine: type[PairingEngine],
+        cache: PairingCache | None = None,
+        max_workers: int | None = None,
+        *,
+        forfeits: bool = False,
+    ) -> None:
+        """Initialize a new speculative pairer for the given engine."""
+        self.engine: type[PairingEngine] = engine
+        self.cache: PairingCache = cache if cache is not None else MemoryPairingCache(max_size=DEFAULT_MAX_SIZE)
+        self.max_workers: int | None = max_workers
+        self.forfeits: bool = forfeits
+
+    @staticmethod
+    def _validate_unfinished_games(trf: ParsedTrf, unfinished_games: list[Pairing]) -> None:
+        """
+        Validate that the unfinished games complete the current round of the given TRF.
+
+        The unfinished games need to be between distinct players of the given TRF without a result for the current
+        round, i.e. the round after the one all players have a result for. A pending result for the current round, e.g.
+        as written by 'PairingEngine.write_pairings_to_trf', does not count as a result, but needs to belong to one of
+        the unfinished games. Furthermore, once the unfinished games are finished, all players need to have the same
+        number of results. Otherwise, the engine would only pair some of the players.
+        """
+        numbers_of_results: dict[int, int] = {}
+        pending_results: dict[int, RoundResult] = {}
+
+        for player_section in trf.player_sections:
+            results = player_section.results
+            if _has_pending_result(results):
+                pending_results[player_section.starting_number] = results[-1]
+            numbers_of_results[player_section.starting_number] = len(results) - _has_pending_result(results)
+
+        min_number_of_results = min(numbers_of_results.values(), default=0)
+        players: set[int] = set()
+
+        for game in unfinished_games:
+            for player, opponent, color in (
+                (game.white, game.black, ColorToken.WHITE),
+                (game.black, game.white, ColorToken.BLACK),
+            ):
+                if player not in numbers_of_results:
+                    error_message = f"Starting number '{player}' is missing"
+                    raise ValueError(error_message)
+                if player in players:
+                    error_message = f"Starting number '{player}' is part of multiple unfinished games"
+                    raise ValueError(error_message)
+                if numbers_of_results[player] > min_number_of_results:
+                    error_message = (
+                        f"Starting number '{player}' already has a result for round {min_number_of_results + 1}"
+                    )
+                    raise ValueError(error_message)
+                pending_result = pending_results.get(player)
+                if pending_result is not None and (pending_result.id, pending_result.color) != (opponent, color):
+                    error_message = f"Starting number '{player}' has a pending result for a different game"
+                    raise ValueError(error_message)
+                players.add(player)
+
+        for player in pending_results:
+            if player not in players:
+                error_message = f"Starting number '{player}' has a pending result, but no unfinished game"
+                raise ValueError(error_message)
+
+        for player, number_of_results in numbers_of_results.items():
+            if number_of_results + (player in players) != min_number_of_results + bool(players):
+                error_message = (
+                    f"Starting number '{player}' has a different number of results than the other players once the "
+                    f"unfinished games are finished"
+                )
+                raise ValueError(error_message)
+
+    def get_scenarios(self, trf: ParsedTrf, unfinished_games: list[Pairing]) -> Iterator[ParsedTrf]:
+        """Return the TRFs resulting from all possible combinations of outcomes of the unfinished games."""
+        self._validate_unfinished_games(trf, unfinished_games)
+
+        outcomes = GAME_OUTCOMES + FORFEIT_OUTCOMES if self.forfeits else GAME_OUTCOMES
+        scoring_point_system = trf.x_section.scoring_point_system
+
+        for scenario in product(outcomes, repeat=len(unfinished_games)):
+            scenario_trf = trf.model_copy(deep=True)
+            player_sections = {section.starting_number: section for section in scenario_trf.player_sections}
+
+            for game, (result_white, result_black) in zip(unfinished_games, scenario, strict=True):
+                round_results = (
+                    (game.white, RoundResult(id=game.black, color=ColorToken.WHITE, result=result_white)),
+                    (game.black, RoundResult(id=game.white, color=ColorToken.BLACK, result=result_black)),
+                )
+                for player, round_result in round_results:
+                    player_section = player_sections[player]
+                    # A pending result of the game is replaced, since it does not award any points.
+                    if _has_pending_result(player_section.results):
+                        player_section.results[-1] = round_result
+                    else:
+                        player_section.results.append(round_result)
+                    player_section.points_times_ten += scoring_point_system.get_points_times_ten(round_result)
+
+            yield scenario_trf
+
+    def prepare(self, trf: ParsedTrf, unfinished_games: list[Pairing]) -> int:
+        """
+        Pair the next round for all possible outcomes of the given unfinished games and store the round pairings.
+
+        Returns the number of scenarios for which a round pairing exists.
+        """
+        scenarios = {
+            self.engine.get_fingerprint(scenario): scenario for scenario in self.get_scenarios(trf, unfinished_games)
+        }
+
+        # Scenarios paired before, e.g. by a previous call with more unfinished games, are skipped.
+        pending = {
+            fingerprint: scenario for fingerprint, scenario in scenarios.items() if self.cache.get(fingerprint) is None
+        }
+
+        if pending:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                results = executor.map(_generate_pairings, repeat(self.engine), pending.values())
+                for fingerprint, pairings in zip(pending, results, strict=True):
+                    if pairings is not None:
+                        self.cache.set(fingerprint, pairings)
+
+        return sum(self.cache.get(fingerprint) is not None for fingerprint in scenarios)
+
+    def generate_pairings(self, trf: ParsedTrf) -> list[Pairing]:
+        """
+        Return the round pairing of the next round for the given TRF.
+
+        If the TRF corresponds to a prepared scenario, the stored round pairing is returned without running the engine.
+        """
+        return self.cache.generate_pairings(self.engine, trf)
@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+
+import numpy as np
+import numpy.typing as npt
+from typing_extensions import Buffer
+
 class DynamicUint:
     """
     An unsigned integer with a dynamic size.
@@ -10,15 +16,33 @@ class DynamicUint:
     class and python integers will work properly only for integers with up to 32 bits.
     """
 
-    def __init__(self, value: int | DynamicUint = 0) -> None:
+    def __init__(self, value: int | DynamicUint | Buffer | npt.NDArray[np.uint64] = 0) -> None:
         """
         Create a new instance.
 
         Either copy from a given instance or by create a new instance with a single integer part and assigning the given
-        integer value.
+        integer value. Alternatively, the integer parts can be copied from a one-dimensional buffer of unsigned 64-bit
+        integers, least significant first, e.g. a row of a NumPy array or a slice of shared memory.
+        """
+        ...
+
+    def __buffer__(self, flags: int, /) -> memoryview:
+        """
+        Expose the integer parts as a read-only buffer of unsigned 64-bit integers, least significant first.
+
+        This allows e.g. 'numpy.asarray' to access the integer parts without conversion. Note that the buffer must not
+        be used after the instance has changed its size, e.g. via 'shift_grow'.
         """
         ...
 
+    def __getstate__(self) -> bytes:
+        """Return the integer parts in little-endian byte order for pickling."""
+        ...
+
+    def __setstate__(self, state: bytes) -> None:
+        """Restore the integer parts from the state returned by __getstate__()."""
+        ...
+
     def __add__(self, other: DynamicUint) -> DynamicUint:
         """
         Call 'add' pointwise on all integer parts.
@@ -133,3 +157,54 @@ class DynamicUint:
         a new highest part is added to capture the overflow.
         """
         ...
+
+    def set_bit(self, position: int) -> None:
+        """
+        Set the bit at the given position in place.
+
+        Positions beyond the current size are ignored, in the same way as bits which overflow when shifting.
+        """
+        ...
+
+    def add_at(self, value: int, offset: int) -> None:
+        """
+        Add the given integer shifted to the left by the given offset in place.
+
+        This is equivalent to 'self += (zero | value) << offset' without creating any intermediate instances. The given
+        integer can have up to 64 bits. Bits which overflow from the highest part are ignored.
+        """
+        ...
+
+    def subtract_at(self, value: int, offset: int) -> None:
+        """
+        Subtract the given integer shifted to the left by the given offset in place.
+
+        This is equivalent to 'self -= (zero | value) << offset' without creating any intermediate instances. The given
+        integer can have up to 64 bits. If the result would be negative, it wraps around.
+        """
+        ...
+
+    def pack(self, fields: Iterable[tuple[int | DynamicUint, int]]) -> DynamicUint:
+        """
+        Return a new instance of the same size with the given fields appended to the bits of this one.
+
+        Each field consists of a value and a bit width. For each field in order, the intermediate result is shifted to
+        the left by the bit width and the value is added to it. Thus, the fields are to be given from the most
+        significant to the least significant one. Values which are instances need to have the same size as this one,
+        integer values can have up to 64 bits.
+        """
+        ...
+
+    @staticmethod
+    def from_int(value: int, like: DynamicUint | None = None) -> DynamicUint:
+        """
+        Return a new instance holding the given non-negative integer of arbitrary size.
+
+        The new instance has the same size as the given one or, if none is given, the smallest size to hold the integer.
+        An OverflowError is raised if the integer does not fit.
+        """
+        ...
+
+    def to_int(self) -> int:
+        """Return the concatenation of all integer parts as an integer of arbitrary size."""
+        ...
@@ -1,5 +1,32 @@
-from py4swiss.engines.burstein import Engine as BursteinEngine
-from py4swiss.engines.dubov import Engine as DubovEngine
-from py4swiss.engines.dutch import Engine as DutchEngine
+from __future__ import annotations
 
-__all__ = ["BursteinEngine", "DubovEngine", "DutchEngine"]
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+from py4swiss.engines.registry import get_engine, get_engine_names
+
+if TYPE_CHECKING:
+    from py4swiss.engines.burstein import Engine as BursteinEngine
+    from py4swiss.engines.common import PairingEngine
+    from py4swiss.engines.dubov import Engine as DubovEngine
+    from py4swiss.engines.dutch import Engine as DutchEngine
+
+# Each engine pulls in all of its criteria as well as the compiled matching extensions. Thus, engines are only imported
+# on first access such that only the engine which is actually used contributes to the startup time.
+_ENGINE_MODULES = {
+    "BursteinEngine": "py4swiss.engines.burstein",
+    "DubovEngine": "py4swiss.engines.dubov",
+    "DutchEngine": "py4swiss.engines.dutch",
+}
+
+
+def __getattr__(name: str) -> type[PairingEngine]:
+    """Import the engine with the given name on first access."""
+    if name not in _ENGINE_MODULES:
+        error_message = f"module '{__name__}' has no attribute '{name}'"
+        raise AttributeError(error_message)
+    engine: type[PairingEngine] = import_module(_ENGINE_MODULES[name]).Engine
+    return engine
+
+
+__all__ = ["BursteinEngine", "DubovEngine", "DutchEngine", "get_engine", "get_engine_names"]
@@ -17,6 +17,7 @@ class Bracket:
     def __init__(self, players: list[Player]) -> None:
         """Initialize a new bracket."""
         self.players: list[Player] = players
+        self.roles: dict[int, PlayerRole] = {}
         self._resident_score: int = 0
 
         self._update_resident_score(initial=True)
@@ -40,6 +41,8 @@ class Bracket:
 
     def _assign_roles(self) -> None:
         """Assign roles to the players for the current bracket."""
+        self.roles = {}
+
         if self.is_finished():
             return
 
@@ -48,11 +51,11 @@ class Bracket:
 
         for player in self.players:
             if player.points_with_acceleration >= self._resident_score:
-                player.role = PlayerRole.RESIDENT
+                self.roles[player.id] = PlayerRole.RESIDENT
             elif player.points_with_acceleration == lower_score:
-                player.role = PlayerRole.LOWER
+                self.roles[player.id] = PlayerRole.LOWER
             else:
-                player.role = PlayerRole.NONE
+                self.roles[player.id] = PlayerRole.NONE
 
     def is_finished(self) -> bool:
         """Check whether all brackets have been exhausted."""
@@ -1,25 +1,29 @@
 from py4swiss.dynamicuint import DynamicUint
-from py4swiss.engines.burstein.criteria.absolute import C1, C2, C3
+from py4swiss.engines.burstein.criteria.absolute import C2
 from py4swiss.engines.burstein.player import Player
 from py4swiss.engines.common import PairingError
+from py4swiss.engines.matching import Compatibility
 from py4swiss.matching_computer import ComputerDutchOptimality
+from py4swiss.profiling import count, record, solve
 
 
 class ByeMatcher:
     """A class used to determine which player should receive the pairings allocated bye."""
 
-    def __init__(self, players: list[Player], forbidden_pairs: set[tuple[int, int]]) -> None:
+    def __init__(self, players: list[Player], compatibility: Compatibility[Player]) -> None:
         """
         Set up a new matching computer.
 
         The included graph contains exactly one vertex for each player as well as one for the pairing-allocated bye and
-        edges with weights between them depending on whether they are allowed to be paired with each other or not.
+        edges with weights between them depending on whether they are allowed to be paired with each other or not
+        according to the given compatibility, which is shared with the matchers of the brackets.
         """
         self._players: list[Player] = players
-        self._forbidden_pairs: set[tuple[int, int]] = forbidden_pairs
+        self._compatibility: Compatibility[Player] = compatibility
 
         points_set = {player.points_with_acceleration for player in self._players}
-        games_set = {len(player.opponents) for player in self._players}
+        # The number of games is counted as the number of distinct opponents, i.e. rematches only count once.
+        games_set = {player.opponents.bit_count() for player in self._players}
         self._points_dict: dict[int, int] = {value: rank for rank, value in enumerate(sorted(points_set, reverse=True))}
         self._games_dict: dict[int, int] = {value: rank for rank, value in enumerate(sorted(games_set, reverse=True))}
         self._point_bits: int = len(points_set).bit_length()
@@ -30,6 +34,7 @@ class ByeMatcher:
 
         self._len: int = len(players)
         self._computer: ComputerDutchOptimality = ComputerDutchOptimality(self._len + 1, self._max_weight)
+        record(self._computer)
         self._index_dict_reverse: dict[int, Player] = dict(enumerate(self._players))
 
         self._set_up_computer()
@@ -37,7 +42,7 @@ class ByeMatcher:
     def _get_max_weight(self) -> DynamicUint:
         """Return an upper bound for weights."""
         points_list = sorted({player.points_with_acceleration for player in self._players}, reverse=True)
-        games_list = sorted({len(player.opponents) for player in self._players}, reverse=True)
+        games_list = sorted({player.opponents.bit_count() for player in self._players}, reverse=True)
 
         point_bits = len(points_list).bit_length()
         game_bits = len(games_list).bit_length()
@@ -77,16 +82,10 @@ class ByeMatcher:
         weight <<= self._point_bits
         weight |= self._points_dict[player.points_with_acceleration]
         weight <<= self._game_bits
-        weight |= self._games_dict[len(player.opponents)]
+        weight |= self._games_dict[player.opponents.bit_count()]
 
         return weight
 
-    def _is_allowed_pair(self, player_1: Player, player_2: Player) -> bool:
-        """Check whether the given players are allowed to be paired together."""
-        if bool({(player_1.id, player_2.id), (player_2.id, player_1.id)} & self._forbidden_pairs):
-            return False
-        return C1.evaluate(player_1, player_2) and C3.evaluate(player_1, player_2)
-
     def _set_up_computer(self) -> None:
         """
         Configure the matching computer by setting up vertices and edge weights.
@@ -99,19 +98,22 @@ class ByeMatcher:
         # Maximize the number of pairs.
         for i, player_1 in enumerate(self._players):
             for j, player_2 in enumerate(self._players[i + 1 :]):
-                if self._is_allowed_pair(player_1, player_2):
+                if self._compatibility.is_allowed_pair(player_1, player_2):
                     self._computer.set_edge_weight(i, i + j + 1, self._max_weight)
 
         for i in range(len(self._players)):
             self._computer.set_edge_weight(i, self._len, self._bye_weights[i])
 
+        count("edge_updates", (self._len + 1) * self._len // 2)
+
     def get_bye(self) -> Player:
         """
         Choose the player to receive the pairing allocated bye.
 
         However, if the round pairing can not be completed, return None.
         """
-        self._computer.compute_matching()
+        with solve(self._computer):
+            self._computer.compute_matching()
 
         # Check whether the round pairing can be completed.
         if not all(i != j for i, j in enumerate(self._computer.get_matching())):
@@ -125,13 +127,16 @@ class ByeMatcher:
                 continue
 
             self._computer.set_edge_weight(i, self._len, self._bye_weights[i] + DynamicUint(1))
-            self._computer.compute_matching()
+            count("edge_updates")
+            with solve(self._computer):
+                self._computer.compute_matching()
             matching = self._computer.get_matching()
 
             if matching[i] == self._len:
                 return self._index_dict_reverse[i]
 
             self._computer.set_edge_weight(i, self._len, self._bye_weights[i])
+            count("edge_updates")
 
         error_message = "Unreachable code reached"  # pragma: no cover
         raise AssertionError(error_message)  # pragma: no cover
@@ -1,6 +1,7 @@
 from py4swiss.engines.burstein.player import Player
 from py4swiss.engines.common import ColorPreferenceStrength
-from py4swiss.engines.matching import AbsoluteCriterion
+from py4swiss.engines.common.color_preference import get_strength_code
+from py4swiss.engines.matching import AbsoluteCriterion, absolute_color_masks
 
 
 class C3(AbsoluteCriterion[Player]):
@@ -15,7 +16,12 @@ class C3(AbsoluteCriterion[Player]):
     @classmethod
     def evaluate(cls, player_1: Player, player_2: Player) -> bool:
         """Check whether the given players have the same absolute color preference."""
-        same_preference = player_1.color_preference.side == player_2.color_preference.side
-        absolute_1 = player_1.color_preference.strength == ColorPreferenceStrength.ABSOLUTE
-        absolute_2 = player_2.color_preference.strength == ColorPreferenceStrength.ABSOLUTE
-        return not same_preference or not absolute_1 or not absolute_2
+        # Two color preferences are the same, if and only if their codes are.
+        code_1, code_2 = player_1.color_preference.code, player_2.color_preference.code
+        same_absolute = code_1 == code_2 and get_strength_code(code_1) == ColorPreferenceStrength.ABSOLUTE
+        return not same_absolute
+
+    @classmethod
+    def get_masks(cls, players: list[Player]) -> list[int]:
+        """Return a bitmask for each of the given players containing the players it may meet according to C.3."""
+        return absolute_color_masks(players)
@@ -1,6 +1,6 @@
 from py4swiss.engines.burstein.player import Player
 from py4swiss.engines.burstein.state import State
-from py4swiss.engines.common import ColorPreferenceSide
+from py4swiss.engines.common import ColorPreferenceSide, get_last_different_colors
 from py4swiss.engines.matching import ColorCriterion
 
 
@@ -20,10 +20,9 @@ class E4(ColorCriterion[Player, State]):
         For this purpose any unplayed rounds are ignored for both players. If this never occurs the criterion is not
         conclusive.
         """
-        for color_1, color_2 in zip(player_1.colors[::-1], player_2.colors[::-1], strict=False):
-            if color_1 != color_2:
-                if color_1:
-                    return ColorPreferenceSide.BLACK
-                return ColorPreferenceSide.WHITE
-
-        return ColorPreferenceSide.NONE
+        color_1 = get_last_different_colors(player_1, player_2)
+        if color_1 is None:
+            return ColorPreferenceSide.NONE
+        if color_1:
+            return ColorPreferenceSide.BLACK
+        return ColorPreferenceSide.WHITE
@@ -25,7 +25,7 @@ class C5(QualityCriterion[Player, State]):
         weight = DynamicUint(zero)
 
         # Only pairings between residents count as pairs.
-        if player_1.role != PlayerRole.RESIDENT or player_2.role != PlayerRole.RESIDENT:
+        if state.get_role(player_1) != PlayerRole.RESIDENT or state.get_role(player_2) != PlayerRole.RESIDENT:
             return weight
 
         weight |= 1
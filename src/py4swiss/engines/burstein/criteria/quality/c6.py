@@ -33,13 +33,13 @@ class C6(QualityCriterion[Player, State]):
         weight = DynamicUint(zero)
 
         # Only pairings of residents are considered.
-        if player_1.role != PlayerRole.RESIDENT or player_2.role != PlayerRole.RESIDENT:
+        if state.get_role(player_1) != PlayerRole.RESIDENT or state.get_role(player_2) != PlayerRole.RESIDENT:
             return weight
 
         # The weight contains all 0s except for two 1s accounting for the scores of the player involved in thus pair.
         # Thus, in sum this choice of weights will maximize the score of players paired in the current bracket which
         # means the scores of outgoing floaters are minimized.
-        weight += (zero | 1) << state.resident_score_bit_dict[player_1.points_with_acceleration]
-        weight += (zero | 1) << state.resident_score_bit_dict[player_2.points_with_acceleration]
+        weight.add_at(1, state.resident_score_bit_dict[player_1.points_with_acceleration])
+        weight.add_at(1, state.resident_score_bit_dict[player_2.points_with_acceleration])
 
         return weight
@@ -25,19 +25,19 @@ class C7(QualityCriterion[Player, State]):
         weight = DynamicUint(zero)
 
         # Only pairings of a residents of the current or lower bracket are considered.
-        if PlayerRole.NONE in (player_1.role, player_2.role):
+        if PlayerRole.NONE in (state.get_role(player_1), state.get_role(player_2)):
             return weight
 
         # See C.5 for comparison.
         # This choice maxmimizes the number of pairs in the lower bracket in sum.
-        weight |= int(player_1.role >= PlayerRole.LOWER and player_2.role == PlayerRole.LOWER)
-        weight <<= state.resident_score_total_bits
+        lower_pair = state.get_role(player_1) >= PlayerRole.LOWER and state.get_role(player_2) == PlayerRole.LOWER
+        weight.add_at(int(lower_pair), state.resident_score_total_bits)
 
         # See C.6 for comparison.
         # The weight contains all 0s except for a single 1 accounting for the score of the resident involved in thus
         # pair. Thus, in sum this choice of weights will maximize the score of outgoing floaters paired in the lower
         # bracket which means the scores of outgoing floaters in the lower bracket is minimized.
-        if player_1.role == PlayerRole.RESIDENT:
-            weight += (zero | 1) << state.resident_score_bit_dict[player_1.points_with_acceleration]
+        if state.get_role(player_1) == PlayerRole.RESIDENT:
+            weight.add_at(1, state.resident_score_bit_dict[player_1.points_with_acceleration])
 
         return weight
@@ -1,10 +1,19 @@
+from typing import ClassVar
+
 from py4swiss.engines.burstein.bracket import Bracket
 from py4swiss.engines.burstein.bye_matcher import ByeMatcher
+from py4swiss.engines.burstein.criteria import ABSOLUTE_CRITERIA
 from py4swiss.engines.burstein.pairer import Pairer
-from py4swiss.engines.burstein.player import Player, get_player_infos_from_trf
+from py4swiss.engines.burstein.player import (
+    Player,
+    PlayerRole,
+    get_player_infos_from_trf,
+)
 from py4swiss.engines.burstein.state import State
-from py4swiss.engines.common import Pairing, PairingEngine
+from py4swiss.engines.common import Pairing, PairingEngine, PairingError
 from py4swiss.engines.dutch import Engine as DutchEngine
+from py4swiss.engines.matching import Compatibility, Matcher
+from py4swiss.profiling import count, phase, sample
 from py4swiss.trf import ParsedTrf
 
 
@@ -15,6 +24,10 @@ class Engine(PairingEngine):
     See "C.04.4.2 Burstein System (effective from 1 February 2026)".
     """
 
+    # Whether the matcher of a bracket is reused for the next bracket of the same round instead of setting up a new one
+    # for all remaining players. Both options yield identical round pairings.
+    REUSE_MATCHER: ClassVar[bool] = True
+
     @staticmethod
     def _get_player_pair_score(player_pair: tuple[Player, Player]) -> tuple[int, int, int]:
         """Return a score for a pair of players for purpose of sorting the round pairing."""
@@ -52,8 +65,11 @@ class Engine(PairingEngine):
     @staticmethod
     def _get_bracket_pairs(pairer: Pairer) -> list[tuple[Player, Player]]:
         """Return the chosen players to be paired in the bracket."""
-        pairer.determine_pairings()
-        return pairer.get_player_pairs()
+        with phase("bracket_solve"):
+            pairer.determine_pairings()
+
+        with phase("color_allocation"):
+            return pairer.get_player_pairs()
 
     @classmethod
     def generate_pairings(cls, trf: ParsedTrf) -> list[Pairing]:
@@ -64,6 +80,10 @@ class Engine(PairingEngine):
         # 1.6.2 The number of seeding rounds is equal to half the number of rounds in the tournament (rounded down) or
         #       4 (four), whichever is lower.
 
+        if trf.has_pending_results():
+            error_message = "Round can not be paired while results of previous rounds are pending"
+            raise PairingError(error_message)
+
         round_number = min(len(section.results) for section in trf.player_sections) + 1
         if round_number <= min(trf.x_section.number_of_rounds // 2, 4):
             return DutchEngine.generate_pairings(trf)
@@ -71,26 +91,39 @@ class Engine(PairingEngine):
         initial_color = trf.x_section.configuration.first_round_color
         forbidden_pairs = trf.x_section.forbidden_pairs
 
-        players = get_player_infos_from_trf(trf)
-        players.sort(reverse=True)
+        with phase("player_build"):
+            players = get_player_infos_from_trf(trf)
+            players.sort(reverse=True)
+
+        with phase("compatibility_setup"):
+            compatibility = Compatibility(players, (ABSOLUTE_CRITERIA[0], ABSOLUTE_CRITERIA[2]), forbidden_pairs)
         player_pairs = []
 
         if len(players) % 2 == 1:
             # Determine the player to receive the pairing allocated bye.
-            bye_matcher = ByeMatcher(players, forbidden_pairs)
-            bye = bye_matcher.get_bye()
+            with phase("bye_selection"):
+                bye_matcher = ByeMatcher(players, compatibility)
+                bye = bye_matcher.get_bye()
 
             player_pairs.append((bye, bye))
             players.remove(bye)
 
         bracket = Bracket(players)
+        matcher: Matcher[Player, State] | None = None
 
         # Determine the bracket pairings and save the results until there are none left.
         while not bracket.is_finished():
-            state = State.from_data(bracket.players, forbidden_pairs, initial_color)
-            pairer = Pairer(bracket.players, state)
+            count("brackets")
+            sample("bracket_sizes", sum(role == PlayerRole.RESIDENT for role in bracket.roles.values()))
+
+            with phase("bracket_setup"):
+                state = State.from_data(players, bracket.roles, forbidden_pairs, initial_color)
+                pairer = Pairer(bracket.players, state, compatibility, matcher)
             bracket_pairings = cls._get_bracket_pairs(pairer)
 
+            if cls.REUSE_MATCHER:
+                matcher = pairer.matcher
+
             bracket.apply_pairings(bracket_pairings)
             player_pairs.extend(bracket_pairings)
 
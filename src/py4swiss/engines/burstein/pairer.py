@@ -1,11 +1,10 @@
 from py4swiss.engines.burstein.criteria import (
-    ABSOLUTE_CRITERIA,
     COLOR_CRITERIA,
     QUALITY_CRITERIA,
 )
 from py4swiss.engines.burstein.player import Player, PlayerRole
 from py4swiss.engines.burstein.state import State
-from py4swiss.engines.matching import Matcher
+from py4swiss.engines.matching import Compatibility, Matcher
 
 
 class Pairer:
@@ -17,21 +16,51 @@ class Pairer:
         - Retrieve the chosen pairings after determining colors
     """
 
-    def __init__(self, players: list[Player], state: State) -> None:
-        """Initialize a new matcher along with the heterogeneous and homogeneous brackets."""
+    def __init__(
+        self,
+        players: list[Player],
+        state: State,
+        compatibility: Compatibility[Player],
+        matcher: Matcher[Player, State] | None = None,
+    ) -> None:
+        """
+        Initialize a new matcher along with the heterogeneous and homogeneous brackets.
+
+        The compatibility of the players of the round is shared between all brackets. Optionally, the matcher of the
+        previous bracket of the same round can be given, in which case it is reset for the given players and state
+        instead of setting up a new one.
+        """
         self._players: list[Player] = players
         self._state: State = state
 
-        self._matcher: Matcher[Player] = Matcher(
-            self._players,
-            self._state,
-            (ABSOLUTE_CRITERIA[0], ABSOLUTE_CRITERIA[2]),
-            QUALITY_CRITERIA,
-            COLOR_CRITERIA,
-            self._state.bracket_bits,
-        )
-
-        self._resident_list = [player for player in self._players if player.role == PlayerRole.RESIDENT]
+        if matcher is None:
+            self._matcher: Matcher[Player, State] = Matcher(
+                self._players,
+                self._state,
+                compatibility,
+                QUALITY_CRITERIA,
+                COLOR_CRITERIA,
+                self._state.bracket_bits,
+            )
+        else:
+            # All quality criteria weights of pairs of players outside of the current and the next scoregroup are zero.
+            inactive_players = {player for player in self._players if self._state.get_role(player) == PlayerRole.NONE}
+            # Since the weight layout is the same for all brackets of the round, only the edges of players whose role
+            # changed need to be re-weighted.
+            changed_players = {
+                player for player in self._players if matcher.state.get_role(player) != self._state.get_role(player)
+            }
+            self._matcher = matcher
+            self._matcher.reset(self._players, self._state, self._state.bracket_bits, inactive_players, changed_players)
+
+        self._resident_list = [
+            player for player in self._players if self._state.get_role(player) == PlayerRole.RESIDENT
+        ]
+
+    @property
+    def matcher(self) -> Matcher[Player, State]:
+        """Return the matcher of the bracket."""
+        return self._matcher
 
     def determine_pairings(self) -> None:
         """Determine the first best round pairing."""
@@ -88,7 +117,7 @@ class Pairer:
 
         for player_1, player_2 in self._matcher.matching.items():
             # Ignore pairings with players from lower brackets.
-            if not all(player.role == PlayerRole.RESIDENT for player in (player_1, player_2)):
+            if not all(self._state.get_role(player) == PlayerRole.RESIDENT for player in (player_1, player_2)):
                 continue
             # Avoid counting each pair twice.
             if player_1 > player_2:
@@ -10,15 +10,20 @@ class State(BaseModel):
     Represents the state of a pairing bracket.
 
     Attributes:
+        roles (dict[int, PlayerRole]): The role of each player in the bracket by their ID
         forbidden_pairs (set[tuple[int, int]]): The pairs of players that are not allowed to be paired with each other
         initial_color (bool): Whether the initial color for the first seed is white
-        bracket_bits (int): The number of bits to represent all residents
-        lower_bits (int): The number of bits to represent all residents in the lower bracket
+        bracket_bits (int): The number of bits to represent all players of the round
+        lower_bits (int): The number of bits to represent all players of the round, which bounds the lower bracket
         resident_score_total_bits (int): The number of bits to represent all scores of residents
         resident_score_bit_dict (dict[int, int]): The number of bits for each score of residents
 
+    All numbers of bits refer to the players of the whole round rather than to the ones of the bracket. Thus, the weight
+    layout is the same for all brackets of a round, which allows the matcher to be kept for the whole round.
+
     """
 
+    roles: dict[int, PlayerRole]
     forbidden_pairs: set[tuple[int, int]]
     initial_color: bool
     bracket_bits: int
@@ -50,16 +55,30 @@ class State(BaseModel):
         return running_total, cumulative_bits
 
     @classmethod
-    def from_data(cls, players: list[Player], forbidden_pairs: set[tuple[int, int]], initial_color: bool) -> Self:
-        """Return a bracket given the minimal necessary information."""
-        resident_list = [player for player in players if player.role == PlayerRole.RESIDENT]
-        lower_list = [player for player in players if player.role == PlayerRole.LOWER]
-        resident_score_total_bits, resident_score_bit_dict = cls._get_score_bits(resident_list)
+    def from_data(
+        cls,
+        players: list[Player],
+        roles: dict[int, PlayerRole],
+        forbidden_pairs: set[tuple[int, int]],
+        initial_color: bool,
+    ) -> Self:
+        """
+        Return a bracket given the minimal necessary information.
+
+        The given players are all players to be paired in the round, while the given roles only contain the players of
+        the bracket.
+        """
+        resident_score_total_bits, resident_score_bit_dict = cls._get_score_bits(players)
         return cls(
+            roles=roles,
             forbidden_pairs=forbidden_pairs,
             initial_color=initial_color,
-            bracket_bits=len(resident_list).bit_length(),
-            lower_bits=len(lower_list).bit_length(),
+            bracket_bits=len(players).bit_length(),
+            lower_bits=len(players).bit_length(),
             resident_score_total_bits=resident_score_total_bits,
             resident_score_bit_dict=resident_score_bit_dict,
         )
+
+    def get_role(self, player: Player) -> PlayerRole:
+        """Return the role of the given player in the bracket."""
+        return self.roles[player.id]
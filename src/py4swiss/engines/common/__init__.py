@@ -5,15 +5,37 @@ from py4swiss.engines.common.color_preference import (
 )
 from py4swiss.engines.common.exceptions import PairingError
 from py4swiss.engines.common.float import Float
+from py4swiss.engines.common.history import (
+    History,
+    PlayerHistory,
+    color_difference,
+    get_histories,
+    get_last_different_colors,
+    get_opponents,
+    had_white_last,
+    has_played,
+    last_two_same_color,
+)
 from py4swiss.engines.common.pairing import Pairing
 from py4swiss.engines.common.pairing_engine import PairingEngine
+from py4swiss.engines.common.pairing_format import PairingFormat
 
 __all__ = [
     "ColorPreference",
     "ColorPreferenceSide",
     "ColorPreferenceStrength",
     "Float",
+    "History",
     "Pairing",
     "PairingEngine",
     "PairingError",
+    "PairingFormat",
+    "PlayerHistory",
+    "color_difference",
+    "get_histories",
+    "get_last_different_colors",
+    "get_opponents",
+    "had_white_last",
+    "has_played",
+    "last_two_same_color",
 ]
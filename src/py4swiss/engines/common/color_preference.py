@@ -1,8 +1,15 @@
 from __future__ import annotations
 
 from enum import Enum
+from functools import cached_property
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+# The number of lowest bits of a color preference code containing the strength, all higher bits contain the side. Since
+# the side is signed, it is given by 'code >> STRENGTH_BITS' while the strength is given by 'code & STRENGTH_MASK' (see
+# 'get_side_code' and 'get_strength_code').
+STRENGTH_BITS = 2
+STRENGTH_MASK = (1 << STRENGTH_BITS) - 1
 
 
 class ColorPreferenceSide(int, Enum):
@@ -31,7 +38,71 @@ class ColorPreferenceStrength(int, Enum):
 
 
 class ColorPreference(BaseModel):
-    """Color preference of a player."""
+    """
+    Color preference of a player.
+
+    Color preferences are immutable and there is one shared instance for each combination of side and strength (see
+    'get'), such that determining the color preferences of all players does not create any new objects. Furthermore,
+    each color preference is identified by a small integer code, which allows the criteria to compare color preferences
+    by integer operations only.
+
+    Attributes:
+        side (ColorPreferenceSide): The side of the color preference
+        strength (ColorPreferenceStrength): The strength of the color preference
+
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     side: ColorPreferenceSide
     strength: ColorPreferenceStrength
+
+    @cached_property
+    def code(self) -> int:
+        """Return the code of the color preference."""
+        return get_color_preference_code(self.side, self.strength)
+
+    @classmethod
+    def get(cls, side: ColorPreferenceSide, strength: ColorPreferenceStrength) -> ColorPreference:
+        """Return the shared instance of the color preference with the given side and strength."""
+        return _COLOR_PREFERENCES[get_color_preference_code(side, strength)]
+
+    @classmethod
+    def from_code(cls, code: int) -> ColorPreference:
+        """Return the shared instance of the color preference with the given code."""
+        return _COLOR_PREFERENCES[code]
+
+    def conflicts(self, other: ColorPreference) -> bool:
+        """Check whether the sides of the given color preferences conflict with each other (see 'codes_conflict')."""
+        return codes_conflict(self.code, other.code)
+
+
+def get_color_preference_code(side: ColorPreferenceSide, strength: ColorPreferenceStrength) -> int:
+    """Return the code of the color preference with the given side and strength."""
+    return side << STRENGTH_BITS | strength
+
+
+def get_side_code(code: int) -> int:
+    """Return the side of the color preference with the given code as an integer."""
+    return code >> STRENGTH_BITS
+
+
+def get_strength_code(code: int) -> int:
+    """Return the strength of the color preference with the given code as an integer."""
+    return code & STRENGTH_MASK
+
+
+def codes_conflict(code_1: int, code_2: int) -> bool:
+    """
+    Check whether the color preferences with the given codes conflict with each other.
+
+    This is the case, if and only if both have the same side other than none (see 'ColorPreferenceSide.conflicts').
+    """
+    return get_side_code(code_1) == get_side_code(code_2) != 0
+
+
+_COLOR_PREFERENCES = {
+    get_color_preference_code(side, strength): ColorPreference(side=side, strength=strength)
+    for side in ColorPreferenceSide
+    for strength in ColorPreferenceStrength
+}
@@ -0,0 +1,52 @@
+import hashlib
+import json
+from importlib.metadata import PackageNotFoundError, version
+
+from py4swiss.trf import ParsedTrf
+
+try:
+    _VERSION = version("py4swiss")
+except PackageNotFoundError:  # pragma: no cover
+    _VERSION = "unknown"
+
+
+def get_fingerprint(trf: ParsedTrf, engine: str, *, ratings: bool = False) -> str:
+    """
+    Return a fingerprint of all information of the given TRF relevant for pairing the next round with the given engine.
+
+    The fingerprint covers the results, colors and points of all players in the order of the TRF as well as the
+    accelerations, zeroed IDs, forbidden pairs, scoring point system and configuration. Names, ratings, dates and all
+    other information that does not affect the round pairing is ignored. Ratings are only included if requested, i.e.
+    for engines that make use of them. Two TRFs with identical fingerprints are thus guaranteed to produce identical
+    round pairings with the given engine and version of py4swiss.
+    """
+    x_section = trf.x_section
+
+    # Players are kept in the order of the TRF, since pairing by rank depends on it.
+    players = [
+        [
+            player_section.starting_number,
+            player_section.points_times_ten,
+            [[result.id, result.color.value, result.result.value] for result in player_section.results],
+            player_section.fide_rating if ratings else None,
+        ]
+        for player_section in trf.player_sections
+    ]
+    scoring_points = sorted(
+        [result.value, color.value, points_times_ten]
+        for (result, color), points_times_ten in x_section.scoring_point_system.score_dict.items()
+    )
+
+    state = [
+        engine,
+        _VERSION,
+        players,
+        x_section.number_of_rounds,
+        sorted(x_section.zeroed_ids),
+        scoring_points,
+        [x_section.configuration.first_round_color, x_section.configuration.by_rank],
+        sorted([player_id, accelerations] for player_id, accelerations in x_section.accelerations.items()),
+        sorted(x_section.forbidden_pairs),
+    ]
+
+    return hashlib.sha256(json.dumps(state, separators=(",", ":")).encode("utf-8")).hexdigest()
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Protocol
+
+import numpy as np
+from pydantic import BaseModel
+
+from py4swiss.trf.results import ColorToken
+from py4swiss.trf.results.result_matrix import COLOR_CODES
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from py4swiss.trf.results import ResultMatrix
+
+
+class PlayerHistory(Protocol):
+    """
+    Protocol representing the played games of a player packed into integers.
+
+    Attributes:
+        opponents (int): A bitset over starting numbers, the i-th bit of which is set if the player played the player
+            with starting number i
+        colors (int): A bitset over the played games of the player in order, the i-th bit of which is set if the player
+            had the white pieces in their i-th played game
+        games (int): The number of played games of the player
+
+    """
+
+    opponents: int
+    colors: int
+    games: int
+
+
+class History(BaseModel):
+    """
+    The played games of a player packed into integers (see PlayerHistory).
+
+    Attributes:
+        opponents (int): A bitset over starting numbers, the i-th bit of which is set if the player played the player
+            with starting number i
+        colors (int): A bitset over the played games of the player in order, the i-th bit of which is set if the player
+            had the white pieces in their i-th played game
+        games (int): The number of played games of the player
+
+    """
+
+    opponents: int
+    colors: int
+    games: int
+
+
+def get_histories(result_matrix: ResultMatrix) -> list[History]:
+    """Return the packed opponents, the packed colors and the number of played games of all players."""
+    number_of_players, number_of_rounds = result_matrix.results.shape
+    rows, rounds = np.nonzero(result_matrix.played)
+    opponents = result_matrix.opponents[rows, rounds]
+    games = np.count_nonzero(result_matrix.played, axis=1)
+
+    # The position of each played game among the played games of the respective player.
+    positions = np.cumsum(result_matrix.played, axis=1)[rows, rounds] - 1
+    whites = result_matrix.colors[rows, rounds] == COLOR_CODES[ColorToken.WHITE]
+
+    opponent_bytes = (int(opponents.max(initial=0)) + 8) // 8
+    opponent_buffer = np.zeros((number_of_players, opponent_bytes), dtype=np.uint8)
+    np.bitwise_or.at(opponent_buffer, (rows, opponents // 8), np.left_shift(1, opponents % 8).astype(np.uint8))
+
+    color_bits = np.zeros((number_of_players, max(number_of_rounds, 1)), dtype=np.bool_)
+    color_bits[rows[whites], positions[whites]] = True
+    color_buffer = np.packbits(color_bits, axis=1, bitorder="little")
+
+    return [
+        History(
+            opponents=int.from_bytes(opponent_row.tobytes(), "little"),
+            colors=int.from_bytes(color_row.tobytes(), "little"),
+            games=games_count,
+        )
+        for opponent_row, color_row, games_count in zip(opponent_buffer, color_buffer, games.tolist(), strict=True)
+    ]
+
+
+def has_played(player: PlayerHistory, player_id: int) -> bool:
+    """Check whether the given player played a game against the player with the given ID."""
+    return bool(player.opponents >> player_id & 1)
+
+
+def get_opponents(player: PlayerHistory) -> Iterator[int]:
+    """Return the IDs of the players against which the given player played a game in ascending order."""
+    opponents = player.opponents
+    while opponents:
+        lowest = opponents & -opponents
+        yield lowest.bit_length() - 1
+        opponents ^= lowest
+
+
+def color_difference(player: PlayerHistory) -> int:
+    """Return the number of played white games of the given player minus the number of played black games."""
+    return 2 * player.colors.bit_count() - player.games
+
+
+def had_white_last(player: PlayerHistory) -> bool:
+    """Check whether the given player had the white pieces in their latest played game."""
+    return player.games > 0 and bool(player.colors >> (player.games - 1) & 1)
+
+
+def last_two_same_color(player: PlayerHistory) -> bool:
+    """Check whether the given player had the same color in their two latest played games."""
+    return player.games > 1 and (player.colors >> (player.games - 2)) in (0b00, 0b11)
+
+
+def get_last_different_colors(player_1: PlayerHistory, player_2: PlayerHistory) -> bool | None:
+    """
+    Return whether the first player had white in the most recent game in which the given players had different colors.
+
+    The played games of both players are aligned by their respective latest one, i.e. unplayed rounds are ignored. If
+    the players never had different colors, None is returned.
+    """
+    games = min(player_1.games, player_2.games)
+    colors_1 = player_1.colors >> (player_1.games - games)
+    colors_2 = player_2.colors >> (player_2.games - games)
+
+    different = colors_1 ^ colors_2
+    if not different:
+        return None
+    return bool(colors_1 >> (different.bit_length() - 1) & 1)
@@ -1,8 +1,17 @@
+import csv
+import json
 from pathlib import Path
 from typing import Self
 
+import numpy as np
+import numpy.typing as npt
 from pydantic import BaseModel
 
+from py4swiss.engines.common.pairing_format import PairingFormat
+
+# The header of a CSV file containing a round pairing.
+CSV_HEADER = ("white", "black")
+
 
 class Pairing(BaseModel):
     """
@@ -27,25 +36,60 @@ class Pairing(BaseModel):
         """Return the hash of the player IDs."""
         return hash((self.white, self.black))
 
+    @staticmethod
+    def to_array(pairings: list["Pairing"]) -> npt.NDArray[np.int32]:
+        """Return the given pairings as an array with one row of the IDs of white and black per pairing."""
+        return np.array([(pairing.white, pairing.black) for pairing in pairings], dtype=np.int32).reshape(-1, 2)
+
     @classmethod
-    def from_file(cls, file_path: Path) -> list[Self]:
-        """Convert the contents of the given file to a list of pairings."""
-        with file_path.open("r", encoding="utf-8") as fh:
-            lines = [line.rstrip() for line in fh]
-        pair_list = [[int(item) for item in line.split(" ")] for line in lines[1:]]
+    def from_array(cls, array: npt.NDArray[np.integer]) -> list[Self]:
+        """Convert the given array with one row of the IDs of white and black per pairing to a list of pairings."""
+        # Pairs need to consist of exactly two items.
+        if array.ndim != 1 + 1 or array.shape[1] != 1 + 1:
+            error_message = "Invalid pair"
+            raise ValueError(error_message)
 
-        # Pairs need to consist of exactly two items separated by whitespace.
+        # A pair must consist of two distinct IDs.
+        if (array[:, 0] == array[:, 1]).any():
+            error_message = "Invalid pair"
+            raise ValueError(error_message)
+
+        return [cls(white=white, black=black) for white, black in array.tolist()]
+
+    @staticmethod
+    def _read_array(file_path: Path, pairing_format: PairingFormat) -> npt.NDArray[np.int64]:
+        """Return the pairings in the given file as an array with one row of the IDs of white and black per pairing."""
+        if pairing_format == PairingFormat.NPY:
+            array: npt.NDArray[np.int64] = np.load(file_path, allow_pickle=False).astype(np.int64)
+            return array
+
+        with file_path.open("r", encoding="utf-8", newline="") as fh:
+            match pairing_format:
+                case PairingFormat.JSON:
+                    pair_list = [[item["white"], item["black"]] for item in json.load(fh)]
+                case PairingFormat.CSV:
+                    pair_list = [[int(item) for item in row] for row in csv.reader(fh) if tuple(row) != CSV_HEADER]
+                case PairingFormat.TEXT:
+                    lines = [line.rstrip() for line in fh]
+                    pair_list = [[int(item) for item in line.split(" ")] for line in lines[1:]]
+
+        # Pairs need to consist of exactly two items.
         if not all(len(pair) == 1 + 1 for pair in pair_list):
             error_message = "Invalid pair"
             raise ValueError(error_message)
 
-        # A pair must consist of two distinct IDs.
-        for pair in pair_list:
-            if pair[0] == pair[1]:
-                error_message = "Invalid pair"
-                raise ValueError(error_message)
+        return np.array(pair_list, dtype=np.int64).reshape(-1, 2)
+
+    @classmethod
+    def from_file(cls, file_path: Path, pairing_format: PairingFormat | None = None) -> list[Self]:
+        """
+        Convert the contents of the given file to a list of pairings.
 
-        return [cls(white=pair[0], black=pair[1]) for pair in pair_list]
+        If no format is given, it is determined by the suffix of the file (see 'PairingFormat.from_path').
+        """
+        if pairing_format is None:
+            pairing_format = PairingFormat.from_path(file_path)
+        return cls.from_array(cls._read_array(file_path, pairing_format))
 
     def to_string(self) -> str:
         """Return a string of the player IDs separated by whitespace."""
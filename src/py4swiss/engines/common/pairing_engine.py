@@ -1,24 +1,114 @@
+import csv
 from abc import ABC, abstractmethod
 from pathlib import Path
 
-from py4swiss.engines.common.pairing import Pairing
+import numpy as np
+from pydantic import TypeAdapter
+
+from py4swiss.engines.common.fingerprint import get_fingerprint
+from py4swiss.engines.common.pairing import CSV_HEADER, Pairing
+from py4swiss.engines.common.pairing_format import PairingFormat
 from py4swiss.trf import ParsedTrf
+from py4swiss.trf.results import ColorToken, ResultToken, RoundResult
+
+# The adapter for serializing a round pairing to JSON.
+PAIRINGS_ADAPTER = TypeAdapter(list[Pairing])
 
 
 class PairingEngine(ABC):
     """Abstract base class for pairing engines."""
 
     @staticmethod
-    def write_pairings_to_file(pairings: list[Pairing], file_path: Path) -> None:
-        """Write the round pairing of the next round for the given TRF to a given file."""
+    def write_pairings_to_file(
+        pairings: list[Pairing], file_path: Path, pairing_format: PairingFormat | None = None
+    ) -> None:
+        """
+        Write the round pairing of the next round for the given TRF to a given file.
+
+        If no format is given, it is determined by the suffix of the file (see 'PairingFormat.from_path'). The text
+        format consists of the number of pairings followed by the IDs of white and black separated by whitespace for
+        each pairing, while the NumPy format contains an array of 32 bit integers with one row per pairing.
+        """
+        if pairing_format is None:
+            pairing_format = PairingFormat.from_path(file_path)
+
         file_path.parent.mkdir(exist_ok=True)
 
-        lines = [pairing.to_string() for pairing in pairings]
+        if pairing_format == PairingFormat.NPY:
+            with file_path.open("wb") as fh:
+                np.save(fh, Pairing.to_array(pairings), allow_pickle=False)
+            return
+
+        with file_path.open("w", encoding="utf-8", newline="") as fh:
+            match pairing_format:
+                case PairingFormat.JSON:
+                    fh.write(PAIRINGS_ADAPTER.dump_json(pairings).decode("utf-8"))
+                    fh.write("\n")
+                case PairingFormat.CSV:
+                    writer = csv.writer(fh, lineterminator="\n")
+                    writer.writerow(CSV_HEADER)
+                    writer.writerows((pairing.white, pairing.black) for pairing in pairings)
+                case PairingFormat.TEXT:
+                    lines = [pairing.to_string() for pairing in pairings]
+                    fh.write(f"{len(lines)}\n")
+                    fh.write("\n".join(lines))
+                    fh.write("\n")
+
+    @staticmethod
+    def write_pairings_to_trf(pairings: list[Pairing], trf: ParsedTrf) -> None:
+        """
+        Add the round pairing of the next round for the given TRF to it as a new round.
+
+        Paired players get their opponent and their color with a pending result, which is to be replaced once the game
+        is finished. The player receiving the pairing-allocated bye gets it right away. Players who already have a
+        result for the round, e.g. a requested bye, keep it, while all other players get a zero-point-bye.
+        """
+        round_number = min((len(section.results) for section in trf.player_sections), default=0) + 1
+        player_sections = {section.starting_number: section for section in trf.player_sections}
+        round_results: dict[int, RoundResult] = {}
+
+        for pairing in pairings:
+            for player in (pairing.white, pairing.black):
+                if player and player not in player_sections:
+                    error_message = f"Starting number '{player}' is missing"
+                    raise ValueError(error_message)
+                if player and len(player_sections[player].results) >= round_number:
+                    error_message = f"Starting number '{player}' already has a result for round {round_number}"
+                    raise ValueError(error_message)
+                if player and player in round_results:
+                    error_message = f"Starting number '{player}' is part of multiple pairings"
+                    raise ValueError(error_message)
+
+            if not bool(pairing.white) or not bool(pairing.black):
+                round_results[pairing.white or pairing.black] = RoundResult(
+                    id=0, color=ColorToken.BYE_OR_NOT_PAIRED, result=ResultToken.PAIRING_ALLOCATED_BYE
+                )
+            else:
+                round_results[pairing.white] = RoundResult(
+                    id=pairing.black, color=ColorToken.WHITE, result=ResultToken.PENDING
+                )
+                round_results[pairing.black] = RoundResult(
+                    id=pairing.white, color=ColorToken.BLACK, result=ResultToken.PENDING
+                )
+
+        scoring_point_system = trf.x_section.scoring_point_system
+        for section in trf.player_sections:
+            if len(section.results) >= round_number:
+                continue
+            round_result = round_results.get(section.starting_number) or RoundResult(
+                id=0, color=ColorToken.BYE_OR_NOT_PAIRED, result=ResultToken.ZERO_POINT_BYE
+            )
+            section.results.append(round_result)
+            section.points_times_ten += scoring_point_system.get_points_times_ten(round_result)
+
+    @classmethod
+    def get_fingerprint(cls, trf: ParsedTrf) -> str:
+        """
+        Return a fingerprint of all information of the given TRF relevant for the round pairing of this engine.
 
-        with file_path.open("w", encoding="utf-8") as fh:
-            fh.write(f"{len(lines)}\n")
-            fh.write("\n".join(lines))
-            fh.write("\n")
+        Engines that make use of further information, e.g. ratings, need to include it by overriding this method.
+        """
+        return get_fingerprint(trf, f"{cls.__module__}.{cls.__qualname__}")
 
     @classmethod
     @abstractmethod
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from enum import Enum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class PairingFormat(str, Enum):
+    """Format of a file containing a round pairing."""
+
+    TEXT = "txt"
+    JSON = "json"
+    CSV = "csv"
+    NPY = "npy"
+
+    @classmethod
+    def from_path(cls, file_path: Path) -> PairingFormat:
+        """Return the format indicated by the suffix of the given file path (text for unknown suffixes)."""
+        try:
+            return cls(file_path.suffix.lstrip(".").lower())
+        except ValueError:
+            return cls.TEXT
@@ -15,11 +15,14 @@ class Bracket:
     def __init__(self, players: list[Player]) -> None:
         """Initialize a new bracket."""
         self.players: list[Player] = players
+        self.roles: dict[int, PlayerRole] = {}
 
         self._assign_roles()
 
     def _assign_roles(self) -> None:
         """Assign roles to the players for the current bracket."""
+        self.roles = {}
+
         if self.is_finished():
             return
 
@@ -27,9 +30,9 @@ class Bracket:
 
         for player in self.players:
             if player.points_with_acceleration == max_points:
-                player.role = PlayerRole.RESIDENT
+                self.roles[player.id] = PlayerRole.RESIDENT
             else:
-                player.role = PlayerRole.LOWER
+                self.roles[player.id] = PlayerRole.LOWER
 
     def is_finished(self) -> bool:
         """Check whether all brackets have been exhausted."""
@@ -1,5 +1,6 @@
+from py4swiss.engines.common import has_played
 from py4swiss.engines.dubov.player import Player
-from py4swiss.engines.matching import AbsoluteCriterion
+from py4swiss.engines.matching import AbsoluteCriterion, opponent_masks
 
 
 class C1(AbsoluteCriterion[Player]):
@@ -13,4 +14,9 @@ class C1(AbsoluteCriterion[Player]):
     @classmethod
     def evaluate(cls, player_1: Player, player_2: Player) -> bool:
         """Check whether the given players have already played each other in previous rounds."""
-        return player_1.id not in player_2.opponents
+        return not has_played(player_2, player_1.id)
+
+    @classmethod
+    def get_masks(cls, players: list[Player]) -> list[int]:
+        """Return a bitmask for each of the given players containing the players it has not played against yet."""
+        return opponent_masks(players)
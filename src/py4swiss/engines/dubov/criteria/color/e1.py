@@ -22,7 +22,7 @@ class E1(ColorCriterion[Player, State]):
         If the higher ranked player has an odd pairing number given them the initial color. Otherwise, give the intial
         color to the other player. However, this criterion only applies if the given players has yet to play a game.
         """
-        if bool(player_1.opponents) or bool(player_2.opponents):
+        if player_1.games or player_2.games:
             return ColorPreferenceSide.NONE
 
         swap_side = not state.initial_color
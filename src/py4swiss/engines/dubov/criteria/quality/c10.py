@@ -37,10 +37,10 @@ class C10(QualityCriterion[Player, State]):
             return weight
 
         # Only pairings involving residents count as pairs.
-        if player_1.role == PlayerRole.LOWER:
+        if state.get_role(player_1) == PlayerRole.LOWER:
             return weight
 
-        if player_2.role == PlayerRole.RESIDENT:
+        if state.get_role(player_2) == PlayerRole.RESIDENT:
             return weight
 
         # See C.5 for comparison.
@@ -25,12 +25,12 @@ class C5(QualityCriterion[Player, State]):
         weight = DynamicUint(zero)
 
         # Only pairings involving residents count as pairs.
-        if player_1.role == PlayerRole.LOWER:
+        if state.get_role(player_1) == PlayerRole.LOWER:
             return weight
 
         # Pairings between residents require no upfloaters while any other pairings involving residents require exactly
         # one upfloater. Thus, with this choice of weight, the maximum round pairing weight sum will maximize the number
         # of pairs.
-        weight |= int(player_2.role == PlayerRole.RESIDENT)
+        weight |= int(state.get_role(player_2) == PlayerRole.RESIDENT)
 
         return weight
@@ -16,35 +16,33 @@ class C6(QualityCriterion[Player, State]):
     @classmethod
     def get_shift(cls, state: State) -> int:
         """
-        Return the number of bits needed to represent score differences.
+        Return the number of bits needed to represent scores of upfloaters.
 
-        This refers to all occurrences of all score differences between residents and upfloaters in the given bracket.
+        This refers to all occurrences of all scores of players in the given round.
         """
-        # Since each occurrence of a score difference will be contained in at most one weight, the number of bits needed
-        # to represent all such occurrences will always be greater than the sum of all weights in a round pairing.
-        return state.score_difference_total_bits
+        # Since each occurrence of a score will be contained in at most one weight, the number of bits needed to
+        # represent all such occurrences will always be greater than the sum of all weights in a round pairing.
+        return state.upfloater_score_total_bits
 
     @classmethod
     def get_weight(cls, player_1: Player, player_2: Player, zero: DynamicUint, state: State) -> DynamicUint:
         """
-        Return a weight based on the score difference of the given players.
+        Return a weight based on the score of the upfloater out of the given players.
 
         However, if they are both residents or both non-residents, then a weight of 0 will be returned.
         """
         weight = DynamicUint(zero)
 
         # Only pairings involving residents count as pairs.
-        if player_1.role == PlayerRole.LOWER:
+        if state.get_role(player_1) == PlayerRole.LOWER:
             return weight
 
-        if player_2.role == PlayerRole.RESIDENT:
+        if state.get_role(player_2) == PlayerRole.RESIDENT:
             return weight
 
-        difference = player_1.points_with_acceleration - player_2.points_with_acceleration
-
-        # The weight contains all 0s except for possbily one 1 accounting for the introduced score difference by this
-        # pair. Thus, in sum this choice of weights will minimize the score difference of the full round pairing.
-        weight |= 1
-        weight <<= state.score_difference_bit_dict[difference]
+        # The weight contains all 0s except for possbily one 1 accounting for the score of the upfloater of this pair.
+        # Since all residents have the same score, in sum this choice of weights will minimize the score differences of
+        # the full round pairing.
+        weight.set_bit(state.upfloater_score_bit_dict[player_2.points_with_acceleration])
 
         return weight
@@ -29,14 +29,14 @@ class C7(QualityCriterion[Player, State]):
         weight = DynamicUint(zero)
 
         # Only pairings involving residents count as pairs.
-        if player_1.role == PlayerRole.LOWER:
+        if state.get_role(player_1) == PlayerRole.LOWER:
             return weight
 
         # There will be a player in a pair who does not get their color preference, if and only if both players in the
         # pair have the same color preference side. Furthermore, at least one player in each pair will get their color
         # preference. Thus, with this choice of weight, the maximum round pairing weight sum will minimize the number of
         # paired players that do not get their color preference.
-        conflict = player_1.color_preference.side.conflicts(player_2.color_preference.side)
+        conflict = player_1.color_preference.conflicts(player_2.color_preference)
         weight |= int(not conflict)
 
         return weight
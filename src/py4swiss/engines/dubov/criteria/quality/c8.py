@@ -35,10 +35,10 @@ class C8(QualityCriterion[Player, State]):
             return weight
 
         # Only pairings involving residents count as pairs.
-        if player_1.role == PlayerRole.LOWER:
+        if state.get_role(player_1) == PlayerRole.LOWER:
             return weight
 
         # See C.5 for comparison.
-        weight |= int(player_2.role != PlayerRole.RESIDENT and not player_2.is_maximum_upfloater)
+        weight |= int(state.get_role(player_2) != PlayerRole.RESIDENT and not player_2.is_maximum_upfloater)
 
         return weight
@@ -36,14 +36,13 @@ class C9(QualityCriterion[Player, State]):
             return weight
 
         # Only pairings involving residents count as pairs.
-        if player_1.role == PlayerRole.LOWER:
+        if state.get_role(player_1) == PlayerRole.LOWER:
             return weight
 
-        if player_2.role == PlayerRole.RESIDENT or not player_2.is_maximum_upfloater:
+        if state.get_role(player_2) == PlayerRole.RESIDENT or not player_2.is_maximum_upfloater:
             return weight
 
         # See C.6 for comparison
-        weight |= 1
-        weight <<= state.upfloat_bit_dict[player_2.upfloats]
+        weight.set_bit(state.upfloat_bit_dict[player_2.upfloats])
 
         return weight
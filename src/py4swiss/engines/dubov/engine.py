@@ -1,9 +1,15 @@
-from py4swiss.engines.common import Pairing, PairingEngine
+from typing import ClassVar
+
+from py4swiss.engines.common import Pairing, PairingEngine, PairingError
+from py4swiss.engines.common.fingerprint import get_fingerprint
 from py4swiss.engines.dubov.bracket import Bracket
 from py4swiss.engines.dubov.bye_matcher import ByeMatcher
+from py4swiss.engines.dubov.criteria import ABSOLUTE_CRITERIA
 from py4swiss.engines.dubov.pairer import Pairer
-from py4swiss.engines.dubov.player import Player, get_player_infos_from_trf
+from py4swiss.engines.dubov.player import Player, PlayerRole, get_player_infos_from_trf
 from py4swiss.engines.dubov.state import State
+from py4swiss.engines.matching import Compatibility, Matcher
+from py4swiss.profiling import count, phase, sample
 from py4swiss.trf import ParsedTrf
 
 
@@ -14,6 +20,10 @@ class Engine(PairingEngine):
     See "C.04.4.1 Dubov System (effective from 1 February 2026)".
     """
 
+    # Whether the matcher of a bracket is reused for the next bracket of the same round instead of setting up a new one
+    # for all remaining players. Both options yield identical round pairings.
+    REUSE_MATCHER: ClassVar[bool] = True
+
     @staticmethod
     def _get_player_pair_score(player_pair: tuple[Player, Player]) -> tuple[int, int, int]:
         """Return a score for a pair of players for purpose of sorting the round pairing."""
@@ -51,39 +61,67 @@ class Engine(PairingEngine):
     @staticmethod
     def _get_bracket_pairs(pairer: Pairer) -> list[tuple[Player, Player]]:
         """Return the chosen players to be paired in the bracket."""
-        pairer.determine_initial_g1_and_g2()
-        pairer.perform_g1_g2_recomposition()
-        pairer.transpose_g2()
-        return pairer.get_player_pairs()
+        with phase("bracket_solve"):
+            pairer.determine_initial_g1_and_g2()
+            pairer.perform_g1_g2_recomposition()
+            pairer.transpose_g2()
+
+        with phase("color_allocation"):
+            return pairer.get_player_pairs()
+
+    @classmethod
+    def get_fingerprint(cls, trf: ParsedTrf) -> str:
+        """Return a fingerprint of all information of the given TRF relevant for the round pairing of this engine."""
+        # The ratings determine the average rating of opponents (ARO), which is part of the pairing criteria.
+        return get_fingerprint(trf, f"{cls.__module__}.{cls.__qualname__}", ratings=True)
 
     @classmethod
     def generate_pairings(cls, trf: ParsedTrf) -> list[Pairing]:
         """Return the round pairing of the next round for the given TRF."""
+        if trf.has_pending_results():
+            error_message = "Round can not be paired while results of previous rounds are pending"
+            raise PairingError(error_message)
+
         number_of_rounds = trf.x_section.number_of_rounds
         round_number = min(len(section.results) for section in trf.player_sections) + 1
         initial_color = trf.x_section.configuration.first_round_color
         forbidden_pairs = trf.x_section.forbidden_pairs
 
-        players = get_player_infos_from_trf(trf)
-        players.sort(reverse=True)
+        with phase("player_build"):
+            players = get_player_infos_from_trf(trf)
+            players.sort(reverse=True)
+
+        with phase("compatibility_setup"):
+            compatibility = Compatibility(players, (ABSOLUTE_CRITERIA[0], ABSOLUTE_CRITERIA[2]), forbidden_pairs)
         player_pairs = []
 
         if len(players) % 2 == 1:
             # Determine the player to receive the pairing allocated bye.
-            bye_matcher = ByeMatcher(players, forbidden_pairs)
-            bye = bye_matcher.get_bye()
+            with phase("bye_selection"):
+                bye_matcher = ByeMatcher(players, compatibility)
+                bye = bye_matcher.get_bye()
 
             player_pairs.append((bye, bye))
             players.remove(bye)
 
         bracket = Bracket(players)
+        matcher: Matcher[Player, State] | None = None
 
         # Determine the bracket pairings and save the results until there are none left.
         while not bracket.is_finished():
-            state = State.from_data(bracket.players, round_number, number_of_rounds, forbidden_pairs, initial_color)
-            pairer = Pairer(bracket.players, state)
+            count("brackets")
+            sample("bracket_sizes", sum(role == PlayerRole.RESIDENT for role in bracket.roles.values()))
+
+            with phase("bracket_setup"):
+                state = State.from_data(
+                    players, bracket.roles, round_number, number_of_rounds, forbidden_pairs, initial_color
+                )
+                pairer = Pairer(bracket.players, state, compatibility, matcher)
             bracket_pairings = cls._get_bracket_pairs(pairer)
 
+            if cls.REUSE_MATCHER:
+                matcher = pairer.matcher
+
             bracket.apply_pairings(bracket_pairings)
             player_pairs.extend(bracket_pairings)
 
@@ -1,12 +1,11 @@
 from py4swiss.engines.common import ColorPreferenceSide
 from py4swiss.engines.dubov.criteria import (
-    ABSOLUTE_CRITERIA,
     COLOR_CRITERIA,
     QUALITY_CRITERIA,
 )
 from py4swiss.engines.dubov.player import Player, PlayerRole
 from py4swiss.engines.dubov.state import State
-from py4swiss.engines.matching import Matcher
+from py4swiss.engines.matching import Compatibility, Matcher
 
 
 class Pairer:
@@ -20,29 +19,59 @@ class Pairer:
         - Retrieve the chosen pairings after determining colors
     """
 
-    def __init__(self, players: list[Player], state: State) -> None:
-        """Initialize a new matcher along with the heterogeneous and homogeneous brackets."""
+    def __init__(
+        self,
+        players: list[Player],
+        state: State,
+        compatibility: Compatibility[Player],
+        matcher: Matcher[Player, State] | None = None,
+    ) -> None:
+        """
+        Initialize a new matcher along with the heterogeneous and homogeneous brackets.
+
+        The compatibility of the players of the round is shared between all brackets. Optionally, the matcher of the
+        previous bracket of the same round can be given, in which case it is reset for the given players and state
+        instead of setting up a new one.
+        """
         self._players: list[Player] = players
         self._state: State = state
 
-        self._matcher: Matcher[Player] = Matcher(
-            self._players,
-            self._state,
-            (ABSOLUTE_CRITERIA[0], ABSOLUTE_CRITERIA[2]),
-            QUALITY_CRITERIA,
-            COLOR_CRITERIA,
-            self._state.bracket_bits,
-        )
-
-        self._resident_list = [player for player in self._players if player.role == PlayerRole.RESIDENT]
-        self._lower_list = [player for player in self._players if player.role == PlayerRole.LOWER]
+        if matcher is None:
+            self._matcher: Matcher[Player, State] = Matcher(
+                self._players,
+                self._state,
+                compatibility,
+                QUALITY_CRITERIA,
+                COLOR_CRITERIA,
+                self._state.bracket_bits,
+            )
+        else:
+            # All quality criteria weights of pairs without residents are zero.
+            inactive_players = {player for player in self._players if self._state.get_role(player) == PlayerRole.LOWER}
+            # Since the weight layout is the same for all brackets of the round, only the edges of players whose role
+            # changed need to be re-weighted.
+            changed_players = {
+                player for player in self._players if matcher.state.get_role(player) != self._state.get_role(player)
+            }
+            self._matcher = matcher
+            self._matcher.reset(self._players, self._state, self._state.bracket_bits, inactive_players, changed_players)
+
+        self._resident_list = [
+            player for player in self._players if self._state.get_role(player) == PlayerRole.RESIDENT
+        ]
+        self._lower_list = [player for player in self._players if self._state.get_role(player) == PlayerRole.LOWER]
 
         self._g1: list[Player] = []
         self._g2: list[Player] = []
 
+    @property
+    def matcher(self) -> Matcher[Player, State]:
+        """Return the matcher of the bracket."""
+        return self._matcher
+
     def _get_match_role(self, player: Player) -> PlayerRole:
         """Return the role of the player with which the given player is currently matched."""
-        return self._matcher.matching[player].role
+        return self._state.get_role(self._matcher.matching[player])
 
     def _has_resident_match(self, player: Player) -> bool:
         """Check whether the given player is currently matched to a resident."""
@@ -294,7 +323,10 @@ class Pairer:
 
         for player_1, player_2 in self._matcher.matching.items():
             # Ignore pairings with no residents.
-            if player_1.role == PlayerRole.LOWER and player_2.role == PlayerRole.LOWER:
+            if (
+                self._state.get_role(player_1) == PlayerRole.LOWER
+                and self._state.get_role(player_2) == PlayerRole.LOWER
+            ):
                 continue
             # Avoid counting each pair twice.
             if player_1 > player_2:
@@ -4,18 +4,30 @@ from enum import Enum
 from functools import total_ordering
 from typing import TYPE_CHECKING
 
+import numpy as np
 from pydantic import BaseModel
 
 from py4swiss.engines.common import (
     ColorPreference,
     ColorPreferenceSide,
     ColorPreferenceStrength,
+    color_difference,
+    get_histories,
+    had_white_last,
+    last_two_same_color,
 )
-from py4swiss.trf.results import ColorToken, ResultToken
+from py4swiss.tiebreaks import TiebreakTable
+from py4swiss.trf.results import ResultToken
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from py4swiss.engines.common import PlayerHistory
     from py4swiss.trf.parsed_trf import ParsedTrf
-    from py4swiss.trf.sections import PlayerSection, XSection
+    from py4swiss.trf.results import ResultMatrix
+
+# The results by which a player counts as having received a bye.
+BYE_RECEIVED_RESULTS = {ResultToken.PAIRING_ALLOCATED_BYE, ResultToken.FORFEIT_WIN}
 
 
 class PlayerRole(int, Enum):
@@ -40,10 +52,10 @@ class Player(BaseModel):
         previous_upfloat (bool): Whether the player was upfloated in the previous round
         is_maximum_upfloater (bool): Whether the player is a maximum upfloater
         aro (int): The average rating of the opponents of the player
-        opponents (set[int]): The IDs of the players against which the player already has a played game against
-        colors (list[bool): A list of whether the player had the white pieces or not in their played games
+        opponents (int): A bitset over the IDs of the players against which the player already has a played game
+        colors (int): A bitset over the played games of the player in order, set for games with the white pieces
+        games (int): The number of played games of the player
         bye_received (bool): Whether the player already had a bye or forfeit win
-        role: (PlayerRole): The role of the player in the current bracket (bracket context only)
 
     """
 
@@ -56,12 +68,11 @@ class Player(BaseModel):
     previous_upfloat: bool
     is_maximum_upfloater: bool
     aro: int
-    opponents: set[int]
-    colors: list[bool]
+    opponents: int
+    colors: int
+    games: int
     bye_received: bool
 
-    role: PlayerRole = PlayerRole.RESIDENT
-
     def __lt__(self, other: Player) -> bool:
         """Check whether the latter player ranks higher than the former one."""
         # FIDE handbook: "A.2 Order"
@@ -82,27 +93,12 @@ class Player(BaseModel):
         return hash(self.id)
 
 
-def _get_points_list(section: PlayerSection, x_section: XSection) -> list[int]:
-    """Return a list of points of the given player after each round (including acceleration)."""
-    round_results = section.results
-    accelerations = x_section.accelerations.get(section.starting_number, [])
-    accelerations += (len(round_results) - len(accelerations) + 1) * [0]
-
-    points_list = []
-    current_points = 0
-
-    for result, acceleration in zip(round_results, accelerations, strict=False):
-        points_list.append(current_points + acceleration)
-        current_points += x_section.scoring_point_system.get_points_times_ten(result)
-    points_list.append(current_points + accelerations[len(round_results)])
-
-    return points_list
-
-
-def _get_color_preference(section: PlayerSection) -> ColorPreference:
-    """Return the color preference of the given player."""
-    colors = [round_result.color for round_result in section.results if round_result.result.is_played()]
+def _get_color_preference(history: PlayerHistory) -> ColorPreference:
+    """
+    Return the color preference of a player.
 
+    The player is given by their played games.
+    """
     # FIDE handbook: "1.6 Colour differences and colour preferences"
     # The colour preference (also called: due colour) is the colour that a player should ideally receive for the next
     # game.
@@ -116,75 +112,49 @@ def _get_color_preference(section: PlayerSection) -> ColorPreference:
     #       the colour with respect to the previous game they played.
     # 1.6.4 Players who did not play any games are considered to have a mild colour preference for Black.
 
-    whites = colors.count(ColorToken.WHITE)
-    blacks = colors.count(ColorToken.BLACK)
-    difference = whites - blacks
-    double = len(colors) > 1 and len(set(colors[-2:])) == 1
+    difference = color_difference(history)
+    double = last_two_same_color(history)
 
     if difference > 0:
         side = ColorPreferenceSide.BLACK
     elif difference < 0:
         side = ColorPreferenceSide.WHITE
-    elif bool(colors):
-        side = ColorPreferenceSide.WHITE if colors[-1] == ColorToken.BLACK else ColorPreferenceSide.BLACK
+    elif history.games > 0:
+        side = ColorPreferenceSide.BLACK if had_white_last(history) else ColorPreferenceSide.WHITE
     else:
         side = ColorPreferenceSide.NONE
 
     if abs(difference) > 1 or double:
-        return ColorPreference(side=side, strength=ColorPreferenceStrength.ABSOLUTE)
+        return ColorPreference.get(side, ColorPreferenceStrength.ABSOLUTE)
     if abs(difference) == 1:
-        return ColorPreference(side=side, strength=ColorPreferenceStrength.STRONG)
+        return ColorPreference.get(side, ColorPreferenceStrength.STRONG)
     if side != ColorPreferenceSide.NONE:
-        return ColorPreference(side=side, strength=ColorPreferenceStrength.MILD)
-    return ColorPreference(side=ColorPreferenceSide.BLACK, strength=ColorPreferenceStrength.MILD)
+        return ColorPreference.get(side, ColorPreferenceStrength.MILD)
+    return ColorPreference.get(ColorPreferenceSide.BLACK, ColorPreferenceStrength.MILD)
 
 
-def _get_floats(section: PlayerSection, points_list_dict: dict[int, list[int]]) -> tuple[int, bool]:
-    """Return the number of upfloats of the given player as well as whether they upfloated in the previous round."""
-    upfloats = 0
-    current_upfloat = False
-    player_point_list = points_list_dict[section.starting_number]
+def _get_floats(
+    result_matrix: ResultMatrix, points_lists: npt.NDArray[np.int64], round_number: int
+) -> tuple[list[int], list[bool]]:
+    """Return the number of upfloats of all players as well as whether they upfloated in the previous round."""
+    rounds = np.arange(result_matrix.results.shape[1])
+    player_points = points_lists[:, rounds]
+    opponent_points = points_lists[result_matrix.indices, rounds]
+    upfloat = result_matrix.played & (opponent_points > player_points)
 
-    for i, round_result in enumerate(section.results):
-        if not round_result.result.is_played():
-            current_upfloat = False
-            continue
-
-        opponent_point_list = points_list_dict[round_result.id]
-        player_points = player_point_list[i]
-        opponent_points = opponent_point_list[i]
-
-        current_upfloat = opponent_points > player_points
-        upfloats += int(current_upfloat)
-
-    return upfloats, current_upfloat
-
-
-def _get_aro(sections: list[PlayerSection]) -> dict[int, int]:
-    """Return a map from starting number to the average rating of opponents (ARO) of all players."""
-    rating_dict = {section.starting_number: section.fide_rating or 0 for section in sections}
-    aro_dict = {}
-
-    # FIDE handbook: "1.7 Average Rating of Opponents (ARO)"
-    # 1.7.1 ARO is defined for each player who has played at least one game. It is given by the sum of the ratings of
-    #       the opponents the player met over-the-board (i.e. only played games are used to compute ARO), divided by the
-    #       number of such opponents, and rounded to the nearest integer number (the higher, if the division ends for
-    #       0.5).
-    # 1.7.2 ARO is computed for each player after each round as a basis for the pairings of the next round.
-    # 1.7.3 If a player has yet to play a game, their ARO is zero.
-    for section in sections:
-        ratings = [rating_dict[round_result.id] for round_result in section.results if round_result.result.is_played()]
-        aro_dict[section.starting_number] = int(sum(ratings) / max(len(ratings), 1) + 0.5)
-
-    return aro_dict
+    upfloats = np.count_nonzero(upfloat, axis=1).tolist()
+    if round_number == 0:
+        return upfloats, len(upfloats) * [False]
+    return upfloats, upfloat[:, round_number - 1].tolist()
 
 
 def get_player_infos_from_trf(trf: ParsedTrf) -> list[Player]:
     """Return a list of all player related information relevant for pairing."""
     players = []
     sections = trf.player_sections
-    points_list_dict = {section.starting_number: _get_points_list(section, trf.x_section) for section in sections}
-    aro_dict = _get_aro(sections)
+    result_matrix = trf.get_result_matrix()
+    points_lists = result_matrix.get_points_lists(trf.x_section.scoring_point_system, trf.x_section.accelerations)
+    aro_list = TiebreakTable.from_trf(trf).get_aro().tolist()
 
     # FIDE handbook: "1.8 Maximum Upfloater"
     # 1.8.1 A player is said to be a maximum upfloater when they have already been upfloated a maximum number of
@@ -196,38 +166,39 @@ def get_player_infos_from_trf(trf: ParsedTrf) -> list[Player]:
     max_t = 2 + trf.x_section.number_of_rounds // 5
 
     round_number = min(len(player.results) for player in sections)
-    sections = [player for player in sections if len(player.results) == round_number]
-    sections = [player for player in sections if player.starting_number not in trf.x_section.zeroed_ids]
-
-    for i, section in enumerate(sections):
+    rows = [
+        row
+        for row, section in enumerate(sections)
+        if len(section.results) == round_number and section.starting_number not in trf.x_section.zeroed_ids
+    ]
+
+    upfloats_list, previous_upfloat_list = _get_floats(result_matrix, points_lists, round_number)
+    points_list = points_lists[:, round_number].tolist()
+    bye_received_list = np.any(result_matrix.get_mask(BYE_RECEIVED_RESULTS), axis=1).tolist()
+    histories = get_histories(result_matrix)
+
+    for i, row in enumerate(rows):
+        section = sections[row]
+        history = histories[row]
         number = i + 1 if trf.x_section.configuration.by_rank else section.starting_number
 
-        color_preference = _get_color_preference(section)
-        upfloats, previous_upfloat = _get_floats(section, points_list_dict)
-        is_maximum_upfloater = upfloats >= max_t
-
-        white = ColorToken.WHITE
-        opponents = {round_result.id for round_result in section.results if round_result.result.is_played()}
-        colors = [round_result.color == white for round_result in section.results if round_result.result.is_played()]
-        results = {round_result.result for round_result in section.results}
-
-        pairing_allocated_bye = ResultToken.PAIRING_ALLOCATED_BYE in results
-        forfeit_win = ResultToken.FORFEIT_WIN in results
-        bye_received = pairing_allocated_bye or forfeit_win
+        color_preference = _get_color_preference(history)
+        is_maximum_upfloater = upfloats_list[row] >= max_t
 
         player = Player(
             id=section.starting_number,
             number=number,
             points=section.points_times_ten,
-            points_with_acceleration=points_list_dict[section.starting_number][-1],
+            points_with_acceleration=points_list[row],
             color_preference=color_preference,
-            upfloats=upfloats,
-            previous_upfloat=previous_upfloat,
+            upfloats=upfloats_list[row],
+            previous_upfloat=previous_upfloat_list[row],
             is_maximum_upfloater=is_maximum_upfloater,
-            aro=aro_dict[section.starting_number],
-            opponents=opponents,
-            colors=colors,
-            bye_received=bye_received,
+            aro=aro_list[row],
+            opponents=history.opponents,
+            colors=history.colors,
+            games=history.games,
+            bye_received=bye_received_list[row],
         )
         players.append(player)
 
@@ -10,50 +10,52 @@ class State(BaseModel):
     Represents the state of a pairing bracket.
 
     Attributes:
+        roles (dict[int, PlayerRole]): The role of each player in the bracket by their ID
         forbidden_pairs (set[tuple[int, int]]): The pairs of players that are not allowed to be paired with each other
         initial_color (bool): Whether the initial color for the first seed is white
         is_first_round (bool): Whether it is currently the first round
         is_last_round (bool): Whether it is currently the last round
-        bracket_bits (int): The number of bits to represent all residents
-        score_difference_total_bits (int): The number of bits to represent all score differences
-        score_difference_bit_dict (dict[int, int]): The number of bits for each difference
+        bracket_bits (int): The number of bits to represent all players of the round
+        upfloater_score_total_bits (int): The number of bits to represent all scores of upfloaters
+        upfloater_score_bit_dict (dict[int, int]): The number of bits for each score of upfloaters
         upfloat_total_bits (int): The number of bits to represent all numbers of upfloats
         upfloat_bit_dict (dict[int, int]): The number of bits for each number upfloats
 
+    All numbers of bits refer to the players of the whole round rather than to the ones of the bracket. Thus, the weight
+    layout is the same for all brackets of a round, which allows the matcher to be kept for the whole round.
+
     """
 
+    roles: dict[int, PlayerRole]
     forbidden_pairs: set[tuple[int, int]]
     initial_color: bool
     is_first_round: bool
     is_last_round: bool
     bracket_bits: int
-    score_difference_total_bits: int
-    score_difference_bit_dict: dict[int, int]
+    upfloater_score_total_bits: int
+    upfloater_score_bit_dict: dict[int, int]
     upfloat_total_bits: int
     upfloat_bit_dict: dict[int, int]
 
     @staticmethod
-    def _get_score_difference_bits(players: list[Player]) -> tuple[int, dict[int, int]]:
+    def _get_upfloater_score_bits(players: list[Player]) -> tuple[int, dict[int, int]]:
         """
-        Return the number of bits necessary to represent score differences as well as a dictionary.
+        Return the number of bits necessary to represent scores of upfloaters as well as a dictionary.
 
-        This refers to all occurrences of all score differences between the given players. The returned dictionary
-        contains the number of bits necessary to represent all occurrences of the given score difference for the given
-        players.
+        This refers to all occurrences of all scores of the given players. The returned dictionary contains the number
+        of bits necessary to represent all occurrences of the given score for the given players.
         """
-        max_points = max(player.points_with_acceleration for player in players)
-        point_differences = [max_points - player.points_with_acceleration for player in players]
-        point_differences = [difference for difference in point_differences if difference != 0]
+        scores = [player.points_with_acceleration for player in players]
 
-        bits = {key: point_differences.count(key).bit_length() for key in point_differences}
+        bits = {key: scores.count(key).bit_length() for key in scores}
         cumulative_bits = {}
         running_total = 0
 
-        # Add the sum of all score difference bits higher than the current one to itself. By doing this, a binary string
-        # of length equal to the score difference bit total can be subdivided into parts at the resulting bit numbers in
-        # order to easily separate occurrences of different score differences in order of importance from lowest to
-        # highest.
-        for key in sorted(bits, reverse=True):
+        # Add the sum of all score bits lower than the current one to itself. By doing this, a binary string of length
+        # equal to the score bit total can be subdivided into parts at the resulting bit numbers in order to easily
+        # separate occurrences of different scores in order of importance from lowest to highest. Note that a higher
+        # score of an upfloater is equivalent to a lower score difference to the residents.
+        for key in sorted(bits):
             cumulative_bits[key] = running_total
             running_total += bits[key]
 
@@ -68,9 +70,7 @@ class State(BaseModel):
         contains the number of bits necessary to represent all occurrences of the given number of upfloats for the given
         players.
         """
-        upfloats = [
-            player.upfloats for player in players if player.role == PlayerRole.LOWER and player.is_maximum_upfloater
-        ]
+        upfloats = [player.upfloats for player in players if player.is_maximum_upfloater]
 
         bits = {key: upfloats.count(key).bit_length() for key in upfloats}
         cumulative_bits = {}
@@ -89,22 +89,33 @@ class State(BaseModel):
     def from_data(
         cls,
         players: list[Player],
+        roles: dict[int, PlayerRole],
         round_number: int,
         number_of_rounds: int,
         forbidden_pairs: set[tuple[int, int]],
         initial_color: bool,
     ) -> Self:
-        """Return a bracket given the minimal necessary information."""
-        score_difference_total_bits, score_difference_bit_dict = cls._get_score_difference_bits(players)
+        """
+        Return a bracket given the minimal necessary information.
+
+        The given players are all players to be paired in the round, while the given roles only contain the players of
+        the bracket.
+        """
+        upfloater_score_total_bits, upfloater_score_bit_dict = cls._get_upfloater_score_bits(players)
         upfloat_total_bits, upfloat_bit_dict = cls._get_upfloat_bits(players)
         return cls(
+            roles=roles,
             forbidden_pairs=forbidden_pairs,
             initial_color=initial_color,
             is_first_round=round_number == 1,
             is_last_round=round_number == number_of_rounds,
-            bracket_bits=sum(player.role == PlayerRole.RESIDENT for player in players).bit_length(),
-            score_difference_total_bits=score_difference_total_bits,
-            score_difference_bit_dict=score_difference_bit_dict,
+            bracket_bits=len(players).bit_length(),
+            upfloater_score_total_bits=upfloater_score_total_bits,
+            upfloater_score_bit_dict=upfloater_score_bit_dict,
             upfloat_total_bits=upfloat_total_bits,
             upfloat_bit_dict=upfloat_bit_dict,
         )
+
+    def get_role(self, player: Player) -> PlayerRole:
+        """Return the role of the given player in the bracket."""
+        return self.roles[player.id]
@@ -2,7 +2,7 @@ from typing import Self
 
 from pydantic import BaseModel
 
-from py4swiss.engines.dutch.player import Player
+from py4swiss.engines.dutch.player import Player, PlayerRole
 
 
 class Bracket(BaseModel):
@@ -13,6 +13,10 @@ class Bracket(BaseModel):
     next score group as well as various properties of the bracket.
 
     Attributes:
+        mdp_list (list[Player]): The MDPs of the bracket
+        resident_list (list[Player]): The residents of the bracket
+        lower_list (list[Player]): The residents of the next bracket
+        roles (dict[int, PlayerRole]): The role of each of the above players in the bracket by their ID
         one_round_played (bool): Whether at least one round has been played
         two_rounds_played (bool): Whether at least two rounds have been played
         penultimate_pairing_bracket (bool): Whether this is the penultimate pairing bracket
@@ -28,6 +32,7 @@ class Bracket(BaseModel):
     mdp_list: list[Player]
     resident_list: list[Player]
     lower_list: list[Player]
+    roles: dict[int, PlayerRole]
     one_round_played: bool
     two_rounds_played: bool
     penultimate_pairing_bracket: bool
@@ -83,6 +88,16 @@ class Bracket(BaseModel):
 
         return running_total, cumulative_bits
 
+    @staticmethod
+    def _get_roles(
+        mdp_list: list[Player], resident_list: list[Player], lower_list: list[Player]
+    ) -> dict[int, PlayerRole]:
+        """Return a dictionary containing the role of each of the given players by their ID."""
+        roles = {lower.id: PlayerRole.LOWER for lower in lower_list}
+        roles |= {resident.id: PlayerRole.RESIDENT for resident in resident_list}
+        roles |= {mdp.id: PlayerRole.MDP for mdp in mdp_list}
+        return roles
+
     @classmethod
     def from_data(
         cls,
@@ -98,6 +113,7 @@ class Bracket(BaseModel):
             mdp_list=mdp_list,
             resident_list=resident_list,
             lower_list=lower_list,
+            roles=cls._get_roles(mdp_list, resident_list, lower_list),
             one_round_played=round_number > 1,
             two_rounds_played=round_number > 1 + 1,
             penultimate_pairing_bracket=collapsed,
@@ -108,3 +124,7 @@ class Bracket(BaseModel):
             score_difference_total_bits=score_difference_total_bits,
             score_difference_bit_dict=score_difference_bit_dict,
         )
+
+    def get_role(self, player: Player) -> PlayerRole:
+        """Return the role of the given player in the bracket."""
+        return self.roles[player.id]
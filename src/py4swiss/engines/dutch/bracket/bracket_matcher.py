@@ -4,6 +4,7 @@ from py4swiss.engines.dutch.criteria import QUALITY_CRITERIA
 from py4swiss.engines.dutch.player import Player
 from py4swiss.engines.dutch.validity_matcher import ValidityMatcher
 from py4swiss.matching_computer import ComputerDutchOptimality
+from py4swiss.profiling import count, record, solve
 
 
 class BracketMatcher:
@@ -32,12 +33,14 @@ class BracketMatcher:
 
         self._max_weight: DynamicUint = self._get_max_weight()
         self._zero_weight: DynamicUint = self._max_weight & 0
+        self._shifts: list[int] = [criterion.get_shift(self._bracket) for criterion in QUALITY_CRITERIA]
 
         self._len: int = len(self._player_list)
         self._index_dict_reverse: dict[int, Player] = dict(enumerate(self._player_list))
         self._index_dict: dict[Player, int] = {player: i for i, player in self._index_dict_reverse.items()}
 
         self._computer: ComputerDutchOptimality = ComputerDutchOptimality(self._len, self._max_weight)
+        record(self._computer)
         self._weights: list[list[DynamicUint]] = [[self._zero_weight] * self._len for _ in range(self._len)]
 
         self.matching: dict[Player, Player] = {}
@@ -106,22 +109,24 @@ class BracketMatcher:
 
         # In the PPB and LPB the choice of unpaired player matters. Thus, pairing players which already received a bye
         # or forfeit win is mandatory according to absolute criterion C.2.
+        bye_preference = 0
         if self._bracket.penultimate_pairing_bracket or self._bracket.last_pairing_bracket:
-            weight |= 1 + player_1.bye_received + player_2.bye_received
+            bye_preference = 1 + player_1.bye_received + player_2.bye_received
+        fields: list[tuple[DynamicUint | int, int]] = [(bye_preference, 0)]
 
         # Add the individual quality criteria weights from most important to least important and shift in order to not
         # overwrite any previously set bits. The shift amount is such that, even for the sum of all weights of a given
         # round pairing, the values of a quality criterion with lower importance can not overflow to parts reserved for
         # a criterion with higher importance.
-        for criterion in QUALITY_CRITERIA:
-            weight <<= criterion.get_shift(self._bracket)
-            weight += criterion.get_weight(player_1, player_2, self._zero_weight, self._bracket)
+        for criterion, shift in zip(QUALITY_CRITERIA, self._shifts, strict=True):
+            fields.append((criterion.get_weight(player_1, player_2, self._zero_weight, self._bracket), shift))
 
         # There needs to be free space at the bottom for adding transposition preferences later on in order to enforce
         # D.1, D.2, and D.3.
-        weight <<= 3 * self._bracket.bracket_bits + 1
+        fields.append((0, 3 * self._bracket.bracket_bits + 1))
 
-        return weight
+        # All fields are combined in a single call instead of shifting and adding each of them separately.
+        return self._zero_weight.pack(fields)
 
     def _set_up_computer(self) -> None:
         """Initialize the graph with a vertex for each player as well as edges with weights between them."""
@@ -133,6 +138,8 @@ class BracketMatcher:
                 weight = self._get_weight(player_1, player_2)
                 self._set_weight(i, i + j + 1, weight)
 
+        count("edge_updates", self._len * (self._len - 1) // 2)
+
     def add_to_weight(self, player_1: Player, player_2: Player, value: int) -> None:
         """Add the given integer value to the edge weight between the given players."""
         i, j = self._get_index(player_1), self._get_index(player_2)
@@ -141,12 +148,14 @@ class BracketMatcher:
         if not bool(self._weights[i][j]):
             return
 
-        # Since weights can not be negative, the sign of the given value needs to be taken special care of.
-        weight = self._zero_weight | abs(value)
+        # Since weights can not be negative, the sign of the given value needs to be taken special care of. Note that the
+        # stored weight is copied, since it is shared between both directions of the edge.
+        weight = DynamicUint(self._weights[i][j])
         if value > 0:
-            self._set_weight(i, j, self._weights[i][j] + weight)
+            weight.add_at(value, 0)
         else:
-            self._set_weight(i, j, self._weights[i][j] - weight)
+            weight.subtract_at(-value, 0)
+        self._set_weight(i, j, weight)
 
     def add_to_weights(self, player: Player, player_list: list[Player], value: int, increment: bool = False) -> None:
         """
@@ -154,6 +163,7 @@ class BracketMatcher:
 
         The value can optionally be incremented by 1 after each addition.
         """
+        count("edge_updates", len(player_list))
         for other in player_list:
             self.add_to_weight(player, other, value)
             value += int(increment)
@@ -165,12 +175,14 @@ class BracketMatcher:
 
     def remove_weights(self, player: Player, player_list: list[Player]) -> None:
         """Remove each edge between the given player and any player in the given list."""
+        count("edge_updates", len(player_list))
         for other in player_list:
             self.remove_weight(player, other)
 
     def update_matching(self) -> None:
         """Compute a new matching efficiently by only considering vertices which were marked as updated."""
-        self._computer.compute_matching()
+        with solve(self._computer):
+            self._computer.compute_matching()
         matching = self._computer.get_matching()
 
         self.matching = {self._get_player(i): self._get_player(j) for i, j in enumerate(matching)}
@@ -181,6 +193,7 @@ class BracketMatcher:
 
         # Removing all edges between the given players and any other players besides one another will force the matching
         # algorithm to match the given players with each other.
+        count("edge_updates", 2 * self._len + 1)
         for k in range(self._len):
             self._remove_weight(i, k)
             self._remove_weight(j, k)
@@ -72,7 +72,7 @@ class BracketPairer:
 
     def _get_match_role(self, player: Player) -> PlayerRole:
         """Return the role of the player with which the given player is currently matched."""
-        return self._bracket_matcher.matching[player].role
+        return self._bracket.get_role(self._bracket_matcher.matching[player])
 
     def _has_resident_match(self, player: Player) -> bool:
         """Check whether the given player is currently matched to a resident."""
@@ -319,7 +319,7 @@ class BracketPairer:
 
         for player_1, player_2 in self._bracket_matcher.matching.items():
             # Ignore pairings with players from lower brackets.
-            if PlayerRole.LOWER in (player_1.role, player_2.role):
+            if PlayerRole.LOWER in (self._bracket.get_role(player_1), self._bracket.get_role(player_2)):
                 continue
             # Avoid counting each pair twice.
             if player_1 > player_2:
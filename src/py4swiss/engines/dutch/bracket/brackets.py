@@ -1,7 +1,7 @@
 from itertools import groupby
 
 from py4swiss.engines.dutch.bracket.bracket import Bracket
-from py4swiss.engines.dutch.player import Player, PlayerRole
+from py4swiss.engines.dutch.player import Player
 
 
 class Brackets:
@@ -26,8 +26,6 @@ class Brackets:
         self._collapsed: bool = False
         self._mdp_list: list[Player] = []
 
-        self._assign_roles()
-
     def _get_resident_list(self) -> list[Player]:
         """Return the residents of the current bracket."""
         if self._index >= len(self._brackets):
@@ -40,17 +38,6 @@ class Brackets:
             return []
         return self._brackets[self._index + 1]
 
-    def _assign_roles(self) -> None:
-        """Assign roles to the relevant player for the current bracket."""
-        for mdp in self._mdp_list:
-            mdp.role = PlayerRole.MDP
-
-        for resident in self._get_resident_list():
-            resident.role = PlayerRole.RESIDENT
-
-        for lower in self._get_lower_list():
-            lower.role = PlayerRole.LOWER
-
     def is_finished(self) -> bool:
         """Check whether all brackets have been exhausted."""
         return self._index == len(self._brackets)
@@ -70,8 +57,6 @@ class Brackets:
         self._mdp_list = [player for player in candidates if player not in paired_players]
         self._index += 1
 
-        self._assign_roles()
-
     def collapse(self) -> None:
         """Mark the current bracket as the PPB and collapse the last bracket."""
         # FIDE handbook: "A.9 Round-Pairing Outlook"
@@ -84,5 +69,3 @@ class Brackets:
 
         self._brackets = [*self._brackets[: self._index + 1], collapsed_last_bracket]
         self._collapsed = True
-
-        self._assign_roles()
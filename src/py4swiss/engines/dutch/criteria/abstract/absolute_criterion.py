@@ -1,9 +1,10 @@
-from abc import ABC, abstractmethod
+from abc import abstractmethod
 
 from py4swiss.engines.dutch.player import Player
+from py4swiss.engines.matching import AbsoluteCriterion as MatchingAbsoluteCriterion
 
 
-class AbsoluteCriterion(ABC):
+class AbsoluteCriterion(MatchingAbsoluteCriterion[Player]):
     """Abstract class for absolute criteria (C.1, C.2, and C.3)."""
 
     @classmethod
@@ -29,14 +29,14 @@ class C10(QualityCriterion):
         weight = DynamicUint(zero)
 
         # Only pairings between MDPs or residents count as pairs.
-        if player_2.role == PlayerRole.LOWER:
+        if bracket.get_role(player_2) == PlayerRole.LOWER:
             return weight
 
         # There will be a player in a pair who does not get their color preference, if and only if both players in the
         # pair have the same color preference side. Furthermore, at least one player in each pair will get their color
         # preference. Thus, with this choice of weight, the maximum round pairing weight sum will minimize the number of
         # paired players that do not get their color preference.
-        conflict = player_1.color_preference.side.conflicts(player_2.color_preference.side)
+        conflict = player_1.color_preference.conflicts(player_2.color_preference)
         weight |= int(not conflict)
 
         return weight
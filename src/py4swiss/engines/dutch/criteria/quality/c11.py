@@ -1,5 +1,6 @@
 from py4swiss.dynamicuint import DynamicUint
 from py4swiss.engines.common import ColorPreferenceStrength
+from py4swiss.engines.common.color_preference import codes_conflict, get_strength_code
 from py4swiss.engines.dutch.bracket import Bracket
 from py4swiss.engines.dutch.criteria.abstract import QualityCriterion
 from py4swiss.engines.dutch.player import Player, PlayerRole
@@ -30,12 +31,13 @@ class C11(QualityCriterion):
         weight = DynamicUint(zero)
 
         # Only pairings between MDPs or residents count as pairs.
-        if player_2.role == PlayerRole.LOWER:
+        if bracket.get_role(player_2) == PlayerRole.LOWER:
             return weight
 
         # See C.10 for comparison.
-        strong = all(p.color_preference.strength >= ColorPreferenceStrength.STRONG for p in (player_1, player_2))
-        conflict = player_1.color_preference.side.conflicts(player_2.color_preference.side)
+        code_1, code_2 = player_1.color_preference.code, player_2.color_preference.code
+        strong = min(get_strength_code(code_1), get_strength_code(code_2)) >= ColorPreferenceStrength.STRONG
+        conflict = codes_conflict(code_1, code_2)
         weight |= int(not (strong and conflict))
 
         return weight
@@ -33,7 +33,7 @@ class C13(QualityCriterion):
         weight = DynamicUint(zero)
 
         # Only pairings between MDPs or residents count as pairs.
-        if player_2.role == PlayerRole.LOWER or not bracket.two_rounds_played:
+        if bracket.get_role(player_2) == PlayerRole.LOWER or not bracket.two_rounds_played:
             return weight
 
         # The lower ranked player has the same as or fewer points than the higher ranked player. Thus, the latter will
@@ -33,7 +33,7 @@ class C14(QualityCriterion):
         weight = DynamicUint(zero)
 
         # Only pairings between MDPs or residents count as pairs.
-        if player_2.role == PlayerRole.LOWER or not bracket.one_round_played:
+        if bracket.get_role(player_2) == PlayerRole.LOWER or not bracket.one_round_played:
             return weight
 
         # See C.12 for comparison.
@@ -36,7 +36,7 @@ class C16(QualityCriterion):
         weight = DynamicUint(zero)
 
         # Only pairings between MDPs or residents count as pairs.
-        if player_2.role == PlayerRole.LOWER or not bracket.one_round_played:
+        if bracket.get_role(player_2) == PlayerRole.LOWER or not bracket.one_round_played:
             return weight
 
         prev_1 = player_1.float_1 == Float.DOWN
@@ -48,12 +48,12 @@ class C16(QualityCriterion):
         difference_2 = player_2.points_with_acceleration - bracket.min_bracket_score + 10
 
         # See C.6 for comparison. Note that, similar to C.12, unpaired players will downfloat.
-        weight += (zero | int(prev_1)) << bracket.score_difference_bit_dict[difference_1]
-        weight += (zero | int(prev_2)) << bracket.score_difference_bit_dict[difference_2]
+        weight.add_at(int(prev_1), bracket.score_difference_bit_dict[difference_1])
+        weight.add_at(int(prev_2), bracket.score_difference_bit_dict[difference_2])
 
         # See C.6 for comparison. Note that, similar to C.12, only the higher ranked player can downfloat.
         if prev_1 and player_1_more_points:
             difference_3 = player_1.points_with_acceleration - player_2.points_with_acceleration
-            weight -= (zero | 1) << bracket.score_difference_bit_dict.get(difference_3, 0)
+            weight.subtract_at(1, bracket.score_difference_bit_dict.get(difference_3, 0))
 
         return weight
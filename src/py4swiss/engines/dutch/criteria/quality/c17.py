@@ -36,7 +36,7 @@ class C17(QualityCriterion):
         weight = DynamicUint(zero)
 
         # Only pairings between MDPs or residents count as pairs.
-        if player_2.role == PlayerRole.LOWER or not bracket.one_round_played:
+        if bracket.get_role(player_2) == PlayerRole.LOWER or not bracket.one_round_played:
             return weight
 
         # See C.6 for comparison. Note that, similar to C.13, only the lower ranked player can upfloat and unpaired
@@ -44,6 +44,6 @@ class C17(QualityCriterion):
         player_1_more_points = player_1.points_with_acceleration > player_2.points_with_acceleration
         double_float = (player_2.float_1 == Float.UP) and player_1_more_points
         difference = player_1.points_with_acceleration - bracket.min_bracket_score + 10
-        weight -= (zero | int(double_float)) << bracket.score_difference_bit_dict[difference]
+        weight.subtract_at(int(double_float), bracket.score_difference_bit_dict[difference])
 
         return weight
@@ -37,7 +37,7 @@ class C18(QualityCriterion):
         weight = DynamicUint(zero)
 
         # Only pairings between MDPs or residents count as pairs.
-        if player_2.role == PlayerRole.LOWER or not bracket.two_rounds_played:
+        if bracket.get_role(player_2) == PlayerRole.LOWER or not bracket.two_rounds_played:
             return weight
 
         # See C.16 for comparison.
@@ -49,10 +49,10 @@ class C18(QualityCriterion):
         difference_2 = player_2.points_with_acceleration - bracket.min_bracket_score + 10
         difference_3 = player_1.points_with_acceleration - player_2.points_with_acceleration
 
-        weight += (zero | int(prev_1)) << bracket.score_difference_bit_dict[difference_1]
-        weight += (zero | int(prev_2)) << bracket.score_difference_bit_dict[difference_2]
+        weight.add_at(int(prev_1), bracket.score_difference_bit_dict[difference_1])
+        weight.add_at(int(prev_2), bracket.score_difference_bit_dict[difference_2])
 
         if prev_1 and player_1_more_points:
-            weight -= (zero | 1) << bracket.score_difference_bit_dict.get(difference_3, 0)
+            weight.subtract_at(1, bracket.score_difference_bit_dict.get(difference_3, 0))
 
         return weight
@@ -36,7 +36,7 @@ class C6(QualityCriterion):
         weight = DynamicUint(zero)
 
         # Only pairings between MDPs or residents count as pairs.
-        if player_2.role == PlayerRole.LOWER:
+        if bracket.get_role(player_2) == PlayerRole.LOWER:
             return weight
 
         # FIDE handbook: "A.8 Pairing Score Difference (PSD)"
@@ -52,8 +52,8 @@ class C6(QualityCriterion):
         # the absolute value of the given difference. Thus, with this choice of weight, the maximum round pairing weight
         # sum will minimize the PSD. Note that the weight will always be positive, since the score bracket bits are
         # increasing as a function of the score difference.
-        weight += (zero | 1) << bracket.score_difference_bit_dict[difference_1]
-        weight += (zero | 1) << bracket.score_difference_bit_dict[difference_2]
-        weight -= (zero | 1) << bracket.score_difference_bit_dict.get(difference_3, 0)
+        weight.add_at(1, bracket.score_difference_bit_dict[difference_1])
+        weight.add_at(1, bracket.score_difference_bit_dict[difference_2])
+        weight.subtract_at(1, bracket.score_difference_bit_dict.get(difference_3, 0))
 
         return weight
@@ -43,19 +43,17 @@ class C7(QualityCriterion):
 
         # Only pairings with lower residents count as pairs. Thus, with this choice of weight, the maximum round pairing
         # weight sum, will maximize the pairs.
-        weight |= int(player_2.role == PlayerRole.LOWER)
-
-        weight <<= bracket.score_difference_total_bits
+        weight.add_at(int(bracket.get_role(player_2) == PlayerRole.LOWER), bracket.score_difference_total_bits)
 
         # As the scores of all lower residents is the same, if the given bracket is not the PPB, and the scores of
         # potential pairs with MDPs and residents is already determined by C.6, it is sufficient to only handle double
         # floats of MDPs and residents, see C.6 for comparison.
-        if player_1.role != PlayerRole.LOWER:
+        if bracket.get_role(player_1) != PlayerRole.LOWER:
             difference = player_1.points_with_acceleration - bracket.min_bracket_score + 10
-            weight += (zero | 1) << bracket.score_difference_bit_dict[difference]
+            weight.add_at(1, bracket.score_difference_bit_dict[difference])
 
-        if player_2.role != PlayerRole.LOWER:
+        if bracket.get_role(player_2) != PlayerRole.LOWER:
             difference = player_2.points_with_acceleration - bracket.min_bracket_score + 10
-            weight += (zero | 1) << bracket.score_difference_bit_dict[difference]
+            weight.add_at(1, bracket.score_difference_bit_dict[difference])
 
         return weight
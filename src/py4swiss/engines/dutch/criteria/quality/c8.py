@@ -31,7 +31,7 @@ class C8(QualityCriterion):
         weight = DynamicUint(zero)
 
         # Only pairings between MDPs or residents count as pairs.
-        if player_2.role == PlayerRole.LOWER:
+        if bracket.get_role(player_2) == PlayerRole.LOWER:
             return weight
 
         # Since a color difference of +2 or -2 implies a color preference side of that color, a difference higher than
@@ -40,7 +40,7 @@ class C8(QualityCriterion):
         # occurs.
         topscorer = player_1.top_scorer or player_2.top_scorer
         at_least_2 = abs(player_1.color_difference) > 1 and abs(player_2.color_difference) > 1
-        conflict = player_1.color_preference.side == player_2.color_preference.side
+        conflict = player_1.color_preference.conflicts(player_2.color_preference)
         weight |= int(not (topscorer and at_least_2 and conflict))
 
         return weight
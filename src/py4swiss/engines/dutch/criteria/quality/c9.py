@@ -30,7 +30,7 @@ class C9(QualityCriterion):
         weight = DynamicUint(zero)
 
         # Only pairings between MDPs or residents count as pairs.
-        if player_2.role == PlayerRole.LOWER:
+        if bracket.get_role(player_2) == PlayerRole.LOWER:
             return weight
 
         # Since having received the same color in the two previous rounds implies a color preference side of that color,
@@ -39,7 +39,7 @@ class C9(QualityCriterion):
         # this occurs.
         topscorer = player_1.top_scorer or player_2.top_scorer
         double = player_1.color_double and player_2.color_double
-        conflict = player_1.color_preference.side == player_2.color_preference.side
+        conflict = player_1.color_preference.conflicts(player_2.color_preference)
         weight |= int(not (topscorer and double and conflict))
 
         return weight
@@ -1,7 +1,10 @@
 from py4swiss.engines.common import Pairing, PairingEngine, PairingError
 from py4swiss.engines.dutch.bracket import BracketPairer, Brackets
+from py4swiss.engines.dutch.criteria.absolute import C1, C3
 from py4swiss.engines.dutch.player import Player, get_player_infos_from_trf
 from py4swiss.engines.dutch.validity_matcher import ValidityMatcher
+from py4swiss.engines.matching import Compatibility
+from py4swiss.profiling import count, phase, sample
 from py4swiss.trf import ParsedTrf
 
 
@@ -49,30 +52,41 @@ class Engine(PairingEngine):
     @staticmethod
     def _get_bracket_pairs(bracket_pairer: BracketPairer) -> list[tuple[Player, Player]] | None:
         """Return the chosen players to be paired in the bracket."""
-        bracket_pairer.determine_heterogeneous_s1()
-        bracket_pairer.determine_heterogeneous_s2()
+        with phase("bracket_solve"):
+            bracket_pairer.determine_heterogeneous_s1()
+            bracket_pairer.determine_heterogeneous_s2()
 
-        bracket_pairer.determine_homogeneous_exchanges()
-        bracket_pairer.determine_moves_from_s1_to_s2()
-        bracket_pairer.determine_moves_from_s2_to_s1()
-        bracket_pairer.perform_homogeneous_exchanges()
-        bracket_pairer.transpose_homogeneous_s2()
+            bracket_pairer.determine_homogeneous_exchanges()
+            bracket_pairer.determine_moves_from_s1_to_s2()
+            bracket_pairer.determine_moves_from_s2_to_s1()
+            bracket_pairer.perform_homogeneous_exchanges()
+            bracket_pairer.transpose_homogeneous_s2()
 
-        if not bracket_pairer.check_completion_criterium():
-            return None
-        return bracket_pairer.get_player_pairs()
+            if not bracket_pairer.check_completion_criterium():
+                return None
+
+        with phase("color_allocation"):
+            return bracket_pairer.get_player_pairs()
 
     @classmethod
     def generate_pairings(cls, trf: ParsedTrf) -> list[Pairing]:
         """Return the round pairing of the next round for the given TRF."""
+        if trf.has_pending_results():
+            error_message = "Round can not be paired while results of previous rounds are pending"
+            raise PairingError(error_message)
+
         player_pairs = []
         round_number = min(len(section.results) for section in trf.player_sections) + 1
         initial_color = trf.x_section.configuration.first_round_color
 
-        players = get_player_infos_from_trf(trf)
-        players.sort(reverse=True)
+        with phase("player_build"):
+            players = get_player_infos_from_trf(trf)
+            players.sort(reverse=True)
 
-        validity_matcher = ValidityMatcher(players, trf.x_section.forbidden_pairs)
+        with phase("compatibility_setup"):
+            compatibility = Compatibility(players, (C1, C3), trf.x_section.forbidden_pairs)
+        with phase("validity_setup"):
+            validity_matcher = ValidityMatcher(players, compatibility)
         brackets = Brackets(players, round_number)
 
         # Check whether pairing the next round is possible.
@@ -83,10 +97,15 @@ class Engine(PairingEngine):
         # Determine bracket pairings and save the results until there are none left.
         while not brackets.is_finished():
             bracket_state = brackets.get_current_bracket()
-            bracket_pairer = BracketPairer(bracket_state, validity_matcher, initial_color)
+            count("brackets")
+            sample("bracket_sizes", len(bracket_state.mdp_list) + len(bracket_state.resident_list))
+
+            with phase("bracket_setup"):
+                bracket_pairer = BracketPairer(bracket_state, validity_matcher, initial_color)
             bracket_pairings = cls._get_bracket_pairs(bracket_pairer)
 
             if bracket_pairings is None:
+                count("collapses")
                 brackets.collapse()
             else:
                 brackets.apply_bracket_pairings(bracket_pairings)
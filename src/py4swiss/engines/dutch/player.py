@@ -4,6 +4,7 @@ from enum import Enum
 from functools import total_ordering
 from typing import TYPE_CHECKING
 
+import numpy as np
 from pydantic import BaseModel
 
 from py4swiss.engines.common import (
@@ -11,12 +12,22 @@ from py4swiss.engines.common import (
     ColorPreferenceSide,
     ColorPreferenceStrength,
     Float,
+    color_difference,
+    get_histories,
+    had_white_last,
+    last_two_same_color,
 )
-from py4swiss.trf.results import ColorToken, ResultToken
+from py4swiss.trf.results import ResultToken
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from py4swiss.engines.common import PlayerHistory
     from py4swiss.trf.parsed_trf import ParsedTrf
-    from py4swiss.trf.sections import PlayerSection, XSection
+    from py4swiss.trf.results import ResultMatrix
+
+# The results by which a player counts as having received a bye.
+BYE_RECEIVED_RESULTS = {ResultToken.PAIRING_ALLOCATED_BYE, ResultToken.FORFEIT_WIN}
 
 
 class PlayerRole(int, Enum):
@@ -42,11 +53,11 @@ class Player(BaseModel):
         color_double (bool): Whether the previous two played rounds of the player were played with the same color
         float_1 (Float): The float of the player from one round before
         float_2 (Float): The float of the player from two rounds before
-        opponents (set[int]): The IDs of the players against which the player already has a played game against
-        colors (list[bool): A list of whether the player had the white pieces or not in their played games
+        opponents (int): A bitset over the IDs of the players against which the player already has a played game
+        colors (int): A bitset over the played games of the player in order, set for games with the white pieces
+        games (int): The number of played games of the player
         bye_received (bool): Whether the player already had a bye or forfeit win
         top_scorer (bool): Whether the player is a topscorer
-        role: (PlayerRole): The role of the player in the current bracket (bracket context only)
 
     """
 
@@ -59,13 +70,12 @@ class Player(BaseModel):
     color_double: bool
     float_1: Float
     float_2: Float
-    opponents: set[int]
-    colors: list[bool]
+    opponents: int
+    colors: int
+    games: int
     bye_received: bool
     top_scorer: bool
 
-    role: PlayerRole = PlayerRole.RESIDENT
-
     def __lt__(self, other: Player) -> bool:
         """Check whether the latter player ranks higher than the former one."""
         # FIDE handbook: "A.2 Order"
@@ -90,27 +100,12 @@ class Player(BaseModel):
         return hash(self.id)
 
 
-def _get_points_list(section: PlayerSection, x_section: XSection) -> list[int]:
-    """Return a list of points of the given player after each round (including acceleration)."""
-    round_results = section.results
-    accelerations = x_section.accelerations.get(section.starting_number, [])
-    accelerations += (len(round_results) - len(accelerations) + 1) * [0]
-
-    points_list = []
-    current_points = 0
-
-    for result, acceleration in zip(round_results, accelerations, strict=False):
-        points_list.append(current_points + acceleration)
-        current_points += x_section.scoring_point_system.get_points_times_ten(result)
-    points_list.append(current_points + accelerations[len(round_results)])
-
-    return points_list
-
-
-def _get_color_preference(section: PlayerSection) -> tuple[ColorPreference, int, bool]:
-    """Return the color preference and color difference of the given player."""
-    colors = [round_result.color for round_result in section.results if round_result.result.is_played()]
+def _get_color_preference(history: PlayerHistory) -> tuple[ColorPreference, int, bool]:
+    """
+    Return the color preference, color difference and whether the last two played games had the same color.
 
+    The player is given by their played games.
+    """
     # FIDE handbook: "A.6 Colour differences and colour preferences"
     # The colour difference of a player is the number of games played with white minus the number of games played with
     # black by this player.
@@ -126,33 +121,31 @@ def _get_color_preference(section: PlayerSection) -> tuple[ColorPreference, int,
     #    the colour with respect to the previous game he played.
     # d. Players who did not play any games have no colour preference (the preference of their opponents is granted).
 
-    whites = colors.count(ColorToken.WHITE)
-    blacks = colors.count(ColorToken.BLACK)
-    difference = whites - blacks
-    double = len(colors) > 1 and len(set(colors[-2:])) == 1
+    difference = color_difference(history)
+    double = last_two_same_color(history)
 
     if difference > 0:
         side = ColorPreferenceSide.BLACK
     elif difference < 0:
         side = ColorPreferenceSide.WHITE
-    elif bool(colors):
-        side = ColorPreferenceSide.WHITE if colors[-1] == ColorToken.BLACK else ColorPreferenceSide.BLACK
+    elif history.games > 0:
+        side = ColorPreferenceSide.BLACK if had_white_last(history) else ColorPreferenceSide.WHITE
     else:
         side = ColorPreferenceSide.NONE
 
     if abs(difference) > 1 or double:
-        return ColorPreference(side=side, strength=ColorPreferenceStrength.ABSOLUTE), difference, double
+        return ColorPreference.get(side, ColorPreferenceStrength.ABSOLUTE), difference, double
     if abs(difference) == 1:
-        return ColorPreference(side=side, strength=ColorPreferenceStrength.STRONG), difference, double
+        return ColorPreference.get(side, ColorPreferenceStrength.STRONG), difference, double
     if side != ColorPreferenceSide.NONE:
-        return ColorPreference(side=side, strength=ColorPreferenceStrength.MILD), difference, double
-    return ColorPreference(side=side, strength=ColorPreferenceStrength.NONE), difference, double
+        return ColorPreference.get(side, ColorPreferenceStrength.MILD), difference, double
+    return ColorPreference.get(side, ColorPreferenceStrength.NONE), difference, double
 
 
-def _get_floats(section: PlayerSection, round_number: int, points_list_dict: dict[int, list[int]]) -> Float:
-    """Return the float of the given player in the round with the given number."""
+def _get_floats(result_matrix: ResultMatrix, points_lists: npt.NDArray[np.int64], round_number: int) -> list[Float]:
+    """Return the floats of all players in the round with the given number."""
     if round_number < 0:
-        return Float.NONE
+        return len(result_matrix.starting_numbers) * [Float.NONE]
 
     # FIDE handbook: "A.4 Floaters and floats"
     # a. A downfloater is a player who remains unpaired in a bracket, and is thus moved to the next bracket. In the
@@ -161,69 +154,61 @@ def _get_floats(section: PlayerSection, round_number: int, points_list_dict: dic
     #    downfloat, the lower one an upfloat.
     #    A player who, for whatever reason, does not play in a round, also receives a downfloat.
 
-    player_point_list = points_list_dict[section.starting_number]
-    round_result = section.results[round_number]
-
-    if not round_result.result.is_played():
-        return Float.DOWN
-
-    opponent_point_list = points_list_dict[round_result.id]
-    player_points = player_point_list[round_number]
-    opponent_points = opponent_point_list[round_number]
+    player_points = points_lists[:, round_number]
+    opponent_points = points_lists[result_matrix.indices[:, round_number], round_number]
+    floats = np.where(result_matrix.played[:, round_number], np.sign(opponent_points - player_points), Float.DOWN)
 
-    if player_points > opponent_points:
-        return Float.DOWN
-    if player_points < opponent_points:
-        return Float.UP
-    return Float.NONE
+    return [Float(value) for value in floats.tolist()]
 
 
 def get_player_infos_from_trf(trf: ParsedTrf) -> list[Player]:
     """Return a list of all player related information relevant for pairing."""
     players = []
     sections = trf.player_sections
-    points_list_dict = {section.starting_number: _get_points_list(section, trf.x_section) for section in sections}
+    result_matrix = trf.get_result_matrix()
+    points_lists = result_matrix.get_points_lists(trf.x_section.scoring_point_system, trf.x_section.accelerations)
 
     round_number = min(len(player.results) for player in sections)
     max_score = max(trf.x_section.scoring_point_system.score_dict.values()) * round_number
     last_round = round_number == trf.x_section.number_of_rounds - 1
-    sections = [player for player in sections if len(player.results) == round_number]
-    sections = [player for player in sections if player.starting_number not in trf.x_section.zeroed_ids]
-
-    for i, section in enumerate(sections):
+    rows = [
+        row
+        for row, section in enumerate(sections)
+        if len(section.results) == round_number and section.starting_number not in trf.x_section.zeroed_ids
+    ]
+
+    float_1_list = _get_floats(result_matrix, points_lists, round_number - 1)
+    float_2_list = _get_floats(result_matrix, points_lists, round_number - 2)
+    points_list = points_lists[:, round_number].tolist()
+    bye_received_list = np.any(result_matrix.get_mask(BYE_RECEIVED_RESULTS), axis=1).tolist()
+    histories = get_histories(result_matrix)
+
+    for i, row in enumerate(rows):
+        section = sections[row]
+        history = histories[row]
         number = i + 1 if trf.x_section.configuration.by_rank else section.starting_number
 
-        color_preference, color_difference, color_double = _get_color_preference(section)
-        float_1 = _get_floats(section, round_number - 1, points_list_dict)
-        float_2 = _get_floats(section, round_number - 2, points_list_dict)
-
-        white = ColorToken.WHITE
-        opponents = {round_result.id for round_result in section.results if round_result.result.is_played()}
-        colors = [round_result.color == white for round_result in section.results if round_result.result.is_played()]
-        results = {round_result.result for round_result in section.results}
-
-        pairing_allocated_bye = ResultToken.PAIRING_ALLOCATED_BYE in results
-        forfeit_win = ResultToken.FORFEIT_WIN in results
-        bye_received = pairing_allocated_bye or forfeit_win
+        color_preference, difference, double = _get_color_preference(history)
 
         # FIDE handbook: "A.7 Topscorers"
         # Topscorers are players who have a score of over 50% of the maximum possible score when pairing the final round
         # of the tournament.
-        top_scorer = last_round and (points_list_dict[section.starting_number][-1] > max_score / 2)
+        top_scorer = last_round and (points_list[row] > max_score / 2)
 
         player = Player(
             id=section.starting_number,
             number=number,
             points=section.points_times_ten,
-            points_with_acceleration=points_list_dict[section.starting_number][-1],
+            points_with_acceleration=points_list[row],
             color_preference=color_preference,
-            color_difference=color_difference,
-            color_double=color_double,
-            float_1=float_1,
-            float_2=float_2,
-            opponents=opponents,
-            colors=colors,
-            bye_received=bye_received,
+            color_difference=difference,
+            color_double=double,
+            float_1=float_1_list[row],
+            float_2=float_2_list[row],
+            opponents=history.opponents,
+            colors=history.colors,
+            games=history.games,
+            bye_received=bye_received_list[row],
             top_scorer=top_scorer,
         )
         players.append(player)
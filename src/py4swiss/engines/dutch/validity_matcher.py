@@ -1,12 +1,14 @@
-from py4swiss.engines.dutch.criteria.absolute import C1, C2, C3
+from py4swiss.engines.dutch.criteria.absolute import C2
 from py4swiss.engines.dutch.player import Player
+from py4swiss.engines.matching import Compatibility
 from py4swiss.matching_computer import ComputerDutchValidity
+from py4swiss.profiling import count, phase, record, solve
 
 
 class ValidityMatcher:
     """A class used to determine whether the current choice of pairings allows completion of the round-pairing."""
 
-    def __init__(self, players: list[Player], forbidden_pairs: set[tuple[int, int]]) -> None:
+    def __init__(self, players: list[Player], compatibility: Compatibility[Player]) -> None:
         """
         Set up a new matching computer.
 
@@ -14,10 +16,11 @@ class ValidityMatcher:
         whether they are allowed to be paired with each other or not.
         """
         self._players: list[Player] = players
-        self._forbidden_pairs: set[tuple[int, int]] = forbidden_pairs
+        self._compatibility: Compatibility[Player] = compatibility
 
         self._len: int = len(players) + len(players) % 2
         self._computer: ComputerDutchValidity = ComputerDutchValidity(self._len, 1)
+        record(self._computer)
         self._index_dict: dict[Player, int] = {player: i for i, player in enumerate(self._players)}
 
         self._set_up_computer()
@@ -43,17 +46,18 @@ class ValidityMatcher:
                 allowed = C2.evaluate(player, player)
                 self._computer.set_edge_weight(i, len(self._players), int(allowed))
 
+        count("edge_updates", self._len * (self._len - 1) // 2)
+
     def is_allowed_pair(self, player_1: Player, player_2: Player) -> bool:
         """Check whether the given players are allowed to be paired together."""
-        if bool({(player_1.id, player_2.id), (player_2.id, player_1.id)} & self._forbidden_pairs):
-            return False
-        return C1.evaluate(player_1, player_2) and C3.evaluate(player_1, player_2)
+        return self._compatibility.is_allowed_pair(player_1, player_2)
 
     def finalize_match(self, player_1: Player, player_2: Player) -> None:
         """Finalize the fact that the given players will be paired with one another."""
         i = self._index_dict[player_1]
         j = self._index_dict[player_2]
 
+        count("edge_updates", 2 * self._len)
         for k in range(self._len):
             self._computer.set_edge_weight(i, k, 0)
             self._computer.set_edge_weight(j, k, 0)
@@ -67,5 +71,6 @@ class ValidityMatcher:
         This means that the absolute criteria C.1, C.2, and C.3 need to be adhered to whilst still pairing each player
         to exactly one other player.
         """
-        self._computer.compute_matching()
-        return all(i != j for i, j in enumerate(self._computer.get_matching()))
+        with phase("validity_check"), solve(self._computer):
+            self._computer.compute_matching()
+            return all(i != j for i, j in enumerate(self._computer.get_matching()))
@@ -1,5 +1,7 @@
 from py4swiss.engines.matching.absolute_criterion import AbsoluteCriterion
 from py4swiss.engines.matching.color_criterion import ColorCriterion
+from py4swiss.engines.matching.compatibility import Compatibility
+from py4swiss.engines.matching.masks import absolute_color_masks, opponent_masks
 from py4swiss.engines.matching.matcher import Matcher
 from py4swiss.engines.matching.player_protocol import PlayerProtocol
 from py4swiss.engines.matching.quality_criterion import QualityCriterion
@@ -8,8 +10,11 @@ from py4swiss.engines.matching.state_protocol import StateProtocol
 __all__ = [
     "AbsoluteCriterion",
     "ColorCriterion",
+    "Compatibility",
     "Matcher",
     "PlayerProtocol",
     "QualityCriterion",
     "StateProtocol",
+    "absolute_color_masks",
+    "opponent_masks",
 ]
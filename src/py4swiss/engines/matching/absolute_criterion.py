@@ -14,3 +14,21 @@ class AbsoluteCriterion(ABC, Generic[P]):
     def evaluate(cls, player_1: P, player_2: P) -> bool:
         """Check whether pairing the given players suffices the absolute criterion."""
         pass  # pragma: no cover
+
+    @classmethod
+    def get_masks(cls, players: list[P]) -> list[int]:
+        """
+        Return a bitmask for each of the given players containing the players it may be paired with.
+
+        The i-th bit of each bitmask refers to the i-th of the given players. By default, the criterion is evaluated for
+        each pair of players. Criteria allowing for a more efficient computation can override this.
+        """
+        masks = [0] * len(players)
+
+        for i, player_1 in enumerate(players):
+            for j, player_2 in enumerate(players[i + 1 :], start=i + 1):
+                if cls.evaluate(player_1, player_2):
+                    masks[i] |= 1 << j
+                    masks[j] |= 1 << i
+
+        return masks
@@ -0,0 +1,48 @@
+from collections.abc import Sequence
+from typing import Generic, TypeVar
+
+from py4swiss.engines.matching.absolute_criterion import AbsoluteCriterion
+from py4swiss.engines.matching.player_protocol import PlayerProtocol
+
+P = TypeVar("P", bound=PlayerProtocol)
+
+
+class Compatibility(Generic[P]):
+    """
+    A class containing which players are allowed to be paired with each other.
+
+    Two players are allowed to be paired with each other, if they comply with all given absolute criteria and do not
+    form a forbidden pair. Since this does not depend on the bracket, it is determined only once for all players of a
+    round and can then be shared between all matchers of the round.
+
+    The result is stored as one bitmask per player, the i-th bit of which indicates whether the player is allowed to be
+    paired with the i-th player. Each criterion contributes its bitmasks at once (see 'AbsoluteCriterion.get_masks'),
+    such that most criteria do not need to be evaluated for each pair of players.
+    """
+
+    def __init__(
+        self,
+        players: list[P],
+        absolute_criteria: Sequence[type[AbsoluteCriterion[P]]],
+        forbidden_pairs: set[tuple[int, int]],
+    ) -> None:
+        """Determine for each pair of the given players whether they are allowed to be paired with each other."""
+        self._index_dict: dict[P, int] = {player: i for i, player in enumerate(players)}
+
+        full_mask = (1 << len(players)) - 1
+        self._masks: list[int] = [full_mask & ~(1 << i) for i in range(len(players))]
+
+        for criterion in absolute_criteria:
+            for i, mask in enumerate(criterion.get_masks(players)):
+                self._masks[i] &= mask
+
+        id_dict = {player.id: i for i, player in enumerate(players)}
+        for id_1, id_2 in forbidden_pairs:
+            index_1, index_2 = id_dict.get(id_1), id_dict.get(id_2)
+            if index_1 is not None and index_2 is not None:
+                self._masks[index_1] &= ~(1 << index_2)
+                self._masks[index_2] &= ~(1 << index_1)
+
+    def is_allowed_pair(self, player_1: P, player_2: P) -> bool:
+        """Check whether the given players are allowed to be paired together."""
+        return bool(self._masks[self._index_dict[player_1]] >> self._index_dict[player_2] & 1)
@@ -0,0 +1,66 @@
+from collections.abc import Sequence
+from typing import Protocol
+
+from py4swiss.engines.common import (
+    ColorPreference,
+    ColorPreferenceStrength,
+    PlayerHistory,
+    get_opponents,
+)
+from py4swiss.engines.common.color_preference import get_strength_code
+
+
+class HistoryPlayer(PlayerHistory, Protocol):
+    """Protocol representing a player with an ID as well as packed played games."""
+
+    id: int
+
+
+class ColorPlayer(Protocol):
+    """Protocol representing a player with a color preference."""
+
+    color_preference: ColorPreference
+
+
+def opponent_masks(players: Sequence[HistoryPlayer]) -> list[int]:
+    """
+    Return a bitmask for each of the given players containing the players it has not played against yet.
+
+    The i-th bit of each bitmask refers to the i-th of the given players.
+    """
+    index_dict = {player.id: i for i, player in enumerate(players)}
+    masks = [0] * len(players)
+
+    for i, player in enumerate(players):
+        for opponent in get_opponents(player):
+            j = index_dict.get(opponent)
+            if j is not None:
+                masks[i] |= 1 << j
+                masks[j] |= 1 << i
+
+    full_mask = (1 << len(players)) - 1
+    return [full_mask & ~mask for mask in masks]
+
+
+def absolute_color_masks(players: Sequence[ColorPlayer], exempt: Sequence[bool] | None = None) -> list[int]:
+    """
+    Return a bitmask for each of the given players containing the players it may meet according to its color preference.
+
+    The i-th bit of each bitmask refers to the i-th of the given players. Two players with the same absolute color
+    preference may not meet, unless at least one of them is marked as exempt.
+    """
+    codes = [player.color_preference.code for player in players]
+    exempt = exempt or [False] * len(players)
+    absolute_masks: dict[int, int] = {}
+    is_absolute = [
+        not is_exempt and get_strength_code(code) == ColorPreferenceStrength.ABSOLUTE
+        for code, is_exempt in zip(codes, exempt, strict=True)
+    ]
+
+    # Two color preferences are the same, if and only if their codes are.
+    for i, code in enumerate(codes):
+        if is_absolute[i]:
+            absolute_masks[code] = absolute_masks.get(code, 0) | 1 << i
+
+    full_mask = (1 << len(players)) - 1
+    return [full_mask & ~absolute_masks[code] if is_absolute[i] else full_mask for i, code in enumerate(codes)]
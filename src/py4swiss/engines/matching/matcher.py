@@ -3,25 +3,31 @@ from typing import Generic, TypeVar
 
 from py4swiss.dynamicuint import DynamicUint
 from py4swiss.engines.common import ColorPreferenceSide, PairingError
-from py4swiss.engines.matching.absolute_criterion import AbsoluteCriterion
 from py4swiss.engines.matching.color_criterion import ColorCriterion
+from py4swiss.engines.matching.compatibility import Compatibility
 from py4swiss.engines.matching.player_protocol import PlayerProtocol
 from py4swiss.engines.matching.quality_criterion import QualityCriterion
 from py4swiss.engines.matching.state_protocol import StateProtocol
 from py4swiss.matching_computer import ComputerDutchOptimality
+from py4swiss.profiling import count, record, solve
 
 P = TypeVar("P", bound=PlayerProtocol)
 S = TypeVar("S", bound=StateProtocol)
 
 
-class Matcher(Generic[P]):
-    """A class aiding in the pairing process for a bracket."""
+class Matcher(Generic[P, S]):
+    """
+    A class aiding in the pairing process for a bracket.
+
+    The same instance can be reset for the following brackets of a round. As long as the weight layout stays the same,
+    the matching computer is kept in that case and only the affected edges are updated.
+    """
 
     def __init__(
         self,
         players: list[P],
         state: S,
-        absolute_criteria: Sequence[type[AbsoluteCriterion[P]]],
+        compatibility: Compatibility[P],
         quality_criteria: Sequence[type[QualityCriterion[P, S]]],
         color_criteria: Sequence[type[ColorCriterion[P, S]]],
         extra_bits: int,
@@ -30,34 +36,54 @@ class Matcher(Generic[P]):
         Set up a new matching computer.
 
         The included graph contains exactly one vertex for each player and edges with weights between according to the
-        absolute and quality criteria.
+        compatibility and the quality criteria.
         """
         self._players: list[P] = players
         self._state: S = state
-        self._absolute_criteria: Sequence[type[AbsoluteCriterion[P]]] = absolute_criteria
+        self._compatibility: Compatibility[P] = compatibility
         self._quality_criteria: Sequence[type[QualityCriterion[P, S]]] = quality_criteria
         self._color_critera: Sequence[type[ColorCriterion[P, S]]] = color_criteria
         self._extra_bits: int = extra_bits
 
+        self._inactive_players: set[P] = set()
+        self._modified_edges: set[tuple[int, int]] = set()
+
+        self.matching: dict[P, P] = {}
+        self._set_up()
+
+    def _set_up(self) -> None:
+        """Set up a new matching computer for the current players and state."""
         self._max_weight: DynamicUint = self._get_max_weight()
         self._zero_weight: DynamicUint = self._max_weight & 0
+        self._shifts: list[int] = [criterion.get_shift(self._state) for criterion in self._quality_criteria]
+        self._inactive_weight: DynamicUint = self._get_inactive_weight()
 
         self._len: int = len(self._players)
         self._index_dict_reverse: dict[int, P] = dict(enumerate(self._players))
         self._index_dict: dict[P, int] = {player: i for i, player in self._index_dict_reverse.items()}
+        self._active_indices: list[int] = list(range(self._len))
+        self._modified_edges = set()
 
         self._computer: ComputerDutchOptimality = ComputerDutchOptimality(self._len, self._max_weight)
+        record(self._computer)
         self._weights: list[list[DynamicUint]] = [[self._zero_weight] * self._len for _ in range(self._len)]
 
-        self.matching: dict[P, P] = {}
         self._set_up_computer()
+        self._check_completion()
+
+    def _check_completion(self) -> None:
+        """Compute a matching and check whether the round pairing can be completed."""
         self.update_matching()
 
-        # Check whether the round pairing can be completed.
-        if not all(i != j for i, j in enumerate(self._computer.get_matching())):
+        if not all(player_1 != player_2 for player_1, player_2 in self.matching.items()):
             error_message = "Round can not be paired."
             raise PairingError(error_message)
 
+    @property
+    def state(self) -> S:
+        """Return the state for which the edge weights were determined."""
+        return self._state
+
     def _get_index(self, player: P) -> int:
         """Return the vertex index of the given player."""
         return self._index_dict[player]
@@ -80,8 +106,8 @@ class Matcher(Generic[P]):
         if not bool(weight):
             return
 
-        weight &= 0
-        self._computer.set_edge_weight(i, j, weight)
+        self._set_weight(i, j, self._zero_weight)
+        self._modified_edges.add((min(i, j), max(i, j)))
 
     def _get_max_weight(self) -> DynamicUint:
         """
@@ -110,35 +136,39 @@ class Matcher(Generic[P]):
 
         return weight
 
+    def _get_inactive_weight(self) -> DynamicUint:
+        """Return the weight of an edge between inactive players, i.e. with all quality criteria weights being zero."""
+        weight = DynamicUint(self._zero_weight)
+        weight.set_bit(sum(self._shifts) + self._extra_bits)
+        return weight
+
     def _get_weight(self, player_1: P, player_2: P) -> DynamicUint:
         """Return a weight containing all quality criteria."""
         weight = DynamicUint(self._zero_weight)
 
         # Only players that can be paired with each other according to the absolute criteria get an edge.
-        if not self._is_allowed_pair(player_1, player_2):
+        if not self._compatibility.is_allowed_pair(player_1, player_2):
             return weight
 
+        # The quality criteria do not need to be evaluated for edges between inactive players.
+        if player_1 in self._inactive_players and player_2 in self._inactive_players:
+            return DynamicUint(self._inactive_weight)
+
         # Give each edge a weight to maximize the number of matched pairs.
-        weight |= 1
+        fields: list[tuple[DynamicUint | int, int]] = [(1, 0)]
 
         # Add the individual quality criteria weights from most important to least important and shift in order to not
         # overwrite any previously set bits. The shift amount is such that, even for the sum of all weights of a given
         # round pairing, the values of a quality criterion with lower importance can not overflow to parts reserved for
         # a criterion with higher importance.
-        for criterion in self._quality_criteria:
-            weight <<= criterion.get_shift(self._state)
-            weight += criterion.get_weight(player_1, player_2, self._zero_weight, self._state)
+        for criterion, shift in zip(self._quality_criteria, self._shifts, strict=True):
+            fields.append((criterion.get_weight(player_1, player_2, self._zero_weight, self._state), shift))
 
         # Extra bits
-        weight <<= self._extra_bits
-
-        return weight
+        fields.append((0, self._extra_bits))
 
-    def _is_allowed_pair(self, player_1: P, player_2: P) -> bool:
-        """Check whether the given players are allowed to be paired together."""
-        if bool({(player_1.id, player_2.id), (player_2.id, player_1.id)} & self._state.forbidden_pairs):
-            return False
-        return all(criterion.evaluate(player_1, player_2) for criterion in self._absolute_criteria)
+        # All fields are combined in a single call instead of shifting and adding each of them separately.
+        return self._zero_weight.pack(fields)
 
     def _set_up_computer(self) -> None:
         """Initialize the graph with a vertex for each player as well as edges with weights between them."""
@@ -150,6 +180,60 @@ class Matcher(Generic[P]):
                 weight = self._get_weight(player_1, player_2)
                 self._set_weight(i, i + j + 1, weight)
 
+        count("edge_updates", self._len * (self._len - 1) // 2)
+
+    def reset(
+        self, players: list[P], state: S, extra_bits: int, inactive_players: set[P], changed_players: set[P]
+    ) -> None:
+        """
+        Prepare the matcher for the given players and state, e.g. for the next bracket of the same round.
+
+        The given players need to be a subset of the players of the compatibility. The quality criteria weights of edges
+        between any two of the given inactive players need to be zero for the given state. Furthermore, the given
+        changed players need to contain all players whose edge weights differ between the previous and the given state.
+
+        If the weight layout of the given state is the same as before and all given players already have a vertex, the
+        matching computer is kept. All edges of players which are not given anymore are removed and only the edges of
+        the changed players as well as the ones modified since the last reset are updated. Otherwise, a new matching
+        computer is set up for the given players.
+        """
+        shifts = [criterion.get_shift(state) for criterion in self._quality_criteria]
+        self._state = state
+        self._inactive_players = inactive_players
+
+        if shifts != self._shifts or extra_bits != self._extra_bits or not all(p in self._index_dict for p in players):
+            self._players = players
+            self._extra_bits = extra_bits
+            self._set_up()
+            return
+
+        active_indices = sorted(self._get_index(player) for player in players)
+        removed_indices = set(self._active_indices).difference(active_indices)
+
+        # Players which are not part of the given players anymore, e.g. since they were paired in the previous bracket,
+        # keep their vertex, but lose all of their edges.
+        for i in removed_indices:
+            for k in self._active_indices:
+                self._remove_weight(i, k)
+
+        # Since the weights of edges between players of the same role only depend on the weight layout, only edges of
+        # players whose role changed as well as edges modified by the pairing process of the previous bracket need to be
+        # updated.
+        changed_indices = {self._get_index(player) for player in changed_players}
+        edges = {(min(i, k), max(i, k)) for i in changed_indices for k in active_indices if i != k}
+        edges |= {(i, j) for i, j in self._modified_edges if i not in removed_indices and j not in removed_indices}
+
+        # The order of the players matters for the evaluation of the quality criteria.
+        count("edge_updates", len(edges))
+        for i, j in edges:
+            weight = self._get_weight(self._get_player(i), self._get_player(j))
+            if weight != self._weights[i][j]:
+                self._set_weight(i, j, weight)
+
+        self._active_indices = active_indices
+        self._modified_edges = set()
+        self._check_completion()
+
     def add_to_weight(self, player_1: P, player_2: P, value: int) -> None:
         """Add the given integer value to the edge weight between the given players."""
         i, j = self._get_index(player_1), self._get_index(player_2)
@@ -158,12 +242,15 @@ class Matcher(Generic[P]):
         if not bool(self._weights[i][j]):
             return
 
-        # Since weights can not be negative, the sign of the given value needs to be taken special care of.
-        weight = self._zero_weight | abs(value)
+        # Since weights can not be negative, the sign of the given value needs to be taken special care of. Note that the
+        # stored weight is copied, since it is shared between both directions of the edge.
+        weight = DynamicUint(self._weights[i][j])
         if value > 0:
-            self._set_weight(i, j, self._weights[i][j] + weight)
+            weight.add_at(value, 0)
         else:
-            self._set_weight(i, j, self._weights[i][j] - weight)
+            weight.subtract_at(-value, 0)
+        self._set_weight(i, j, weight)
+        self._modified_edges.add((min(i, j), max(i, j)))
 
     def add_to_weights(self, player: P, player_list: list[P], value: int, increment: bool = False) -> None:
         """
@@ -171,6 +258,7 @@ class Matcher(Generic[P]):
 
         The value can optionally be incremented by 1 after each addition.
         """
+        count("edge_updates", len(player_list))
         for other in player_list:
             self.add_to_weight(player, other, value)
             value += int(increment)
@@ -182,15 +270,17 @@ class Matcher(Generic[P]):
 
     def remove_weights(self, player: P, player_list: list[P]) -> None:
         """Remove each edge between the given player and any player in the given list."""
+        count("edge_updates", len(player_list))
         for other in player_list:
             self.remove_weight(player, other)
 
     def update_matching(self) -> None:
         """Compute a new matching efficiently by only considering vertices which were marked as updated."""
-        self._computer.compute_matching()
+        with solve(self._computer):
+            self._computer.compute_matching()
         matching = self._computer.get_matching()
 
-        self.matching = {self._get_player(i): self._get_player(j) for i, j in enumerate(matching)}
+        self.matching = {self._get_player(i): self._get_player(matching[i]) for i in self._active_indices}
 
     def finalize_match(self, player_1: P, player_2: P) -> None:
         """Finalize the fact that the given player are to be paired with one another."""
@@ -198,10 +288,12 @@ class Matcher(Generic[P]):
 
         # Removing all edges between the given players and any other players besides one another will force the matching
         # algorithm to match the given players with each other.
+        count("edge_updates", 2 * self._len + 1)
         for k in range(self._len):
             self._remove_weight(i, k)
             self._remove_weight(j, k)
         self._set_weight(i, j, self._max_weight)
+        self._modified_edges.add((min(i, j), max(i, j)))
 
     def get_player_pair(self, player_1: P, player_2: P) -> tuple[P, P]:
         """
@@ -0,0 +1,53 @@
+from importlib.metadata import EntryPoint, entry_points
+
+from py4swiss.engines.common import PairingEngine
+
+ENTRY_POINT_GROUP = "py4swiss.engines"
+
+# The built-in engines are declared as entry points of this package as well. They are listed here again such that they
+# remain available when running from a source tree without installed package metadata.
+_BUILTIN_ENGINES = {
+    "burstein": "py4swiss.engines.burstein:Engine",
+    "dubov": "py4swiss.engines.dubov:Engine",
+    "dutch": "py4swiss.engines.dutch:Engine",
+}
+
+
+def _get_entry_points() -> dict[str, EntryPoint]:
+    """Return a map from engine name to the entry point of the engine for all available engines."""
+    engine_entry_points = {
+        name: EntryPoint(name=name, value=value, group=ENTRY_POINT_GROUP) for name, value in _BUILTIN_ENGINES.items()
+    }
+
+    # Registered engines take precedence over the built-in fallbacks.
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        engine_entry_points[entry_point.name] = entry_point
+
+    return engine_entry_points
+
+
+def get_engine_names() -> list[str]:
+    """Return the names of all available pairing engines in alphabetical order."""
+    return sorted(_get_entry_points())
+
+
+def get_engine(name: str) -> type[PairingEngine]:
+    """
+    Return the pairing engine with the given name.
+
+    Only the module of the requested engine is imported. Engines of other packages can be made available by declaring an
+    entry point in the group 'py4swiss.engines' which refers to a subclass of 'PairingEngine'.
+    """
+    engine_entry_points = _get_entry_points()
+
+    if name not in engine_entry_points:
+        error_message = f"Invalid pairing engine '{name}'"
+        raise ValueError(error_message)
+
+    engine = engine_entry_points[name].load()
+
+    if not isinstance(engine, type) or not issubclass(engine, PairingEngine):
+        error_message = f"Entry point of pairing engine '{name}' does not refer to a pairing engine"
+        raise TypeError(error_message)
+
+    return engine
@@ -1,22 +1,35 @@
 import argparse
+import sys
+from contextlib import ExitStack
 from pathlib import Path
-from typing import TYPE_CHECKING
 
-from py4swiss.engines import BursteinEngine, DubovEngine, DutchEngine
+from py4swiss.engines import get_engine, get_engine_names
+from py4swiss.engines.common import PairingFormat
+from py4swiss.standings import Tiebreak
 from py4swiss.trf import TrfParser
 
-if TYPE_CHECKING:
-    from py4swiss.engines.common import PairingEngine
+# Caching, profiling, verification and the standings are only imported by the commands and options using them, such
+# that they do not contribute to the startup time of pairing a round (see 'py4swiss.engines').
 
 
 def parse_args() -> argparse.Namespace:
     """Parse the provided arguments."""
     parser = argparse.ArgumentParser(
         prog="py4swiss",
+        description=(
+            "Produce a round pairing for the specified Swiss tournament TRF, verify all published rounds or compute the "
+            "standings."
+        ),
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    pair_parser = subparsers.add_parser(
+        "pair",
+        help="produce a round pairing for the next round (default)",
         description="Produce a round pairing for the specified Swiss tournament TRF.",
     )
 
-    parser.add_argument(
+    pair_parser.add_argument(
         "-t",
         "--trf",
         type=Path,
@@ -24,15 +37,15 @@ def parse_args() -> argparse.Namespace:
         help="path to the Swiss tournament TRF file containing the tournament standings",
     )
 
-    parser.add_argument(
+    pair_parser.add_argument(
         "-e",
         "--engine",
         type=str,
         default="dutch",
-        help="pairing engine used to generate the pairings (default: dutch)",
+        help=f"pairing engine used to generate the pairings, one of {', '.join(get_engine_names())} (default: dutch)",
     )
 
-    parser.add_argument(
+    pair_parser.add_argument(
         "-p",
         "--pairings",
         type=Path,
@@ -40,32 +53,230 @@ def parse_args() -> argparse.Namespace:
         help="path to the output file containing the round pairing (default: pairings.txt)",
     )
 
-    parser.add_argument(
+    pair_parser.add_argument(
+        "-f",
+        "--format",
+        type=PairingFormat,
+        default=None,
+        help=(
+            f"format of the output file containing the round pairing, one of "
+            f"{', '.join(pairing_format.value for pairing_format in PairingFormat)} (default: suffix of the file)"
+        ),
+    )
+
+    pair_parser.add_argument(
+        "-o",
+        "--trf-output",
+        type=Path,
+        default=None,
+        help="path to an output file for the TRF with the round pairing added as a new round with pending results",
+    )
+
+    pair_parser.add_argument(
+        "-s",
+        "--strict",
+        action="store_true",
+        help="enable strict parsing mode (raise errors on malformed lines in the TRF)",
+    )
+
+    pair_parser.add_argument(
+        "--cache",
+        type=Path,
+        default=None,
+        help="path to a directory for caching round pairings of previously paired tournament states",
+    )
+
+    pair_parser.add_argument(
+        "--profile",
+        type=Path,
+        default=None,
+        help="path to an output file for a JSON profile containing timings and counters of the pairing run",
+    )
+
+    pair_parser.add_argument(
+        "--trace",
+        type=Path,
+        default=None,
+        help="path to an output file for a binary trace of all operations of the matching computers of the pairing run",
+    )
+
+    verify_parser = subparsers.add_parser(
+        "verify",
+        help="verify that all published rounds match the round pairings of an engine",
+        description="Verify that all published rounds of the specified Swiss tournament TRF match the round pairings.",
+    )
+
+    verify_parser.add_argument(
+        "-t",
+        "--trf",
+        type=Path,
+        required=True,
+        help="path to the Swiss tournament TRF file containing the results of all published rounds",
+    )
+
+    verify_parser.add_argument(
+        "-e",
+        "--engine",
+        type=str,
+        default="dutch",
+        help=f"pairing engine used to verify the pairings, one of {', '.join(get_engine_names())} (default: dutch)",
+    )
+
+    verify_parser.add_argument(
+        "-s",
+        "--strict",
+        action="store_true",
+        help="enable strict parsing mode (raise errors on malformed lines in the TRF)",
+    )
+
+    verify_parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker processes used to pair the rounds (default: number of processors)",
+    )
+
+    verify_parser.add_argument(
+        "--report",
+        type=Path,
+        default=None,
+        help="path to an output file for a JSON report containing the published and generated round pairings",
+    )
+
+    standings_parser = subparsers.add_parser(
+        "standings",
+        help="compute the ranked standings and the crosstable",
+        description="Compute the ranked standings of the specified Swiss tournament TRF.",
+    )
+
+    standings_parser.add_argument(
+        "-t",
+        "--trf",
+        type=Path,
+        required=True,
+        help="path to the Swiss tournament TRF file containing the results of all published rounds",
+    )
+
+    standings_parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=None,
+        help="path to the output file containing the standings, as JSON if it ends with .json (default: standard output)",
+    )
+
+    standings_parser.add_argument(
+        "-b",
+        "--tiebreaks",
+        type=Tiebreak,
+        nargs="*",
+        default=[Tiebreak.BUCHHOLZ, Tiebreak.SONNEBORN_BERGER],
+        help=f"tiebreaks in order of priority, any of {', '.join(tiebreak.value for tiebreak in Tiebreak)} (default: BH SB)",
+    )
+
+    standings_parser.add_argument(
+        "-c",
+        "--crosstable",
+        action="store_true",
+        help="include the crosstable entries of each player in each round",
+    )
+
+    standings_parser.add_argument(
         "-s",
         "--strict",
         action="store_true",
         help="enable strict parsing mode (raise errors on malformed lines in the TRF)",
     )
 
-    return parser.parse_args()
+    # Pairing is the default command such that the arguments of previous versions remain valid.
+    args = sys.argv[1:]
+    if not args or args[0] not in {*subparsers.choices, "-h", "--help"}:
+        args = ["pair", *args]
+
+    return parser.parse_args(args)
+
+
+def pair(args: argparse.Namespace) -> None:
+    """Generate pairings according to the provided arguments."""
+    from py4swiss.profiling import phase  # noqa: PLC0415
+
+    engine = get_engine(args.engine)
+
+    with phase("parse"):
+        trf = TrfParser.parse(args.trf, strict=args.strict)
+    with phase("pairing"):
+        if args.cache is None:
+            pairings = engine.generate_pairings(trf)
+        else:
+            from py4swiss.caching import DiskPairingCache  # noqa: PLC0415
+
+            pairings = DiskPairingCache(args.cache).generate_pairings(engine, trf)
+    with phase("write"):
+        engine.write_pairings_to_file(pairings, args.pairings, args.format)
+        if args.trf_output is not None:
+            engine.write_pairings_to_trf(pairings, trf)
+            trf.write_to_file(args.trf_output)
+
+
+def verify(args: argparse.Namespace) -> bool:
+    """Verify all published rounds according to the provided arguments and return whether all of them match."""
+    from py4swiss.verification import TournamentVerifier  # noqa: PLC0415
+
+    engine = get_engine(args.engine)
+    trf = TrfParser.parse(args.trf, strict=args.strict)
+    report = TournamentVerifier(trf).verify(engine, max_workers=args.workers)
+
+    for round_verification in report.rounds:
+        status = "ok" if round_verification.is_match else "MISMATCH"
+        if round_verification.error is not None:
+            status = f"{status} ({round_verification.error})"
+        print(f"Round {round_verification.round_number}: {status} [{round_verification.seconds:.3f}s]")
+
+    if args.report is not None:
+        args.report.parent.mkdir(exist_ok=True)
+        args.report.write_text(report.model_dump_json(indent=4), encoding="utf-8")
+
+    return not report.mismatches
+
+
+def standings(args: argparse.Namespace) -> None:
+    """Compute the standings according to the provided arguments."""
+    from py4swiss.standings import StandingsTable  # noqa: PLC0415
+
+    trf = TrfParser.parse(args.trf, strict=args.strict)
+    table = StandingsTable(trf, args.tiebreaks).get_standings(crosstable=args.crosstable)
+
+    if args.output is None:
+        print(table.to_text(), end="")
+    else:
+        table.write_to_file(args.output)
 
 
 def main() -> None:
-    """Generate pairings according to the provided specifications."""
+    """Generate or verify pairings or compute the standings according to the provided specifications."""
     args = parse_args()
 
-    engine: type[PairingEngine]
-    match args.engine:
-        case "burstein":
-            engine = BursteinEngine
-        case "dubov":
-            engine = DubovEngine
-        case "dutch":
-            engine = DutchEngine
-        case _:
-            error_message = f"Invalid pairing engine '{args.engine}'"
-            raise ValueError(error_message)
+    if args.command == "standings":
+        standings(args)
+        return
 
-    trf = TrfParser.parse(args.trf, strict=args.strict)
-    pairings = engine.generate_pairings(trf)
-    engine.write_pairings_to_file(pairings, args.pairings)
+    if args.command == "verify":
+        if not verify(args):
+            sys.exit(1)
+        return
+
+    with ExitStack() as stack:
+        profiler = None
+        if args.profile is not None:
+            from py4swiss.profiling import Profiler  # noqa: PLC0415
+
+            profiler = stack.enter_context(Profiler())
+        if args.trace is not None:
+            from py4swiss.profiling import TraceRecorder  # noqa: PLC0415
+
+            stack.enter_context(TraceRecorder(args.trace))
+        pair(args)
+
+    if profiler is not None:
+        profiler.profile.write_to_file(args.profile)
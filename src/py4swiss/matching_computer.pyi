@@ -5,6 +5,26 @@ from py4swiss.dynamicuint import DynamicUint
 
 W = TypeVar("W")
 
+class TraceWriter:
+    """
+    A class for writing the operations performed on any number of matching computers to a single binary trace file.
+
+    The trace contains every call to 'add_vertex', 'set_edge_weight' and 'compute_matching' along with the resulting
+    matchings, such that it can be replayed later on. This is implemented in its entirety in C++.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        """Create a new trace, overwriting the given file if it exists."""
+        ...
+
+    def close(self) -> None:
+        """Flush all operations to the file and close it."""
+        ...
+
+def replay(file_path: str) -> dict[str, float]:
+    """Replay the given trace on new matching computers and return the number of operations and the time spent."""
+    ...
+
 class ComputerBase(Generic[W], ABC):
     """
     A class that implements the Blossom algorithm for computing a maximum weight matching in a general graph.
@@ -62,6 +82,53 @@ class ComputerBase(Generic[W], ABC):
         """
         ...
 
+    @abstractmethod
+    def stats(self) -> dict[str, int]:
+        """
+        Return counters describing the work performed by all matching computations so far.
+
+        The counters are:
+            - computations: the number of calls to 'compute_matching'
+            - augmentations: the number of augmenting paths applied to the matching
+            - dual_adjustments: the number of nonzero adjustments of the dual variables
+            - blossoms_formed: the number of blossoms formed
+            - blossoms_expanded: the number of blossoms dissolved after their dual variable reached zero
+            - relabeled_vertices: the number of vertices with modified edge weights, summed over all computations
+            - peak_root_blossoms: the largest number of top-level blossoms existing at the same time
+            - peak_parent_blossoms: the largest number of nested blossoms existing at the same time
+        """
+        ...
+
+    @abstractmethod
+    def record(self, writer: TraceWriter) -> None:
+        """
+        Write all subsequent operations to the given trace.
+
+        Note that this needs to be called before any vertices are added to the graph.
+        """
+        ...
+
+    @abstractmethod
+    def __getstate__(self) -> tuple[int, W, int, list[tuple[int, int, W]]]:
+        """
+        Return the capacity, the maximum edge weight, the number of vertices and all edges with non-zero weights.
+
+        This allows computers to be pickled, e.g. in order to send them to other processes. A recorded trace is not part
+        of the state.
+        """
+        ...
+
+    @abstractmethod
+    def __setstate__(self, state: tuple[int, W, int, list[tuple[int, int, W]]]) -> None:
+        """
+        Restore the graph from the state returned by __getstate__() and compute a maximum weight matching for it.
+
+        Since the internal state of the matching routine is recomputed rather than restored, the matching may differ
+        from the one of the pickled computer, if there are multiple matchings of maximum weight. Any edge weights set
+        after the last call to 'compute_matching' of the pickled computer are already taken into account.
+        """
+        ...
+
 class ComputerDutchValidity(ComputerBase[int]):
     def __init__(self, size: int, edge_weight: int) -> None: ...
     def size(self) -> int: ...
@@ -69,6 +136,10 @@ class ComputerDutchValidity(ComputerBase[int]):
     def set_edge_weight(self, u: int, v: int, weight: int) -> None: ...
     def compute_matching(self) -> None: ...
     def get_matching(self) -> list[int]: ...
+    def stats(self) -> dict[str, int]: ...
+    def record(self, writer: TraceWriter) -> None: ...
+    def __getstate__(self) -> tuple[int, int, int, list[tuple[int, int, int]]]: ...
+    def __setstate__(self, state: tuple[int, int, int, list[tuple[int, int, int]]]) -> None: ...
 
 class ComputerDutchOptimality(ComputerBase[DynamicUint]):
     def __init__(self, size: int, edge_weight: DynamicUint) -> None: ...
@@ -77,3 +148,7 @@ class ComputerDutchOptimality(ComputerBase[DynamicUint]):
     def set_edge_weight(self, u: int, v: int, weight: DynamicUint) -> None: ...
     def compute_matching(self) -> None: ...
     def get_matching(self) -> list[int]: ...
+    def stats(self) -> dict[str, int]: ...
+    def record(self, writer: TraceWriter) -> None: ...
+    def __getstate__(self) -> tuple[int, DynamicUint, int, list[tuple[int, int, DynamicUint]]]: ...
+    def __setstate__(self, state: tuple[int, DynamicUint, int, list[tuple[int, int, DynamicUint]]]) -> None: ...
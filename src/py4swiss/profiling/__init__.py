@@ -0,0 +1,34 @@
+from py4swiss.profiling.profile import PhaseProfile, Profile
+from py4swiss.profiling.profiler import (
+    Profiler,
+    SupportsStats,
+    count,
+    get_profiler,
+    phase,
+    sample,
+    solve,
+)
+from py4swiss.profiling.recorder import (
+    SupportsRecord,
+    TraceRecorder,
+    get_recorder,
+    record,
+    replay_trace,
+)
+
+__all__ = [
+    "PhaseProfile",
+    "Profile",
+    "Profiler",
+    "SupportsRecord",
+    "SupportsStats",
+    "TraceRecorder",
+    "count",
+    "get_profiler",
+    "get_recorder",
+    "phase",
+    "record",
+    "replay_trace",
+    "sample",
+    "solve",
+]
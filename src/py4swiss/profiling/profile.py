@@ -0,0 +1,43 @@
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+
+class PhaseProfile(BaseModel):
+    """
+    Wall time spent in a single phase of a pairing run.
+
+    Attributes:
+        calls (int): The number of times the phase was entered
+        seconds (float): The total wall time in seconds spent in the phase
+        durations (list[float]): The wall time in seconds of each call in order
+
+    """
+
+    calls: int = 0
+    seconds: float = 0.0
+    durations: list[float] = Field(default_factory=list)
+
+
+class Profile(BaseModel):
+    """
+    Timings and counters recorded during a pairing run.
+
+    Phases may be nested, e.g. validity checks are performed while solving a bracket. The time spent in a phase thus
+    includes the time spent in any phase entered within it.
+
+    Attributes:
+        phases (dict[str, PhaseProfile]): The wall time spent in each phase
+        counters (dict[str, int]): The values of all counters, e.g. the number of solves or edge updates
+        samples (dict[str, list[int]]): Recorded values in order, e.g. the size of each bracket
+
+    """
+
+    phases: dict[str, PhaseProfile] = Field(default_factory=dict)
+    counters: dict[str, int] = Field(default_factory=dict)
+    samples: dict[str, list[int]] = Field(default_factory=dict)
+
+    def write_to_file(self, file_path: Path) -> None:
+        """Write the profile to the given file as JSON."""
+        with file_path.open("w", encoding="utf-8") as file:
+            file.write(self.model_dump_json(indent=4))
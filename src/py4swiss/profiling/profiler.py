@@ -0,0 +1,126 @@
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar, Token
+from types import TracebackType
+from typing import Protocol, Self
+
+from py4swiss.profiling.profile import PhaseProfile, Profile
+
+_ACTIVE_PROFILER: ContextVar["Profiler | None"] = ContextVar("active_profiler", default=None)
+_NULL_CONTEXT: AbstractContextManager[None] = nullcontext()
+
+
+class SupportsStats(Protocol):
+    """A protocol for matching computers reporting counters of the work they performed so far."""
+
+    def stats(self) -> dict[str, int]:
+        """Return the counters of the work performed so far."""
+        ...
+
+
+class Profiler:
+    """
+    A class for recording timings and counters reported by the pairing engines.
+
+    Instrumentation is opt-in: engines only report into a profiler while it is active, i.e. within a 'with' block.
+    Otherwise, reporting does nothing. For example:
+
+        with Profiler() as profiler:
+            engine.generate_pairings(trf)
+        profiler.profile.write_to_file(Path("profile.json"))
+    """
+
+    def __init__(self) -> None:
+        """Initialize a new profiler with an empty profile."""
+        self.profile: Profile = Profile()
+        self._tokens: list[Token[Profiler | None]] = []
+
+    def __enter__(self) -> Self:
+        """Activate the profiler for the current context."""
+        self._tokens.append(_ACTIVE_PROFILER.set(self))
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        """Restore the previously active profiler, if any."""
+        _ACTIVE_PROFILER.reset(self._tokens.pop())
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Record the wall time spent within the context as part of the phase with the given name."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            phase_profile = self.profile.phases.setdefault(name, PhaseProfile())
+            phase_profile.calls += 1
+            phase_profile.seconds += seconds
+            phase_profile.durations.append(seconds)
+
+    @contextmanager
+    def solve(self, computer: SupportsStats) -> Iterator[None]:
+        """
+        Count a matching computation performed by the given computer within the context.
+
+        Additionally, the work performed by the computer within the context is added to the counters prefixed with
+        'solver_'. Peak values are recorded as the maximum over all computations instead.
+        """
+        self.count("solves")
+        before = computer.stats()
+        try:
+            yield
+        finally:
+            after = computer.stats()
+
+            for name, value in after.items():
+                counter = f"solver_{name}"
+                if name.startswith("peak_"):
+                    self.profile.counters[counter] = max(self.profile.counters.get(counter, 0), value)
+                else:
+                    self.count(counter, value - before[name])
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Add the given value to the counter with the given name."""
+        self.profile.counters[name] = self.profile.counters.get(name, 0) + value
+
+    def sample(self, name: str, value: int) -> None:
+        """Record the given value for the samples with the given name."""
+        self.profile.samples.setdefault(name, []).append(value)
+
+
+def get_profiler() -> Profiler | None:
+    """Return the profiler active in the current context, if any."""
+    return _ACTIVE_PROFILER.get()
+
+
+def phase(name: str) -> AbstractContextManager[None]:
+    """Record the wall time spent within the context with the active profiler, if any."""
+    profiler = _ACTIVE_PROFILER.get()
+    if profiler is None:
+        return _NULL_CONTEXT
+    return profiler.phase(name)
+
+
+def solve(computer: SupportsStats) -> AbstractContextManager[None]:
+    """Count a matching computation performed by the given computer with the active profiler, if any."""
+    profiler = _ACTIVE_PROFILER.get()
+    if profiler is None:
+        return _NULL_CONTEXT
+    return profiler.solve(computer)
+
+
+def count(name: str, value: int = 1) -> None:
+    """Add the given value to the counter with the given name of the active profiler, if any."""
+    profiler = _ACTIVE_PROFILER.get()
+    if profiler is not None:
+        profiler.count(name, value)
+
+
+def sample(name: str, value: int) -> None:
+    """Record the given value for the samples with the given name of the active profiler, if any."""
+    profiler = _ACTIVE_PROFILER.get()
+    if profiler is not None:
+        profiler.sample(name, value)
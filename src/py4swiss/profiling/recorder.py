@@ -0,0 +1,95 @@
+from contextvars import ContextVar, Token
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Protocol, Self
+
+if TYPE_CHECKING:
+    from py4swiss.matching_computer import TraceWriter
+
+_ACTIVE_RECORDER: ContextVar["TraceRecorder | None"] = ContextVar("active_recorder", default=None)
+
+
+class SupportsRecord(Protocol):
+    """A protocol for matching computers able to write all of their operations to a trace."""
+
+    def record(self, writer: "TraceWriter") -> None:
+        """Write all subsequent operations to the given trace."""
+        ...
+
+
+class TraceRecorder:
+    """
+    A class for recording the operations performed on the matching computers of the pairing engines to a binary trace.
+
+    Recording is opt-in: only matching computers created while a recorder is active, i.e. within a 'with' block, are
+    recorded. The trace contains every call to 'add_vertex', 'set_edge_weight' and 'compute_matching' along with the
+    resulting matchings. Thus, it can be replayed without the engines in order to benchmark the matching computer in
+    isolation. For example:
+
+        with TraceRecorder(Path("round.trace")):
+            engine.generate_pairings(trf)
+        replay_trace(Path("round.trace"))
+
+    The same trace can also be replayed without Python by the program built from 'cpp/tools/replay.cpp'.
+    """
+
+    def __init__(self, file_path: Path) -> None:
+        """Initialize a new recorder writing to the given file."""
+        self.file_path: Path = file_path
+        self._writer: TraceWriter | None = None
+        self._token: Token[TraceRecorder | None] | None = None
+
+    def __enter__(self) -> Self:
+        """Create the trace and activate the recorder for the current context."""
+        from py4swiss.matching_computer import TraceWriter  # noqa: PLC0415
+
+        self._writer = TraceWriter(str(self.file_path))
+        self._token = _ACTIVE_RECORDER.set(self)
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc_value: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        """Close the trace and restore the previously active recorder, if any."""
+        if self._token is not None:
+            _ACTIVE_RECORDER.reset(self._token)
+            self._token = None
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def record(self, computer: SupportsRecord) -> None:
+        """Write all subsequent operations of the given matching computer to the trace."""
+        if self._writer is None:
+            error_message = "Trace recorder is not active"
+            raise RuntimeError(error_message)
+        computer.record(self._writer)
+
+
+def get_recorder() -> TraceRecorder | None:
+    """Return the trace recorder active in the current context, if any."""
+    return _ACTIVE_RECORDER.get()
+
+
+def record(computer: SupportsRecord) -> None:
+    """Write all subsequent operations of the given matching computer to the trace of the active recorder, if any."""
+    recorder = _ACTIVE_RECORDER.get()
+    if recorder is not None:
+        recorder.record(computer)
+
+
+def replay_trace(file_path: Path) -> dict[str, float]:
+    """
+    Replay the given trace on new matching computers and return the results.
+
+    The results are:
+        - computers: the number of matching computers created
+        - operations: the number of operations performed
+        - computations: the number of calls to 'compute_matching'
+        - mismatches: the number of computations whose matching differed from the recorded one
+        - compute_seconds: the wall time in seconds spent in 'compute_matching'
+        - total_seconds: the wall time in seconds spent on all operations
+    """
+    from py4swiss.matching_computer import replay  # noqa: PLC0415
+
+    return replay(str(file_path))
@@ -0,0 +1,5 @@
+from py4swiss.simulation.report import RoundReport, SimulationReport
+from py4swiss.simulation.settings import RatingDistribution, SimulationSettings
+from py4swiss.simulation.simulator import TournamentSimulator
+
+__all__ = ["RatingDistribution", "RoundReport", "SimulationReport", "SimulationSettings", "TournamentSimulator"]
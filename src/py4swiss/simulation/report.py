@@ -0,0 +1,39 @@
+from pydantic import BaseModel
+
+from py4swiss.engines.common import Pairing
+from py4swiss.trf import ParsedTrf
+
+
+class RoundReport(BaseModel):
+    """
+    Report of a single simulated round.
+
+    Attributes:
+        round_number (int): The number of the round
+        pairings (list[Pairing]): The round pairing generated by the engine
+        seconds (float): The wall time in seconds the engine took to generate the round pairing
+
+    """
+
+    round_number: int
+    pairings: list[Pairing]
+    seconds: float
+
+
+class SimulationReport(BaseModel):
+    """
+    Report of a simulated tournament.
+
+    Attributes:
+        trf (ParsedTrf): The TRF of the tournament after the last simulated round
+        rounds (list[RoundReport]): The reports of all simulated rounds in order
+
+    """
+
+    trf: ParsedTrf
+    rounds: list[RoundReport]
+
+    @property
+    def total_seconds(self) -> float:
+        """Return the total wall time in seconds the engine took to generate all round pairings."""
+        return sum(round_report.seconds for round_report in self.rounds)
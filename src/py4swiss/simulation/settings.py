@@ -0,0 +1,61 @@
+from enum import Enum
+from typing import Self
+
+from pydantic import BaseModel, Field, model_validator
+
+from py4swiss.trf.sections.x_section import XSectionConfiguration
+
+
+class RatingDistribution(str, Enum):
+    """Distribution of the ratings of a simulated field."""
+
+    UNIFORM = "uniform"
+    NORMAL = "normal"
+
+
+class SimulationSettings(BaseModel):
+    """
+    Settings of a simulated tournament.
+
+    Attributes:
+        number_of_players (int): The number of players in the field
+        number_of_rounds (int): The number of rounds of the tournament
+        rating_distribution (RatingDistribution): The distribution of the ratings of the field (default: uniform)
+        rating_low (int): The lowest possible rating (default: 1000)
+        rating_high (int): The highest possible rating (default: 2800)
+        rating_mean (int): The mean of the ratings for a normal distribution (default: 1900)
+        rating_deviation (int): The standard deviation of the ratings for a normal distribution (default: 300)
+        forfeit_ratio (float): The chance of a game being declared a forfeit (default: 0.0)
+        bye_ratio (float): The chance of a player being assigned a bye in any round after the first (default: 0.0)
+        accelerated_rounds (int): The number of rounds with acceleration (default: 0)
+        accelerated_ratio (float): The share of the highest seeded players receiving acceleration (default: 0.5)
+        acceleration_points_times_ten (int): The acceleration per accelerated round times ten (default: 10)
+        shuffle (bool): Whether to list the players in a random order instead of ordered by rating (default: False)
+        configuration (XSectionConfiguration): The configuration of the tournament
+        seed (int): The seed for all random choices of the simulation (default: 0)
+
+    """
+
+    number_of_players: int = Field(ge=2)
+    number_of_rounds: int = Field(ge=1)
+    rating_distribution: RatingDistribution = RatingDistribution.UNIFORM
+    rating_low: int = 1000
+    rating_high: int = 2800
+    rating_mean: int = 1900
+    rating_deviation: int = 300
+    forfeit_ratio: float = Field(default=0.0, ge=0.0, le=1.0)
+    bye_ratio: float = Field(default=0.0, ge=0.0, le=1.0)
+    accelerated_rounds: int = Field(default=0, ge=0)
+    accelerated_ratio: float = Field(default=0.5, ge=0.0, le=1.0)
+    acceleration_points_times_ten: int = 10
+    shuffle: bool = False
+    configuration: XSectionConfiguration = Field(default_factory=XSectionConfiguration)
+    seed: int = 0
+
+    @model_validator(mode="after")
+    def _check_rating_range(self) -> Self:
+        """Check whether the lowest possible rating does not exceed the highest possible one."""
+        if self.rating_low > self.rating_high:
+            error_message = f"Lowest rating '{self.rating_low}' exceeds the highest rating '{self.rating_high}'"
+            raise ValueError(error_message)
+        return self
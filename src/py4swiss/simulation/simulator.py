@@ -0,0 +1,171 @@
+import random
+import time
+
+from py4swiss.engines.common import Pairing, PairingEngine
+from py4swiss.simulation.report import RoundReport, SimulationReport
+from py4swiss.simulation.settings import RatingDistribution, SimulationSettings
+from py4swiss.trf import ParsedTrf
+from py4swiss.trf.codes import PlayerCode
+from py4swiss.trf.results import ColorToken, ResultToken, RoundResult
+from py4swiss.trf.sections import PlayerSection, XSection
+
+# The possible results of a regular game, each of which occurs with equal likelihood.
+_GAME_RESULTS = (
+    (ResultToken.WIN, ResultToken.LOSS),
+    (ResultToken.DRAW, ResultToken.DRAW),
+    (ResultToken.LOSS, ResultToken.WIN),
+)
+# The possible results of a forfeited game, each of which occurs with equal likelihood.
+_FORFEIT_RESULTS = (
+    (ResultToken.FORFEIT_WIN, ResultToken.FORFEIT_LOSS),
+    (ResultToken.FORFEIT_LOSS, ResultToken.FORFEIT_WIN),
+    (ResultToken.FORFEIT_LOSS, ResultToken.FORFEIT_LOSS),
+)
+# The possible byes of players not participating in a round, each of which occurs with equal likelihood.
+_BYES = (ResultToken.HALF_POINT_BYE, ResultToken.FULL_POINT_BYE, ResultToken.ZERO_POINT_BYE)
+
+
+class TournamentSimulator:
+    """
+    A class for simulating entire tournaments in-process with any pairing engine.
+
+    A synthetic field is generated according to the given settings. Each round is then paired by the engine and filled
+    with random results. All random choices are derived from the seed of the settings, such that a simulation with the
+    same settings and engine is reproducible.
+    """
+
+    def __init__(self, settings: SimulationSettings) -> None:
+        """Initialize a new simulator."""
+        self.settings: SimulationSettings = settings
+        self._random: random.Random = random.Random(settings.seed)  # noqa: S311
+
+    def _get_rating(self) -> int:
+        """Return a random rating according to the rating distribution."""
+        low, high = self.settings.rating_low, self.settings.rating_high
+
+        match self.settings.rating_distribution:
+            case RatingDistribution.UNIFORM:
+                return self._random.randint(low, high)
+            case RatingDistribution.NORMAL:
+                rating = round(self._random.gauss(self.settings.rating_mean, self.settings.rating_deviation))
+                return min(max(rating, low), high)
+            case _:  # pragma: no cover
+                error_message = "Unreachable code reached"
+                raise AssertionError(error_message)
+
+    def _get_player_sections(self) -> list[PlayerSection]:
+        """Return the player sections of the field ordered by descending rating."""
+        n = self.settings.number_of_players
+        ratings = sorted((self._get_rating() for _ in range(n)), reverse=True)
+        player_sections = [
+            PlayerSection(
+                code=PlayerCode.PLAYER,
+                starting_number=i,
+                name=f"Player {i}",
+                fide_rating=ratings[i - 1],
+                points_times_ten=0,
+                rank=i,
+            )
+            for i in range(1, n + 1)
+        ]
+
+        if self.settings.shuffle:
+            self._random.shuffle(player_sections)
+
+        return player_sections
+
+    def _get_accelerations(self) -> dict[int, list[int]]:
+        """Return the accelerations of the highest seeded players for the accelerated rounds."""
+        if self.settings.accelerated_rounds == 0:
+            return {}
+
+        accelerated_rounds = min(self.settings.accelerated_rounds, self.settings.number_of_rounds)
+        remaining_rounds = self.settings.number_of_rounds - accelerated_rounds
+        accelerations = accelerated_rounds * [self.settings.acceleration_points_times_ten] + remaining_rounds * [0]
+        accelerated_players = int(self.settings.number_of_players * self.settings.accelerated_ratio)
+
+        return {i: accelerations.copy() for i in range(1, accelerated_players + 1)}
+
+    def get_initial_trf(self) -> ParsedTrf:
+        """Return the TRF of the tournament before the first round."""
+        x_section = XSection(
+            number_of_rounds=self.settings.number_of_rounds,
+            configuration=self.settings.configuration.model_copy(),
+            accelerations=self._get_accelerations(),
+        )
+        return ParsedTrf(player_sections=self._get_player_sections(), x_section=x_section)
+
+    @staticmethod
+    def _add_result(trf: ParsedTrf, player_section: PlayerSection, round_result: RoundResult) -> None:
+        """Add the given result to the given player."""
+        player_section.results.append(round_result)
+        player_section.points_times_ten += trf.x_section.scoring_point_system.get_points_times_ten(round_result)
+
+    def _get_result(self) -> tuple[ResultToken, ResultToken]:
+        """Return a random pair of result tokens for a game."""
+        if self._random.random() < self.settings.forfeit_ratio:
+            return self._random.choice(_FORFEIT_RESULTS)
+        return self._random.choice(_GAME_RESULTS)
+
+    def _add_byes(self, trf: ParsedTrf) -> None:
+        """Randomly assign byes to the players that will not participate in the next round."""
+        if self.settings.bye_ratio == 0.0:
+            return
+
+        for player_section in trf.player_sections:
+            # Players may only miss rounds after the first one.
+            if not bool(player_section.results) or self._random.random() >= self.settings.bye_ratio:
+                continue
+            bye = self._random.choice(_BYES)
+            round_result = RoundResult(id=0, color=ColorToken.BYE_OR_NOT_PAIRED, result=bye)
+            self._add_result(trf, player_section, round_result)
+
+    def _add_results(self, trf: ParsedTrf, pairings: list[Pairing]) -> None:
+        """Add random results for the given pairings and update the ranks of all players."""
+        player_sections = {player_section.starting_number: player_section for player_section in trf.player_sections}
+
+        for pairing in pairings:
+            white = player_sections[pairing.white]
+            black = player_sections.get(pairing.black)
+
+            if black is None:
+                result_token = ResultToken.PAIRING_ALLOCATED_BYE
+                self._add_result(trf, white, RoundResult(id=0, color=ColorToken.BYE_OR_NOT_PAIRED, result=result_token))
+                continue
+
+            result_token_white, result_token_black = self._get_result()
+            self._add_result(
+                trf, white, RoundResult(id=black.starting_number, color=ColorToken.WHITE, result=result_token_white)
+            )
+            self._add_result(
+                trf, black, RoundResult(id=white.starting_number, color=ColorToken.BLACK, result=result_token_black)
+            )
+
+        ranking = sorted(trf.player_sections, key=lambda player_section: player_section.points_times_ten, reverse=True)
+        for rank, player_section in enumerate(ranking, start=1):
+            player_section.rank = rank
+
+    def simulate(self, engine: type[PairingEngine], number_of_rounds: int | None = None) -> SimulationReport:
+        """
+        Simulate the tournament with the given engine and return a report containing the timings of each round.
+
+        Optionally, only the given number of rounds are simulated.
+        """
+        if number_of_rounds is None:
+            number_of_rounds = self.settings.number_of_rounds
+
+        self._random.seed(self.settings.seed)
+        trf = self.get_initial_trf()
+        rounds = []
+
+        for round_number in range(1, number_of_rounds + 1):
+            self._add_byes(trf)
+
+            start = time.perf_counter()
+            pairings = engine.generate_pairings(trf)
+            seconds = time.perf_counter() - start
+
+            self._add_results(trf, pairings)
+            rounds.append(RoundReport(round_number=round_number, pairings=pairings, seconds=seconds))
+
+        return SimulationReport(trf=trf, rounds=rounds)
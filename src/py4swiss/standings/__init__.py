@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+from py4swiss.standings.tiebreak import Tiebreak
+
+if TYPE_CHECKING:
+    from py4swiss.standings.standings import Standings, StandingsEntry
+    from py4swiss.standings.standings_table import StandingsTable
+
+# The standings table pulls in the tiebreak table as well as the standings models, while the command line only needs
+# the tiebreaks to parse its arguments. Thus, everything else is only imported on first access (see 'py4swiss.engines').
+_MODULES = {
+    "Standings": "py4swiss.standings.standings",
+    "StandingsEntry": "py4swiss.standings.standings",
+    "StandingsTable": "py4swiss.standings.standings_table",
+}
+
+
+def __getattr__(name: str) -> type[Standings | StandingsEntry | StandingsTable]:
+    """Import the class with the given name on first access."""
+    if name not in _MODULES:
+        error_message = f"module '{__name__}' has no attribute '{name}'"
+        raise AttributeError(error_message)
+    cls: type[Standings | StandingsEntry | StandingsTable] = getattr(import_module(_MODULES[name]), name)
+    return cls
+
+
+__all__ = ["Standings", "StandingsEntry", "StandingsTable", "Tiebreak"]
@@ -0,0 +1,79 @@
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from py4swiss.standings.tiebreak import Tiebreak
+
+
+class StandingsEntry(BaseModel):
+    """
+    Standing of a single player.
+
+    Attributes:
+        rank (int): The rank of the player
+        starting_number (int): The starting number of the player
+        name (str | None): The name of the player if specified
+        fide_rating (int | None): The FIDE rating of the player if present
+        points (float): The current points of the player
+        tiebreaks (list[float]): The values of the tiebreaks of the player in the order of the standings
+        results (list[str]): The crosstable entries of the player in each round (empty if not requested)
+
+    """
+
+    rank: int
+    starting_number: int
+    name: str | None = None
+    fide_rating: int | None = None
+    points: float
+    tiebreaks: list[float]
+    results: list[str] = Field(default_factory=list)
+
+
+class Standings(BaseModel):
+    """
+    Ranked standings of a tournament.
+
+    Each crosstable entry consists of the rank of the opponent, the color and the result token of the player, e.g.
+    '12w1'. Rounds without an opponent only contain the result token, e.g. 'H' for a half-point-bye.
+
+    Attributes:
+        number_of_rounds (int): The number of rounds taken into account
+        tiebreaks (list[Tiebreak]): The tiebreaks by which players with the same number of points are ranked
+        entries (list[StandingsEntry]): The standings of all players ordered by rank
+
+    """
+
+    number_of_rounds: int
+    tiebreaks: list[Tiebreak]
+    entries: list[StandingsEntry]
+
+    def to_text(self) -> str:
+        """Return the standings as a table with one line per player."""
+        name_width = max((len(entry.name or "") for entry in self.entries), default=0)
+        result_width = max((len(result) for entry in self.entries for result in entry.results), default=0)
+        number_of_results = max((len(entry.results) for entry in self.entries), default=0)
+
+        header = [f"{'Rk':>4}", f"{'SNo':>4}", f"{'Name':<{name_width}}", f"{'Rtg':>4}", f"{'Pts':>5}"]
+        header += [f"{tiebreak.value:>7}" for tiebreak in self.tiebreaks]
+        header += [f"{f'R{i}':>{result_width}}" for i in range(1, number_of_results + 1)]
+        lines = [" ".join(header).rstrip()]
+
+        for entry in self.entries:
+            line = [
+                f"{entry.rank:>4}",
+                f"{entry.starting_number:>4}",
+                f"{entry.name or '':<{name_width}}",
+                f"{entry.fide_rating or '':>4}",
+                f"{entry.points:>5.1f}",
+            ]
+            line += [f"{value:>7g}" for value in entry.tiebreaks]
+            line += [f"{result:>{result_width}}" for result in entry.results]
+            lines.append(" ".join(line).rstrip())
+
+        return "\n".join(lines) + "\n"
+
+    def write_to_file(self, file_path: Path) -> None:
+        """Write the standings to the given file, as JSON if its suffix is '.json' and as a table otherwise."""
+        content = self.model_dump_json(indent=4) if file_path.suffix == ".json" else self.to_text()
+        with file_path.open("w", encoding="utf-8") as file:
+            file.write(content)
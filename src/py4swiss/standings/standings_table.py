@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+
+from py4swiss.standings.standings import Standings, StandingsEntry
+from py4swiss.standings.tiebreak import Tiebreak
+from py4swiss.tiebreaks import TiebreakTable
+from py4swiss.trf.results import ColorToken, ResultToken
+from py4swiss.trf.results.result_matrix import MISSING_RESULT_CODE
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from py4swiss.trf import ParsedTrf
+    from py4swiss.trf.results import ResultMatrix
+
+DEFAULT_TIEBREAKS = (Tiebreak.BUCHHOLZ, Tiebreak.SONNEBORN_BERGER)
+
+# Lookup tables from color and result codes to the respective tokens.
+_COLOR_VALUES = [color_token.value for color_token in ColorToken]
+_RESULT_VALUES = [result_token.value for result_token in ResultToken]
+
+
+class StandingsTable:
+    """
+    A class computing the ranked standings and the crosstable of a tournament.
+
+    All players are ranked at once by sorting the arrays of their points and tiebreaks, which are computed from the
+    result matrix of the TRF (see 'TiebreakTable'). Players with the same points and tiebreaks are ranked by their
+    starting numbers. Once a round is appended to the TRF, the table can be updated with 'append_round', which only
+    reads the results of the new round from the player sections. For example:
+
+        table = StandingsTable(trf)
+        ...
+        table.append_round(trf)
+        standings = table.get_standings()
+
+    Attributes:
+        tiebreaks (list[Tiebreak]): The tiebreaks by which players with the same number of points are ranked
+
+    """
+
+    def __init__(self, trf: ParsedTrf, tiebreaks: Sequence[Tiebreak] = DEFAULT_TIEBREAKS) -> None:
+        """Set up the standings of all players of the given TRF."""
+        self.tiebreaks: list[Tiebreak] = list(tiebreaks)
+
+        self._trf: ParsedTrf = trf
+        self._result_matrix: ResultMatrix = trf.get_result_matrix()
+        self._tiebreak_table: TiebreakTable = TiebreakTable(
+            trf.player_sections, self._result_matrix, trf.x_section.scoring_point_system
+        )
+
+    def append_round(self, trf: ParsedTrf) -> None:
+        """
+        Update the standings for the given TRF after exactly one round was appended to it.
+
+        The given TRF needs to contain the same players as the current one, each of them with exactly one more result and
+        the same earlier results.
+        """
+        result_matrix = self._result_matrix.append_round(trf.player_sections)
+        self._tiebreak_table.append_round(trf.player_sections, result_matrix)
+        self._trf = trf
+        self._result_matrix = result_matrix
+
+    def _get_values(self, tiebreak: Tiebreak) -> npt.NDArray[np.int64]:
+        """Return the values of the given tiebreak for each player."""
+        match tiebreak:
+            case Tiebreak.BUCHHOLZ:
+                return self._tiebreak_table.get_buchholz()
+            case Tiebreak.SONNEBORN_BERGER:
+                return self._tiebreak_table.get_sonneborn_berger()
+            case Tiebreak.ARO:
+                return self._tiebreak_table.get_aro()
+
+    def _get_ranking(self, values: list[npt.NDArray[np.int64]]) -> npt.NDArray[np.int64]:
+        """Return the rows of the players in the result matrix ordered by rank, given the values of all tiebreaks."""
+        # The last key is the primary one, thus the keys are given in reverse order of priority.
+        keys = [self._tiebreak_table.starting_numbers, *(-value for value in reversed(values))]
+        keys.append(-self._tiebreak_table.points)
+        ranking: npt.NDArray[np.int64] = np.lexsort(keys).astype(np.int64)
+        return ranking
+
+    def _get_crosstable(self, ranks: npt.NDArray[np.int64]) -> list[list[str]]:
+        """Return the crosstable entries of each player in each round, given the rank of each player."""
+        result_matrix = self._result_matrix
+        opponent_ranks = np.where(result_matrix.indices >= 0, ranks[result_matrix.indices], 0)
+
+        crosstable = []
+        for opponent_row, color_row, result_row in zip(
+            opponent_ranks.tolist(), result_matrix.colors.tolist(), result_matrix.results.tolist(), strict=True
+        ):
+            crosstable.append(
+                [
+                    (
+                        f"{opponent_rank}{_COLOR_VALUES[color]}{_RESULT_VALUES[result]}"
+                        if opponent_rank
+                        else _RESULT_VALUES[result]
+                    )
+                    for opponent_rank, color, result in zip(opponent_row, color_row, result_row, strict=True)
+                    if result != MISSING_RESULT_CODE
+                ]
+            )
+        return crosstable
+
+    def get_standings(self, *, crosstable: bool = False) -> Standings:
+        """Return the standings of all players ordered by rank, including the crosstable if requested."""
+        values = [self._get_values(tiebreak) for tiebreak in self.tiebreaks]
+        ranking = self._get_ranking(values)
+        ranks = np.empty_like(ranking)
+        ranks[ranking] = np.arange(1, len(ranking) + 1)
+
+        points = (self._tiebreak_table.points / 10).tolist()
+        tiebreaks = [(value / tiebreak.scale).tolist() for tiebreak, value in zip(self.tiebreaks, values, strict=True)]
+        results = self._get_crosstable(ranks) if crosstable else [[] for _ in range(len(ranking))]
+
+        entries = []
+        for rank, row in enumerate(ranking.tolist(), start=1):
+            player_section = self._trf.player_sections[row]
+            entries.append(
+                StandingsEntry(
+                    rank=rank,
+                    starting_number=player_section.starting_number,
+                    name=player_section.name,
+                    fide_rating=player_section.fide_rating,
+                    points=points[row],
+                    tiebreaks=[tiebreak[row] for tiebreak in tiebreaks],
+                    results=results[row],
+                )
+            )
+
+        return Standings(
+            number_of_rounds=self._result_matrix.results.shape[1], tiebreaks=self.tiebreaks, entries=entries
+        )
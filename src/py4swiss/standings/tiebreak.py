@@ -0,0 +1,20 @@
+from enum import Enum
+
+
+class Tiebreak(str, Enum):
+    """Tiebreak by which players with the same number of points are ranked."""
+
+    BUCHHOLZ = "BH"
+    SONNEBORN_BERGER = "SB"
+    ARO = "ARO"
+
+    @property
+    def scale(self) -> int:
+        """Return the factor by which the values of the tiebreak are stored (see 'TiebreakTable')."""
+        match self:
+            case Tiebreak.BUCHHOLZ:
+                return 10
+            case Tiebreak.SONNEBORN_BERGER:
+                return 100
+            case Tiebreak.ARO:
+                return 1
@@ -0,0 +1,3 @@
+from py4swiss.tiebreaks.tiebreak_table import TiebreakTable
+
+__all__ = ["TiebreakTable"]
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+
+from py4swiss.trf.results import ColorToken, ResultToken
+
+if TYPE_CHECKING:
+    from py4swiss.trf import ParsedTrf
+    from py4swiss.trf.results import ResultMatrix, ScoringPointSystem
+    from py4swiss.trf.sections import PlayerSection
+
+
+class TiebreakTable:
+    """
+    A class computing the opposition evaluation of all players of a TRF at once.
+
+    All values are computed from the players x rounds arrays of a result matrix by gathering the values of the opponents
+    of each player in each round and summing them up, rather than by walking through the round results of each player.
+    Once a round is appended to the TRF, the table can be updated with 'append_round', which only processes the results
+    of the new round. Since Buchholz and Sonneborn-Berger depend on the current scores of all opponents, they are
+    gathered anew whenever they are requested.
+
+    Attributes:
+        starting_numbers (NDArray): The starting numbers of the players in the order of the result matrix
+        points (NDArray): The current points times ten of each player
+        ratings (NDArray): The FIDE rating of each player (0 if there is none)
+
+    """
+
+    def __init__(
+        self,
+        player_sections: list[PlayerSection],
+        result_matrix: ResultMatrix,
+        scoring_point_system: ScoringPointSystem,
+    ) -> None:
+        """Set up the table for the given player sections and their result matrix."""
+        self._result_matrix: ResultMatrix = result_matrix
+        self._scoring_point_system: ScoringPointSystem = scoring_point_system
+
+        self.starting_numbers: npt.NDArray[np.int64] = result_matrix.starting_numbers
+        self.points: npt.NDArray[np.int64] = self._get_points(player_sections)
+        self.ratings: npt.NDArray[np.int64] = np.array(
+            [section.fide_rating or 0 for section in player_sections], dtype=np.int64
+        )
+
+        self._round_points: npt.NDArray[np.int64] = result_matrix.get_points_times_ten(scoring_point_system)
+        self._opponent_ratings: npt.NDArray[np.int64] = np.where(
+            result_matrix.played, self.ratings[result_matrix.indices], 0
+        ).sum(axis=1)
+        self._games: npt.NDArray[np.int64] = np.count_nonzero(result_matrix.played, axis=1).astype(np.int64)
+
+    @classmethod
+    def from_trf(cls, trf: ParsedTrf) -> TiebreakTable:
+        """Set up the table for all players of the given TRF."""
+        return cls(trf.player_sections, trf.get_result_matrix(), trf.x_section.scoring_point_system)
+
+    @staticmethod
+    def _get_points(player_sections: list[PlayerSection]) -> npt.NDArray[np.int64]:
+        """Return the points times ten of the given player sections."""
+        return np.array([section.points_times_ten for section in player_sections], dtype=np.int64)
+
+    def append_round(self, player_sections: list[PlayerSection], result_matrix: ResultMatrix) -> None:
+        """
+        Update the table for the given player sections after exactly one round was appended to them.
+
+        The given result matrix needs to be the one of the given player sections and contain the same players as well as
+        exactly one more round than the current one.
+        """
+        number_of_rounds = self._result_matrix.results.shape[1]
+        if (
+            result_matrix.results.shape != (len(self.starting_numbers), number_of_rounds + 1)
+            or not np.array_equal(result_matrix.starting_numbers, self.starting_numbers)
+            or not np.array_equal(result_matrix.results[:, :-1], self._result_matrix.results)
+            or not np.array_equal(result_matrix.opponents[:, :-1], self._result_matrix.opponents)
+            or not np.array_equal(result_matrix.colors[:, :-1], self._result_matrix.colors)
+        ):
+            error_message = "Result matrix does not differ by exactly one round"
+            raise ValueError(error_message)
+
+        played = result_matrix.played[:, -1]
+        indices = result_matrix.indices[:, -1]
+        table = result_matrix.get_points_table(self._scoring_point_system)
+        round_points = table[result_matrix.results[:, -1], result_matrix.colors[:, -1]]
+
+        self._result_matrix = result_matrix
+        self.points = self._get_points(player_sections)
+
+        self._round_points = np.column_stack((self._round_points, round_points))
+        self._opponent_ratings += np.where(played, self.ratings[indices], 0)
+        self._games += played
+
+    def _get_opponent_scores(self, opponent_points: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+        """
+        Return the score of the opponent of each player in each round.
+
+        Rounds in which a player did not play count with the points of the player themselves and missing results count as
+        zero.
+        """
+        result_matrix = self._result_matrix
+        scores = np.where(result_matrix.played, opponent_points[result_matrix.indices], self.points[:, np.newaxis])
+        scores[np.arange(result_matrix.results.shape[1]) >= result_matrix.lengths[:, np.newaxis]] = 0
+        return scores
+
+    def get_buchholz(self) -> npt.NDArray[np.int64]:
+        """Return the Buchholz times ten of each player."""
+        result_matrix = self._result_matrix
+
+        # FIDE handbook: "1.7 Opposition Evaluation | 1.7.2 Common Rules | 3."
+        # Exception: if a player has a series of consecutive zero-point-byes up to the current round, each of the ones
+        # gathered in previous rounds, for the benefit of the player's actual over-the-board opponents, is considered as
+        # a draw.
+        draw_points = self._scoring_point_system.score_dict[(ResultToken.HALF_POINT_BYE, ColorToken.BYE_OR_NOT_PAIRED)]
+        zero_point_byes = np.count_nonzero(result_matrix.get_mask({ResultToken.ZERO_POINT_BYE}), axis=1)
+        opponent_points = np.where(
+            zero_point_byes == result_matrix.lengths, draw_points * result_matrix.lengths, self.points
+        )
+
+        # FIDE handbook: "1.7 Opposition Evaluation | 1.7.1 Sorting Methods | 1. Buchholz"
+        # It is the sum of the (current) scores of the opponents the player met.
+        buchholz: npt.NDArray[np.int64] = self._get_opponent_scores(opponent_points).sum(axis=1)
+        return buchholz
+
+    def get_sonneborn_berger(self) -> npt.NDArray[np.int64]:
+        """Return the Sonneborn-Berger times one hundred of each player."""
+        # FIDE handbook: "1.7 Opposition Evaluation | 1.7.1  Sorting Methods | 1. Sonneborn-Berger"
+        # It is the sum of the products given by the points the player earned against each opponent times the (current)
+        # scores of that opponent.
+        sonneborn_berger: npt.NDArray[np.int64] = (self._get_opponent_scores(self.points) * self._round_points).sum(
+            axis=1
+        )
+        return sonneborn_berger
+
+    def get_aro(self) -> npt.NDArray[np.int64]:
+        """Return the average rating of opponents (ARO) of each player."""
+        # FIDE handbook: "1.7 Average Rating of Opponents (ARO)"
+        # 1.7.1 ARO is defined for each player who has played at least one game. It is given by the sum of the ratings
+        #       of the opponents the player met over-the-board (i.e. only played games are used to compute ARO), divided
+        #       by the number of such opponents, and rounded to the nearest integer number (the higher, if the division
+        #       ends for 0.5).
+        # 1.7.3 If a player has yet to play a game, their ARO is zero.
+        games = np.maximum(self._games, 1)
+        aro: npt.NDArray[np.int64] = (2 * self._opponent_ratings + games) // (2 * games)
+        return aro
@@ -1,5 +1,6 @@
 from py4swiss.trf.parsed_trf import ParsedTrf
 from py4swiss.trf.trf_line import TrfLine
 from py4swiss.trf.trf_parser import TrfParser
+from py4swiss.trf.trf_writer import TrfWriter
 
-__all__ = ["ParsedTrf", "TrfLine", "TrfParser"]
+__all__ = ["ParsedTrf", "TrfLine", "TrfParser", "TrfWriter"]
@@ -1,14 +1,17 @@
 from pathlib import Path
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, Field, PrivateAttr
 
 from py4swiss.trf.exceptions import ConsistencyError
+from py4swiss.trf.results import ResultMatrix, ResultToken
 from py4swiss.trf.sections import (
     PlayerSection,
     TeamSection,
     TournamentSection,
     XSection,
 )
+from py4swiss.trf.trf_writer import TrfWriter
 
 
 class ParsedTrf(BaseModel):
@@ -28,6 +31,39 @@ class ParsedTrf(BaseModel):
     team_sections: list[TeamSection] = Field(default_factory=list)
     x_section: XSection
 
+    _result_matrix: ResultMatrix | None = PrivateAttr(default=None)
+
+    def __eq__(self, other: object) -> bool:
+        """Check whether the given TRFs have the same contents, regardless of their cached result matrices."""
+        if not isinstance(other, ParsedTrf):  # pragma: no cover
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in type(self).model_fields)
+
+    # The TRF is mutable and thus not hashable.
+    __hash__ = None  # type: ignore[assignment]
+
+    def get_result_matrix(self) -> ResultMatrix:
+        """
+        Return the results of all players as a result matrix.
+
+        The result matrix is built once, usually during validation after parsing, and is shared by everything reading
+        the results afterwards. It is only updated, if the results in the player sections were added to or changed in
+        the meantime (see 'ResultMatrix.is_up_to_date'). If a single round was added, only that round is read, else the
+        result matrix is built anew. It is a private attribute of the model and is thus neither serialized nor compared.
+        """
+        result_matrix = self._result_matrix
+        if result_matrix is None or not result_matrix.is_up_to_date(self.player_sections):
+            if result_matrix is not None and result_matrix.can_append_round(self.player_sections):
+                result_matrix = result_matrix.append_round(self.player_sections)
+            else:
+                result_matrix = ResultMatrix(self.player_sections)
+            self._result_matrix = result_matrix
+        return result_matrix
+
+    def has_pending_results(self) -> bool:
+        """Check whether any player has a result which is still pending, e.g. after pairings were added to the TRF."""
+        return bool(self.get_result_matrix().get_mask({ResultToken.PENDING}).any())
+
     def _validate_round_number(self) -> None:
         """Validate that all information is consistent with the number of rounds."""
         for player_section in self.player_sections:
@@ -45,11 +81,11 @@ class ParsedTrf(BaseModel):
 
     def _validate_points(self) -> None:
         """Validate that all player points are consistent with their respective results."""
-        score_point_system = self.x_section.scoring_point_system
+        points_times_ten = self.get_result_matrix().get_points_times_ten(self.x_section.scoring_point_system)
+        calculated_list = points_times_ten.sum(axis=1).tolist()
 
-        for player_section in self.player_sections:
+        for player_section, calculated in zip(self.player_sections, calculated_list, strict=True):
             number = player_section.starting_number
-            calculated = sum(score_point_system.get_points_times_ten(result) for result in player_section.results)
             expected = player_section.points_times_ten
 
             if calculated != expected:
@@ -64,27 +100,26 @@ class ParsedTrf(BaseModel):
 
     def _validate_results(self) -> None:
         """Validate that all player results are consistent with one another."""
-        results_dict = {section.starting_number: section.results for section in self.player_sections}
-
-        for number, results in results_dict.items():
-            for i, round_result in enumerate(results):
-                if round_result.result.is_bye():
-                    continue
-                opponent_number = round_result.id
-                suffix = f"for the game between starting numbers '{number}' and '{opponent_number}' in round {i + 1}"
-
-                opponent_round_results = results_dict[opponent_number]
-                if len(opponent_round_results) <= i:
-                    error_message = f"Missing entry {suffix}"
-                    raise ConsistencyError(error_message)
-
-                opponent_round_result = opponent_round_results[i]
-                if not round_result.result.is_compatible_with(opponent_round_result.result):
-                    error_message = f"Incompatible result entries {suffix}"
-                    raise ConsistencyError(error_message)
-                if round_result.color == opponent_round_result.color:
-                    error_message = f"Incompatible color entries {suffix}"
-                    raise ConsistencyError(error_message)
+        result_matrix = self.get_result_matrix()
+        missing, incompatible_results, incompatible_colors = result_matrix.get_incompatible_entries()
+        inconsistent = missing | incompatible_results | incompatible_colors
+
+        if not inconsistent.any():
+            return
+
+        # Report the first inconsistent entry in the order of the player sections and rounds.
+        row, column = (int(index) for index in np.argwhere(inconsistent)[0])
+        number = int(result_matrix.starting_numbers[row])
+        opponent_number = int(result_matrix.opponents[row, column])
+        suffix = f"for the game between starting numbers '{number}' and '{opponent_number}' in round {column + 1}"
+
+        if missing[row, column]:
+            error_message = f"Missing entry {suffix}"
+        elif incompatible_results[row, column]:
+            error_message = f"Incompatible result entries {suffix}"
+        else:
+            error_message = f"Incompatible color entries {suffix}"
+        raise ConsistencyError(error_message)
 
     def validate_contents(self) -> None:
         """Validate all information contained in the TRF."""
@@ -95,12 +130,8 @@ class ParsedTrf(BaseModel):
 
     def write_to_file(self, file_path: Path) -> None:
         """Write the TRF to a given file path."""
-        lines = self.tournament_section.to_strings()
-        lines += [player_section.to_string() for player_section in self.player_sections]
-        lines += [team_section.to_string() for team_section in self.team_sections]
-        lines += self.x_section.to_strings()
-
-        file_path.parent.mkdir(exist_ok=True)
-        with file_path.open("w", encoding="utf-8") as fh:
-            fh.write("\n".join(lines))
-            fh.write("\n")
+        TrfWriter.write(self, file_path)
+
+    def append_round_to_file(self, file_path: Path) -> None:
+        """Update the given TRF file, which contains all but the latest round of the TRF (see 'TrfWriter')."""
+        TrfWriter.append_round(self, file_path)
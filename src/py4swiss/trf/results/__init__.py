@@ -1,4 +1,5 @@
 from py4swiss.trf.results.color_token import ColorToken
+from py4swiss.trf.results.result_matrix import ResultMatrix
 from py4swiss.trf.results.result_token import ResultToken
 from py4swiss.trf.results.round_result import RoundResult
 from py4swiss.trf.results.scoring_point_system import (
@@ -10,6 +11,7 @@ from py4swiss.trf.results.scoring_point_system_code import ScoringPointSystemCod
 __all__ = [
     "SCORING_POINT_SYSTEM_IDENTIFIER_DICT",
     "ColorToken",
+    "ResultMatrix",
     "ResultToken",
     "RoundResult",
     "ScoringPointSystem",
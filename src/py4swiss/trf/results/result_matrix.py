@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import copy
+from typing import TYPE_CHECKING
+
+import numpy as np
+import numpy.typing as npt
+
+from py4swiss.trf.results.color_token import ColorToken
+from py4swiss.trf.results.result_token import ResultToken
+
+if TYPE_CHECKING:
+    from py4swiss.trf.results.scoring_point_system import ScoringPointSystem
+    from py4swiss.trf.sections import PlayerSection
+
+# The codes by which color and result tokens are stored in a result matrix.
+COLOR_CODES = {color_token: i for i, color_token in enumerate(ColorToken)}
+RESULT_CODES = {result_token: i for i, result_token in enumerate(ResultToken)}
+
+# The code of a result which does not exist, since the player has fewer results than others. The color of such a result
+# is stored as that of a bye.
+MISSING_RESULT_CODE = len(RESULT_CODES)
+NO_COLOR_CODE = COLOR_CODES[ColorToken.BYE_OR_NOT_PAIRED]
+
+# Lookup tables from result codes (including the one of missing results) to properties of the respective tokens.
+_PLAYED_TABLE = np.array([result_token.is_played() for result_token in ResultToken] + [False])
+_BYE_TABLE = np.array([result_token.is_bye() for result_token in ResultToken] + [False])
+_COMPATIBLE_TABLE = np.array(
+    [[token_1.is_compatible_with(token_2) for token_2 in ResultToken] + [False] for token_1 in ResultToken]
+    + [[False] * (len(RESULT_CODES) + 1)]
+)
+
+# The starting number and the opponent, color and result of each round result of each player, by which a result matrix
+# checks whether it still reflects the player sections it was built from.
+ResultKey = list[tuple[int, tuple[tuple[int, ColorToken, ResultToken], ...]]]
+
+
+class ResultMatrix:
+    """
+    A columnar representation of the results of all players of a TRF.
+
+    The results are stored in arrays with one row per player, in the order of the player sections, and one column per
+    round. Rows of players with fewer results than others are padded with missing results. This allows the engines and
+    the validation to process the results of all players at once instead of walking through the round results of each
+    player.
+
+    Attributes:
+        starting_numbers (NDArray): The starting numbers of the players
+        lengths (NDArray): The number of results of each player
+        opponents (NDArray): The starting numbers of the opponents of each player in each round (0 if there is none)
+        colors (NDArray): The color codes of each player in each round
+        results (NDArray): The result codes of each player in each round
+        played (NDArray): Whether each player played a game in each round
+        indices (NDArray): The row of each opponent of each player in each round (-1 if there is none)
+
+    """
+
+    def __init__(self, player_sections: list[PlayerSection]) -> None:
+        """Build the result matrix of the given player sections."""
+        self._key: ResultKey = self._get_key(player_sections)
+        number_of_rounds = max((len(round_results) for _, round_results in self._key), default=0)
+
+        opponents = []
+        colors = []
+        results = []
+
+        for _, round_results in self._key:
+            padding = number_of_rounds - len(round_results)
+            opponents.append([opponent for opponent, _, _ in round_results] + padding * [0])
+            colors.append([COLOR_CODES[color] for _, color, _ in round_results] + padding * [NO_COLOR_CODE])
+            results.append([RESULT_CODES[result] for _, _, result in round_results] + padding * [MISSING_RESULT_CODE])
+
+        shape = (len(player_sections), number_of_rounds)
+        self.starting_numbers: npt.NDArray[np.int64] = np.array(
+            [section.starting_number for section in player_sections], dtype=np.int64
+        )
+        self.lengths: npt.NDArray[np.int64] = np.array(
+            [len(section.results) for section in player_sections], dtype=np.int64
+        )
+        self.opponents: npt.NDArray[np.int64] = np.array(opponents, dtype=np.int64).reshape(shape)
+        self.colors: npt.NDArray[np.int8] = np.array(colors, dtype=np.int8).reshape(shape)
+        self.results: npt.NDArray[np.int8] = np.array(results, dtype=np.int8).reshape(shape)
+
+        self.played: npt.NDArray[np.bool_] = _PLAYED_TABLE[self.results]
+        self.indices: npt.NDArray[np.int64] = self.get_indices(self.opponents)
+
+    @staticmethod
+    def _get_key(player_sections: list[PlayerSection]) -> ResultKey:
+        """Return the starting number and the contents of all round results of each of the given player sections."""
+        return [
+            (
+                section.starting_number,
+                tuple((round_result.id, round_result.color, round_result.result) for round_result in section.results),
+            )
+            for section in player_sections
+        ]
+
+    def is_up_to_date(self, player_sections: list[PlayerSection]) -> bool:
+        """
+        Check whether the result matrix still reflects the given player sections.
+
+        Results may be added to the player sections as well as changed in place (e.g. once a pending result is entered
+        or an earlier result is corrected), thus the contents of all results are compared.
+        """
+        return self._key == self._get_key(player_sections)
+
+    def can_append_round(self, player_sections: list[PlayerSection]) -> bool:
+        """
+        Check whether the given player sections differ from the result matrix by exactly one additional round.
+
+        This is the case, if all players had the same number of results so far, each of them got exactly one more result
+        since, e.g. once a round is finished, and none of their earlier results changed in the meantime.
+        """
+        number_of_rounds = self.results.shape[1]
+        return len(player_sections) == len(self._key) and all(
+            starting_number == section.starting_number
+            and len(round_results) == number_of_rounds
+            and len(section.results) == number_of_rounds + 1
+            and round_results
+            == tuple(
+                (round_result.id, round_result.color, round_result.result) for round_result in section.results[:-1]
+            )
+            for (starting_number, round_results), section in zip(self._key, player_sections, strict=True)
+        )
+
+    def append_round(self, player_sections: list[PlayerSection]) -> ResultMatrix:
+        """
+        Return a new result matrix with the latest result of each of the given player sections appended as a new round.
+
+        Only the new round is read into arrays, the arrays of all previous rounds are taken over from this result matrix
+        as they are. The given player sections need to be such that 'can_append_round' holds.
+        """
+        if not self.can_append_round(player_sections):
+            error_message = "Player sections do not differ by exactly one round"
+            raise ValueError(error_message)
+
+        round_results = [section.results[-1] for section in player_sections]
+        opponents = np.array([round_result.id for round_result in round_results], dtype=np.int64)
+        colors = np.array([COLOR_CODES[round_result.color] for round_result in round_results], dtype=np.int8)
+        results = np.array([RESULT_CODES[round_result.result] for round_result in round_results], dtype=np.int8)
+
+        result_matrix = copy.copy(self)
+        result_matrix._key = self._get_key(player_sections)
+        result_matrix.lengths = self.lengths + 1
+        result_matrix.opponents = np.column_stack((self.opponents, opponents))
+        result_matrix.colors = np.column_stack((self.colors, colors))
+        result_matrix.results = np.column_stack((self.results, results))
+        result_matrix.played = np.column_stack((self.played, _PLAYED_TABLE[results]))
+        result_matrix.indices = np.column_stack((self.indices, self.get_indices(opponents)))
+        return result_matrix
+
+    def get_indices(self, starting_numbers: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+        """Return the rows of the players with the given starting numbers (-1 for unknown starting numbers)."""
+        size = max(int(self.starting_numbers.max(initial=0)), int(starting_numbers.max(initial=0))) + 1
+        index_table = np.full(size, -1, dtype=np.int64)
+        index_table[self.starting_numbers] = np.arange(len(self.starting_numbers))
+        index_table[0] = -1
+        return index_table[starting_numbers]
+
+    def get_mask(self, result_tokens: set[ResultToken]) -> npt.NDArray[np.bool_]:
+        """Return whether each player has any of the given results in each round."""
+        return np.isin(self.results, [RESULT_CODES[result_token] for result_token in result_tokens])
+
+    @staticmethod
+    def get_points_table(scoring_point_system: ScoringPointSystem) -> npt.NDArray[np.int64]:
+        """Return the number of points times ten awarded by the given scoring point system by result and color code."""
+        table = np.zeros((MISSING_RESULT_CODE + 1, len(COLOR_CODES)), dtype=np.int64)
+        for (result_token, color_token), points_times_ten in scoring_point_system.score_dict.items():
+            table[RESULT_CODES[result_token], COLOR_CODES[color_token]] = points_times_ten
+        return table
+
+    def get_points_times_ten(self, scoring_point_system: ScoringPointSystem) -> npt.NDArray[np.int64]:
+        """Return the number of points times ten awarded to each player in each round."""
+        return self.get_points_table(scoring_point_system)[self.results, self.colors]
+
+    def get_points_lists(
+        self, scoring_point_system: ScoringPointSystem, accelerations: dict[int, list[int]]
+    ) -> npt.NDArray[np.int64]:
+        """Return the points times ten of each player before each round and after the last one (with acceleration)."""
+        points_times_ten = self.get_points_times_ten(scoring_point_system)
+        points_lists = np.zeros((len(self.starting_numbers), self.results.shape[1] + 1), dtype=np.int64)
+        np.cumsum(points_times_ten, axis=1, out=points_lists[:, 1:])
+
+        row_dict = {starting_number: row for row, starting_number in enumerate(self.starting_numbers.tolist())}
+        for starting_number, acceleration in accelerations.items():
+            if starting_number in row_dict:
+                values = acceleration[: points_lists.shape[1]]
+                points_lists[row_dict[starting_number], : len(values)] += np.array(values, dtype=np.int64)
+
+        return points_lists
+
+    def get_color_counts(self) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        """Return the number of games played with white and black by each player."""
+        whites = np.count_nonzero(self.played & (self.colors == COLOR_CODES[ColorToken.WHITE]), axis=1)
+        blacks = np.count_nonzero(self.played & (self.colors == COLOR_CODES[ColorToken.BLACK]), axis=1)
+        return whites.astype(np.int64), blacks.astype(np.int64)
+
+    def get_last_colors(self) -> tuple[npt.NDArray[np.int8], npt.NDArray[np.int8]]:
+        """
+        Return the colors of the latest and second latest played games of each player.
+
+        The color code of a bye is returned for players who did not play sufficiently many games.
+        """
+        rows = np.arange(len(self.starting_numbers))
+        rounds = np.where(self.played, np.arange(self.results.shape[1]), -1)
+
+        colors = []
+        for _ in range(2):
+            latest = rounds.max(axis=1, initial=-1)
+            found = latest >= 0
+            color = np.full(len(rows), NO_COLOR_CODE, dtype=np.int8)
+            color[found] = self.colors[rows[found], latest[found]]
+            colors.append(color)
+            rounds[rows[found], latest[found]] = -1
+
+        return colors[0], colors[1]
+
+    def get_incompatible_entries(self) -> tuple[npt.NDArray[np.bool_], npt.NDArray[np.bool_], npt.NDArray[np.bool_]]:
+        """
+        Return whether the result of each player in each round is inconsistent with the one of the opponent.
+
+        The result is inconsistent, if the opponent has no result for the round, if the result tokens can not constitute
+        the full result of a game or if the colors are the same. Byes and missing results are never inconsistent.
+        """
+        rounds = np.arange(self.results.shape[1])
+        games = ~_BYE_TABLE[self.results] & (self.results != MISSING_RESULT_CODE)
+
+        missing = games & ((self.indices < 0) | (self.lengths[self.indices] <= rounds))
+        games &= ~missing
+
+        opponent_results = self.results[self.indices, rounds]
+        opponent_colors = self.colors[self.indices, rounds]
+        incompatible_results = games & ~_COMPATIBLE_TABLE[self.results, opponent_results]
+        incompatible_colors = games & (self.colors == opponent_colors)
+
+        return missing, incompatible_results, incompatible_colors
@@ -18,6 +18,7 @@ class ResultToken(str, Enum):
     FULL_POINT_BYE = "F"
     PAIRING_ALLOCATED_BYE = "U"
     ZERO_POINT_BYE = "Z"
+    PENDING = " "
 
     def is_played(self) -> bool:
         """Check whether the given instance counts as a played game."""
@@ -59,4 +60,5 @@ _COMPATIBLE = {
     (ResultToken.WIN, ResultToken.LOSS),
     (ResultToken.LOSS, ResultToken.WIN),
     (ResultToken.DRAW, ResultToken.DRAW),
+    (ResultToken.PENDING, ResultToken.PENDING),
 }
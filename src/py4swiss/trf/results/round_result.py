@@ -68,10 +68,15 @@ class RoundResult(BaseModel):
         #   | (blank) equivalent to Z |
         result_token = ResultToken(string[cls.RESULT_INDEX].upper())
 
-        # Played round results must have an opponent and a color. Similarly, a bye must have no color.
-        if result_token.is_played() and not bool(player_id):
+        # A blank result of a scheduled game denotes a game whose result is still pending.
+        if result_token == ResultToken.PENDING and not bool(player_id):
+            result_token = ResultToken.ZERO_POINT_BYE
+
+        # Played and pending round results must have an opponent and a color. Similarly, a bye must have no color.
+        is_game = result_token.is_played() or result_token == ResultToken.PENDING
+        if is_game and not bool(player_id):
             raise ValueError
-        if result_token.is_played() and color_token == ColorToken.BYE_OR_NOT_PAIRED:
+        if is_game and color_token == ColorToken.BYE_OR_NOT_PAIRED:
             raise ValueError
         if result_token.is_bye() and color_token != ColorToken.BYE_OR_NOT_PAIRED:
             raise ValueError
@@ -138,4 +138,7 @@ class ScoringPointSystem(BaseModel):
 
     def get_points_times_ten(self, round_result: RoundResult) -> int:
         """Return the number of points times ten awarded for a round result of a player."""
+        # Pending results are not awarded any points (yet).
+        if round_result.result == ResultToken.PENDING:
+            return 0
         return self.score_dict[(round_result.result, round_result.color)]
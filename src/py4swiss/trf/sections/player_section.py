@@ -7,6 +7,18 @@ from py4swiss.trf.codes import PlayerCode
 from py4swiss.trf.exceptions import LineError
 from py4swiss.trf.results import RoundResult
 from py4swiss.trf.sections.abstract_section import AbstractSection, Date
+from py4swiss.trf.sections.serialization import (
+    deserialize_date,
+    deserialize_decimal,
+    deserialize_enum,
+    deserialize_integer,
+    deserialize_string,
+    serialize_date,
+    serialize_decimal,
+    serialize_enum,
+    serialize_integer,
+    serialize_string,
+)
 
 
 class Index(int, Enum):
@@ -99,7 +111,11 @@ class PlayerSection(AbstractSection):
         string = string.rstrip()
 
         step_size = RoundResult.CONTENT_LENGTH + RoundResult.BUFFER_LENGTH
-        parts = [string[i : i + RoundResult.CONTENT_LENGTH] for i in range(0, len(string), step_size)]
+        # The blanks at the end of the last round result, e.g. of a pending result, are stripped along with the line.
+        parts = [
+            string[i : i + RoundResult.CONTENT_LENGTH].ljust(RoundResult.CONTENT_LENGTH)
+            for i in range(0, len(string), step_size)
+        ]
 
         return [PlayerSection._get_result(part, index + i * step_size) for i, part in enumerate(parts)]
 
@@ -110,17 +126,17 @@ class PlayerSection(AbstractSection):
             error_message = "Incomplete player section"
             raise LineError(error_message)
 
-        code = cls._deserialize_enum(string[Index.CODE : Index.STARTING_NUMBER - 1], PlayerCode, Index.CODE)
-        starting_number = cls._deserialize_integer(string[Index.STARTING_NUMBER : Index.SEX - 1], Index.STARTING_NUMBER)
-        sex = cls._deserialize_enum(string[Index.SEX : Index.TITLE], Sex, Index.SEX + 1)
-        title = cls._deserialize_enum(string[Index.TITLE : Index.NAME - 1].lower(), Title, Index.TITLE)
-        name = cls._deserialize_string(string[Index.NAME : Index.FIDE_RATING - 1])
-        fide_rating = cls._deserialize_integer(string[Index.FIDE_RATING : Index.FIDE_FEDERATION - 1], Index.FIDE_RATING)
-        fide_federation = cls._deserialize_string(string[Index.FIDE_FEDERATION : Index.FIDE_NUMBER - 1])
-        fide_number = cls._deserialize_integer(string[Index.FIDE_NUMBER : Index.BIRTH_DATE - 1], Index.FIDE_NUMBER)
-        birth_date = cls._deserialize_date(string[Index.BIRTH_DATE : Index.POINTS - 1], Index.BIRTH_DATE)
-        points_times_ten = cls._deserialize_decimal(string[Index.POINTS : Index.RANK - 1], Index.POINTS)
-        rank = cls._deserialize_integer(string[Index.RANK : Index.RESULTS - 1], Index.RANK)
+        code = deserialize_enum(string[Index.CODE : Index.STARTING_NUMBER - 1], PlayerCode, Index.CODE)
+        starting_number = deserialize_integer(string[Index.STARTING_NUMBER : Index.SEX - 1], Index.STARTING_NUMBER)
+        sex = deserialize_enum(string[Index.SEX : Index.TITLE], Sex, Index.SEX + 1)
+        title = deserialize_enum(string[Index.TITLE : Index.NAME - 1].lower(), Title, Index.TITLE)
+        name = deserialize_string(string[Index.NAME : Index.FIDE_RATING - 1])
+        fide_rating = deserialize_integer(string[Index.FIDE_RATING : Index.FIDE_FEDERATION - 1], Index.FIDE_RATING)
+        fide_federation = deserialize_string(string[Index.FIDE_FEDERATION : Index.FIDE_NUMBER - 1])
+        fide_number = deserialize_integer(string[Index.FIDE_NUMBER : Index.BIRTH_DATE - 1], Index.FIDE_NUMBER)
+        birth_date = deserialize_date(string[Index.BIRTH_DATE : Index.POINTS - 1], Index.BIRTH_DATE)
+        points_times_ten = deserialize_decimal(string[Index.POINTS : Index.RANK - 1], Index.POINTS)
+        rank = deserialize_integer(string[Index.RANK : Index.RESULTS - 1], Index.RANK)
         results = cls._deserialize_results(string[Index.RESULTS :], Index.RESULTS)
 
         if code is None:
@@ -154,17 +170,17 @@ class PlayerSection(AbstractSection):
     def to_string(self) -> str:
         """Return a TRF conform string respresentation of the given player section."""
         parts = [
-            self._serialize_enum(self.code).ljust(Index.STARTING_NUMBER - Index.CODE - 1),
-            self._serialize_integer(self.starting_number).rjust(Index.SEX - Index.STARTING_NUMBER - 1),
-            self._serialize_enum(self.sex).rjust(Index.TITLE - Index.SEX),
-            self._serialize_enum(self.title).rjust(Index.NAME - Index.TITLE - 1),
-            self._serialize_string(self.name).ljust(Index.FIDE_RATING - Index.NAME - 1),
-            self._serialize_integer(self.fide_rating).rjust(Index.FIDE_FEDERATION - Index.FIDE_RATING - 1),
-            self._serialize_string(self.fide_federation).ljust(Index.FIDE_NUMBER - Index.FIDE_FEDERATION - 1),
-            self._serialize_integer(self.fide_number).rjust(Index.BIRTH_DATE - Index.FIDE_NUMBER - 1),
-            self._serialize_date(self.birth_date).ljust(Index.POINTS - Index.BIRTH_DATE - 1),
-            self._serialize_decimal(self.points_times_ten).rjust(Index.RANK - Index.POINTS - 1),
-            self._serialize_integer(self.rank).rjust(Index.RESULTS - Index.RANK - 2),
+            serialize_enum(self.code).ljust(Index.STARTING_NUMBER - Index.CODE - 1),
+            serialize_integer(self.starting_number).rjust(Index.SEX - Index.STARTING_NUMBER - 1),
+            serialize_enum(self.sex).rjust(Index.TITLE - Index.SEX),
+            serialize_enum(self.title).rjust(Index.NAME - Index.TITLE - 1),
+            serialize_string(self.name).ljust(Index.FIDE_RATING - Index.NAME - 1),
+            serialize_integer(self.fide_rating).rjust(Index.FIDE_FEDERATION - Index.FIDE_RATING - 1),
+            serialize_string(self.fide_federation).ljust(Index.FIDE_NUMBER - Index.FIDE_FEDERATION - 1),
+            serialize_integer(self.fide_number).rjust(Index.BIRTH_DATE - Index.FIDE_NUMBER - 1),
+            serialize_date(self.birth_date).ljust(Index.POINTS - Index.BIRTH_DATE - 1),
+            serialize_decimal(self.points_times_ten).rjust(Index.RANK - Index.POINTS - 1),
+            serialize_integer(self.rank).rjust(Index.RESULTS - Index.RANK - 2),
             self._serialize_results(self.results)[1:],
         ]
 
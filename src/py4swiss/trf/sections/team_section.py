@@ -6,6 +6,12 @@ from pydantic import Field
 from py4swiss.trf.codes import TeamCode
 from py4swiss.trf.exceptions import LineError
 from py4swiss.trf.sections.abstract_section import AbstractSection
+from py4swiss.trf.sections.serialization import (
+    deserialize_enum,
+    deserialize_string,
+    serialize_enum,
+    serialize_string,
+)
 
 STARTING_NUMBER_SIZE = 4
 
@@ -64,8 +70,8 @@ class TeamSection(AbstractSection):
             error_message = "Incomplete team section"
             raise LineError(error_message)
 
-        code = cls._deserialize_enum(line[Index.CODE : Index.TEAM_NAME - 1], TeamCode, Index.CODE)
-        team_name = cls._deserialize_string(line[Index.TEAM_NAME : Index.PLAYERS - 1])
+        code = deserialize_enum(line[Index.CODE : Index.TEAM_NAME - 1], TeamCode, Index.CODE)
+        team_name = deserialize_string(line[Index.TEAM_NAME : Index.PLAYERS - 1])
         players = cls._deserialize_players(line[Index.PLAYERS :], Index.PLAYERS)
 
         if code is None:
@@ -80,8 +86,8 @@ class TeamSection(AbstractSection):
     def to_string(self) -> str:
         """Return a TRF conform string respresentation of the given team section."""
         parts = [
-            self._serialize_enum(self.code).ljust(Index.TEAM_NAME - Index.CODE - 1),
-            self._serialize_string(self.team_name).ljust(Index.PLAYERS - Index.TEAM_NAME - 1),
+            serialize_enum(self.code).ljust(Index.TEAM_NAME - Index.CODE - 1),
+            serialize_string(self.team_name).ljust(Index.PLAYERS - Index.TEAM_NAME - 1),
             self._serialize_players(self.players),
         ]
 
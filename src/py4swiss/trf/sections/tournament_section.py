@@ -3,6 +3,7 @@ from typing import Self
 from py4swiss.trf.codes import CODE_LENGTH, TournamentCode
 from py4swiss.trf.exceptions import LineError, ParsingError
 from py4swiss.trf.sections.abstract_section import AbstractSection, Date
+from py4swiss.trf.sections.serialization import deserialize_date, serialize_date
 from py4swiss.trf.trf_line import TrfLine
 
 DATES_START_INDEX = 91
@@ -46,7 +47,7 @@ class TournamentSection(AbstractSection):
     @staticmethod
     def _get_date(string: str, index: int = 0) -> Date:
         """Return a date from the given string."""
-        return TournamentSection._deserialize_date(string, index, short=True) or Date(year=0, month=0, day=0)
+        return deserialize_date(string, index, short=True) or Date(year=0, month=0, day=0)
 
     @staticmethod
     def _serialize_dates_of_the_round(dates_of_the_round: list[Date] | None) -> str | None:
@@ -54,7 +55,7 @@ class TournamentSection(AbstractSection):
         if dates_of_the_round is None:
             return None
 
-        parts = [TournamentSection._serialize_date(date, short=True) for date in dates_of_the_round]
+        parts = [serialize_date(date, short=True) for date in dates_of_the_round]
         return (DATES_START_INDEX - CODE_LENGTH - 1) * " " + " ".join(parts)
 
     @staticmethod
@@ -11,6 +11,16 @@ from py4swiss.trf.results import (
     ScoringPointSystemCode,
 )
 from py4swiss.trf.sections.abstract_section import AbstractSection
+from py4swiss.trf.sections.serialization import (
+    deserialize_decimal,
+    deserialize_decimals,
+    deserialize_integer,
+    deserialize_integers,
+    serialize_decimal,
+    serialize_decimals,
+    serialize_integer,
+    serialize_integers,
+)
 from py4swiss.trf.trf_line import TrfLine
 
 PLAYER_ID_LENGTH = 4
@@ -97,7 +107,7 @@ class XSection(AbstractSection):
             error_message = f"Invalid score point system code '{code_string}'"
             raise LineError(error_message, column=index + 1) from e
 
-        points_times_ten = XSection._deserialize_decimal(points_string, index=index + len(code_string) + 1)
+        points_times_ten = deserialize_decimal(points_string, index=index + len(code_string) + 1)
         if points_times_ten is None:
             error_message = f"Invalid score points '{points_string}'"
             raise LineError(error_message, column=index + len(code_string) + 1)
@@ -107,15 +117,15 @@ class XSection(AbstractSection):
     @staticmethod
     def _serialize_player_accelerations(player_id: int, player_accelerations: list[int]) -> str:
         """Return a TRF conform string representation of the given starting number and accelerations."""
-        player_string = XSection._serialize_integer(player_id, PLAYER_ID_LENGTH)
-        accelerations_string = XSection._serialize_decimals(player_accelerations, SCORE_LENGTH)
+        player_string = serialize_integer(player_id, PLAYER_ID_LENGTH)
+        accelerations_string = serialize_decimals(player_accelerations, SCORE_LENGTH)
         return f"{player_string} {accelerations_string}"
 
     @staticmethod
     def _serialize_scoring_points_dict(scoring_points_dict: dict[ScoringPointSystemCode, int]) -> str:
         """Return a TRF conform string representation of the given scoring points dictionary."""
         parts = [
-            f"{code.value}={XSection._serialize_decimal(points_times_ten)}"
+            f"{code.value}={serialize_decimal(points_times_ten)}"
             for code, points_times_ten in scoring_points_dict.items()
         ]
         return " ".join(parts)
@@ -130,12 +140,12 @@ class XSection(AbstractSection):
         id_string = string[:PLAYER_ID_LENGTH]
         accelerations_string = string[PLAYER_ID_LENGTH + 1 :]
 
-        player_id = XSection._deserialize_integer(id_string, index)
+        player_id = deserialize_integer(id_string, index)
         if player_id is None:
             error_message = f"No player id provided '{string}'"
             raise LineError(error_message, column=index + 1)
 
-        return player_id, XSection._deserialize_decimals(accelerations_string, index + PLAYER_ID_LENGTH + 1)
+        return player_id, deserialize_decimals(accelerations_string, index + PLAYER_ID_LENGTH + 1)
 
     @staticmethod
     def _deserialize_scoring_points_dict(string: str, index: int = 0) -> dict[ScoringPointSystemCode, int]:
@@ -169,7 +179,7 @@ class XSection(AbstractSection):
 
         round_line = round_lines[0]
         try:
-            number_of_rounds = cls._deserialize_integer(round_line.content, CODE_LENGTH + 1)
+            number_of_rounds = deserialize_integer(round_line.content, CODE_LENGTH + 1)
         except LineError as e:
             raise ParsingError(e.message, row=round_line.row, column=e.column) from e
         if number_of_rounds is None:
@@ -192,7 +202,7 @@ class XSection(AbstractSection):
         zeroed_ids = set()
         for ids_line in code_line_dict[XCode.ZEROED_IDS]:
             try:
-                zeroed_ids |= set(cls._deserialize_integers(ids_line.content, CODE_LENGTH + 1))
+                zeroed_ids |= set(deserialize_integers(ids_line.content, CODE_LENGTH + 1))
             except LineError as e:
                 raise ParsingError(e.message, row=ids_line.row, column=e.column) from e
 
@@ -221,7 +231,7 @@ class XSection(AbstractSection):
         forbidden_pairs = set()
         for forbidden_pairs_line in code_line_dict[XCode.FORBIDDEN_PAIRS]:
             try:
-                ids = tuple(cls._deserialize_integers(forbidden_pairs_line.content, CODE_LENGTH + 1))
+                ids = tuple(deserialize_integers(forbidden_pairs_line.content, CODE_LENGTH + 1))
                 if len(ids) != 1 + 1:
                     error_message = f"Invalid forbidden pair '{forbidden_pairs_line.content}'"
                     raise LineError(error_message, column=CODE_LENGTH + 1)
@@ -247,7 +257,7 @@ class XSection(AbstractSection):
         configuration_string = self.configuration.to_string()
 
         code_value_pairs = [
-            (XCode.ROUNDS, self._serialize_integer(self.number_of_rounds)),
+            (XCode.ROUNDS, serialize_integer(self.number_of_rounds)),
             (XCode.POINT_SYSTEM, self._serialize_scoring_points_dict(scoring_points_dict)),
         ]
 
@@ -255,7 +265,7 @@ class XSection(AbstractSection):
             code_value_pairs.append((XCode.CONFIGURATIONS, configuration_string))
 
         if bool(self.zeroed_ids):
-            code_value_pairs.append((XCode.ZEROED_IDS, self._serialize_integers(sorted(self.zeroed_ids))))
+            code_value_pairs.append((XCode.ZEROED_IDS, serialize_integers(sorted(self.zeroed_ids))))
 
         code_value_pairs.extend(
             (XCode.ACCELERATIONS, self._serialize_player_accelerations(player_id, player_accelerations))
@@ -263,7 +273,7 @@ class XSection(AbstractSection):
         )
 
         code_value_pairs.extend(
-            (XCode.FORBIDDEN_PAIRS, self._serialize_integers(sorted(pair))) for pair in sorted(self.forbidden_pairs)
+            (XCode.FORBIDDEN_PAIRS, serialize_integers(sorted(pair))) for pair in sorted(self.forbidden_pairs)
         )
 
         return [f"{code.value} {value}" for code, value in code_value_pairs if value is not None]
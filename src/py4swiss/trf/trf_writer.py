@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from py4swiss.trf.codes import PlayerCode
+from py4swiss.trf.results import ColorToken, ResultToken, RoundResult
+from py4swiss.trf.sections.player_section import Index
+from py4swiss.trf.sections.serialization import (
+    deserialize_integer,
+    serialize_decimal,
+    serialize_integer,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from py4swiss.trf.parsed_trf import ParsedTrf
+    from py4swiss.trf.results import ResultMatrix
+    from py4swiss.trf.sections import PlayerSection
+
+# The length of a result block, i.e. the buffer and the content of a single round result.
+BLOCK_LENGTH = RoundResult.BUFFER_LENGTH + RoundResult.CONTENT_LENGTH
+
+# The column at which the first result block starts, including its buffer.
+RESULTS_START = Index.RESULTS - RoundResult.BUFFER_LENGTH
+
+# The largest starting number that fits into the ID columns of a round result.
+MAX_ID = 10**RoundResult.ID_LENGTH - 1
+
+# Lookup tables from color and result codes (including the one of missing results) to the respective characters.
+_COLOR_BYTES = np.frombuffer("".join(color_token.value for color_token in ColorToken).encode(), dtype=np.uint8)
+_RESULT_BYTES = np.frombuffer(
+    "".join(result_token.value for result_token in ResultToken).encode() + b" ", dtype=np.uint8
+)
+
+# The format of the columns of a player section up to and including the rank (see 'PlayerSection.to_string'). There is
+# no whitespace between sex and title.
+_PREFIX_FORMAT = (
+    f"{{:<{Index.STARTING_NUMBER - Index.CODE - 1}}} "
+    f"{{:>{Index.SEX - Index.STARTING_NUMBER - 1}}} "
+    f"{{:>{Index.TITLE - Index.SEX}}}"
+    f"{{:>{Index.NAME - Index.TITLE - 1}}} "
+    f"{{:<{Index.FIDE_RATING - Index.NAME - 1}}} "
+    f"{{:>{Index.FIDE_FEDERATION - Index.FIDE_RATING - 1}}} "
+    f"{{:<{Index.FIDE_NUMBER - Index.FIDE_FEDERATION - 1}}} "
+    f"{{:>{Index.BIRTH_DATE - Index.FIDE_NUMBER - 1}}} "
+    f"{{:<{Index.POINTS - Index.BIRTH_DATE - 1}}} "
+    f"{{:>{Index.RANK - Index.POINTS - 1}}} "
+    f"{{:>{Index.RESULTS - Index.RANK - 2}}}"
+)
+
+
+class TrfWriter:
+    """
+    Writer for TRF(x) files as defined by FIDE and javafo.
+
+    The player sections usually make up most of a TRF and the results most of each player section. Thus, rather than
+    serializing each round result on its own, the result blocks of all players are written into a single fixed-width
+    buffer at once from the result matrix of the TRF. The output is identical to the one of the serializers of the
+    sections (see 'PlayerSection.to_string').
+
+    Once a round is finished, an existing TRF file can be updated with 'append_round', which only patches the points,
+    the rank and the results of the player sections, rather than writing the whole TRF anew.
+    """
+
+    @staticmethod
+    def _get_prefix(player_section: PlayerSection) -> str:
+        """Return the columns of the given player section up to and including its rank."""
+        sex, title, birth_date = player_section.sex, player_section.title, player_section.birth_date
+        fide_rating, fide_number = player_section.fide_rating, player_section.fide_number
+        points_integer, points_decimal = divmod(player_section.points_times_ten, 10)
+
+        return _PREFIX_FORMAT.format(
+            player_section.code.value,
+            player_section.starting_number,
+            "" if sex is None else sex.value,
+            "" if title is None else title.value,
+            player_section.name or "",
+            "" if fide_rating is None else fide_rating,
+            player_section.fide_federation or "",
+            "" if fide_number is None else fide_number,
+            "" if birth_date is None else f"{birth_date.year:04}/{birth_date.month:02}/{birth_date.day:02}",
+            f"{points_integer}.{points_decimal}",
+            player_section.rank,
+        )
+
+    @staticmethod
+    def _get_result_blocks(result_matrix: ResultMatrix) -> list[str]:
+        """Return the result blocks of each player of the given result matrix."""
+        number_of_players, number_of_rounds = result_matrix.results.shape
+        buffer = np.full((number_of_players, number_of_rounds, BLOCK_LENGTH), ord(" "), dtype=np.uint8)
+
+        # An ID of 0 is written as 0000, all other IDs are right aligned.
+        ids = result_matrix.opponents
+        for i in range(RoundResult.ID_LENGTH):
+            digits = ids // 10 ** (RoundResult.ID_LENGTH - 1 - i) % 10
+            leading = (ids > 0) & (ids < 10 ** (RoundResult.ID_LENGTH - 1 - i))
+            buffer[:, :, RoundResult.BUFFER_LENGTH + i] = np.where(leading, ord(" "), ord("0") + digits)
+
+        buffer[:, :, RoundResult.BUFFER_LENGTH + RoundResult.COLOR_INDEX] = _COLOR_BYTES[result_matrix.colors]
+        buffer[:, :, RoundResult.BUFFER_LENGTH + RoundResult.RESULT_INDEX] = _RESULT_BYTES[result_matrix.results]
+
+        data = buffer.tobytes().decode("ascii")
+        row_length = number_of_rounds * BLOCK_LENGTH
+        return [
+            data[row * row_length : row * row_length + length * BLOCK_LENGTH]
+            for row, length in enumerate(result_matrix.lengths.tolist())
+        ]
+
+    @classmethod
+    def get_player_strings(cls, trf: ParsedTrf) -> list[str]:
+        """Return the TRF conform string representations of all player sections of the given TRF."""
+        result_matrix = trf.get_result_matrix()
+
+        # Starting numbers that do not fit into the fixed-width columns are left to the serializer of the sections.
+        if (
+            max(int(result_matrix.starting_numbers.max(initial=0)), int(result_matrix.opponents.max(initial=0)))
+            > MAX_ID
+        ):
+            return [player_section.to_string() for player_section in trf.player_sections]
+
+        result_blocks = cls._get_result_blocks(result_matrix)
+
+        # Without any results the line ends with the whitespace in front of them.
+        return [
+            cls._get_prefix(player_section) + (blocks or " ")
+            for player_section, blocks in zip(trf.player_sections, result_blocks, strict=True)
+        ]
+
+    @classmethod
+    def write(cls, trf: ParsedTrf, file_path: Path) -> None:
+        """Write the given TRF to the given file path."""
+        lines = trf.tournament_section.to_strings()
+        lines += cls.get_player_strings(trf)
+        lines += [team_section.to_string() for team_section in trf.team_sections]
+        lines += trf.x_section.to_strings()
+
+        file_path.parent.mkdir(exist_ok=True)
+        with file_path.open("w", encoding="utf-8") as fh:
+            fh.write("\n".join(lines))
+            fh.write("\n")
+
+    @staticmethod
+    def _patch_line(line: str, player_section: PlayerSection) -> str:
+        """
+        Return the given player section line with the points, the rank and the latest result of the given player section.
+
+        The line needs to contain all but the latest result of the player section.
+        """
+        string = line.rstrip()
+        number_of_results = max(0, -(-(len(string) - RESULTS_START) // BLOCK_LENGTH))
+        if len(string) < RESULTS_START or number_of_results != len(player_section.results) - 1:
+            error_message = (
+                f"Starting number '{player_section.starting_number}' does not differ by exactly one round from the file"
+            )
+            raise ValueError(error_message)
+
+        points = serialize_decimal(player_section.points_times_ten)
+        rank = serialize_integer(player_section.rank)
+        results = string[RESULTS_START:].ljust(number_of_results * BLOCK_LENGTH)
+        return (
+            f"{string[: Index.POINTS]}{points:>{Index.RANK - Index.POINTS - 1}} "
+            f"{rank:>{Index.RESULTS - Index.RANK - 2}}{results}"
+            f"{RoundResult.BUFFER_LENGTH * ' '}{player_section.results[-1].to_string()}"
+        )
+
+    @classmethod
+    def append_round(cls, trf: ParsedTrf, file_path: Path) -> None:
+        """
+        Update the given TRF file after exactly one round was appended to the player sections of the given TRF.
+
+        The file needs to contain all player sections of the given TRF with all but their latest result. Only the
+        points, the rank and the results of the player sections are updated, all other lines of the file remain as
+        they are. Since the lines of the player sections grow, the file is rewritten from the first player section
+        onwards, while anything in front of it is not touched.
+        """
+        player_sections = {player_section.starting_number: player_section for player_section in trf.player_sections}
+        code = PlayerCode.PLAYER.value.encode()
+
+        with file_path.open("r+b") as fh:
+            lines = fh.read().splitlines(keepends=True)
+
+            offset = 0
+            first = len(lines)
+            starting_numbers = set()
+            for i, line in enumerate(lines):
+                if not line.startswith(code):
+                    if first == len(lines):
+                        offset += len(line)
+                    continue
+                first = min(first, i)
+
+                string = line.decode("utf-8")
+                content = string.rstrip("\r\n")
+                starting_number = deserialize_integer(
+                    content[Index.STARTING_NUMBER : Index.SEX - 1], Index.STARTING_NUMBER
+                )
+                if starting_number not in player_sections or starting_number in starting_numbers:
+                    error_message = f"Unexpected player section for starting number '{starting_number}' in the file"
+                    raise ValueError(error_message)
+                starting_numbers.add(starting_number)
+
+                patched = cls._patch_line(content, player_sections[starting_number])
+                lines[i] = (patched + string[len(content) :]).encode("utf-8")
+
+            if starting_numbers != set(player_sections):
+                missing = min(set(player_sections) - starting_numbers)
+                error_message = f"Starting number '{missing}' is missing in the file"
+                raise ValueError(error_message)
+
+            fh.seek(offset)
+            fh.write(b"".join(lines[first:]))
+            fh.truncate()
@@ -0,0 +1,4 @@
+from py4swiss.verification.report import RoundVerification, VerificationReport
+from py4swiss.verification.verifier import TournamentVerifier
+
+__all__ = ["RoundVerification", "TournamentVerifier", "VerificationReport"]
@@ -0,0 +1,54 @@
+from pydantic import BaseModel
+
+from py4swiss.engines.common import Pairing
+
+
+class RoundVerification(BaseModel):
+    """
+    Verification of a single published round.
+
+    Attributes:
+        round_number (int): The number of the round
+        published (list[Pairing]): The round pairing according to the TRF
+        generated (list[Pairing] | None): The round pairing generated by the engine or None if it failed
+        error (str | None): The error raised by the engine if any
+        seconds (float): The wall time in seconds the engine took to generate the round pairing
+
+    """
+
+    round_number: int
+    published: list[Pairing]
+    generated: list[Pairing] | None
+    error: str | None = None
+    seconds: float
+
+    @property
+    def is_match(self) -> bool:
+        """Check whether the generated round pairing is identical to the published one, disregarding the order."""
+        return self.generated is not None and set(self.generated) == set(self.published)
+
+
+class VerificationReport(BaseModel):
+    """
+    Report of a verified tournament.
+
+    Attributes:
+        engine (str): The name of the engine used for the verification
+        rounds (list[RoundVerification]): The verifications of all published rounds in order
+
+    """
+
+    engine: str
+    rounds: list[RoundVerification]
+
+    @property
+    def mismatches(self) -> list[int]:
+        """Return the numbers of all rounds whose published round pairing differs from the generated one."""
+        return [
+            round_verification.round_number for round_verification in self.rounds if not round_verification.is_match
+        ]
+
+    @property
+    def total_seconds(self) -> float:
+        """Return the total wall time in seconds the engine took to generate all round pairings."""
+        return sum(round_verification.seconds for round_verification in self.rounds)
@@ -0,0 +1,102 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from py4swiss.engines.common import Pairing, PairingEngine, PairingError
+from py4swiss.trf import ParsedTrf
+from py4swiss.trf.results import ColorToken, ResultToken, RoundResult
+from py4swiss.verification.report import RoundVerification, VerificationReport
+
+
+def _is_known_in_advance(round_result: RoundResult) -> bool:
+    """Check whether the given result was already known before the round was paired, e.g. a requested bye."""
+    return round_result.id == 0 and round_result.result != ResultToken.PAIRING_ALLOCATED_BYE
+
+
+def _generate_pairings(engine: type[PairingEngine], trf: ParsedTrf) -> tuple[list[Pairing] | None, str | None, float]:
+    """Return the round pairing generated by the given engine, the error raised if any and the time it took."""
+    start = time.perf_counter()
+    try:
+        pairings, error = engine.generate_pairings(trf), None
+    except PairingError as e:
+        pairings, error = None, str(e)
+    return pairings, error, time.perf_counter() - start
+
+
+class TournamentVerifier:
+    """
+    A class for verifying that all published rounds of a tournament match the round pairings of an engine.
+
+    The round pairing of each round only depends on the state of the tournament before it. Thus, the state before each
+    round is derived from the given TRF by truncating the results of all players. Results known before a round was
+    paired, i.e. byes and absences not allocated by the pairing, are retained for that round. All rounds are then
+    paired concurrently in a process pool, such that the verification takes about as long as the slowest round.
+
+    Note that zeroed IDs only refer to the round after the last one in the TRF and are thus disregarded. Likewise, when
+    pairing by rank, the order of the players in the TRF is used for all rounds.
+    """
+
+    def __init__(self, trf: ParsedTrf) -> None:
+        """Initialize a new verifier for the given TRF."""
+        self.trf: ParsedTrf = trf
+
+    @property
+    def number_of_rounds(self) -> int:
+        """Return the number of rounds for which results are published."""
+        return max((len(player_section.results) for player_section in self.trf.player_sections), default=0)
+
+    def get_round_trf(self, round_number: int) -> ParsedTrf:
+        """Return the TRF of the tournament right before the given round was paired."""
+        scoring_point_system = self.trf.x_section.scoring_point_system
+        player_sections = []
+
+        for player_section in self.trf.player_sections:
+            results = player_section.results[: round_number - 1]
+            if len(player_section.results) >= round_number and _is_known_in_advance(
+                player_section.results[round_number - 1]
+            ):
+                results.append(player_section.results[round_number - 1])
+
+            points_times_ten = sum(scoring_point_system.get_points_times_ten(result) for result in results)
+            player_sections.append(
+                player_section.model_copy(update={"results": results, "points_times_ten": points_times_ten})
+            )
+
+        x_section = self.trf.x_section.model_copy(update={"zeroed_ids": set()})
+        return self.trf.model_copy(update={"player_sections": player_sections, "x_section": x_section})
+
+    def get_published_pairings(self, round_number: int) -> list[Pairing]:
+        """Return the published round pairing of the given round."""
+        pairings = []
+
+        for player_section in self.trf.player_sections:
+            if len(player_section.results) < round_number:
+                continue
+            round_result = player_section.results[round_number - 1]
+
+            if round_result.result == ResultToken.PAIRING_ALLOCATED_BYE:
+                pairings.append(Pairing(white=player_section.starting_number, black=0))
+            elif round_result.id != 0 and round_result.color == ColorToken.WHITE:
+                pairings.append(Pairing(white=player_section.starting_number, black=round_result.id))
+
+        return pairings
+
+    def verify(self, engine: type[PairingEngine], max_workers: int | None = None) -> VerificationReport:
+        """Pair all published rounds with the given engine in a process pool and compare the round pairings."""
+        round_numbers = list(range(1, self.number_of_rounds + 1))
+        round_trfs = [self.get_round_trf(round_number) for round_number in round_numbers]
+        rounds = []
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(_generate_pairings, repeat(engine), round_trfs)
+            for round_number, (pairings, error, seconds) in zip(round_numbers, results, strict=True):
+                round_verification = RoundVerification(
+                    round_number=round_number,
+                    published=self.get_published_pairings(round_number),
+                    generated=pairings,
+                    error=error,
+                    seconds=seconds,
+                )
+                rounds.append(round_verification)
+
+        return VerificationReport(engine=f"{engine.__module__}.{engine.__qualname__}", rounds=rounds)
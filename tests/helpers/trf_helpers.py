@@ -0,0 +1,15 @@
+from py4swiss.trf import ParsedTrf
+
+
+def get_trf_after_round(trf: ParsedTrf, round_number: int) -> ParsedTrf:
+    """Return a copy of the given TRF containing only the results up to the given round."""
+    truncated_trf = trf.model_copy(deep=True)
+    scoring_point_system = trf.x_section.scoring_point_system
+
+    for player_section in truncated_trf.player_sections:
+        player_section.results = player_section.results[:round_number]
+        player_section.points_times_ten = sum(
+            scoring_point_system.get_points_times_ten(round_result) for round_result in player_section.results
+        )
+
+    return truncated_trf
@@ -0,0 +1,224 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from py4swiss.caching import DiskPairingCache, MemoryPairingCache, SpeculativePairer
+from py4swiss.caching.speculative_pairer import FORFEIT_OUTCOMES, GAME_OUTCOMES
+from py4swiss.engines import DubovEngine, DutchEngine
+from py4swiss.engines.common import Pairing
+from py4swiss.main import main
+from py4swiss.trf import ParsedTrf, TrfParser
+from py4swiss.trf.results import ColorToken, ResultToken, RoundResult
+
+DATA_DIRECTORY = Path(__file__).parent / "data"
+
+MAX_SIZE = 2
+UNFINISHED_GAMES = 2
+MAX_WORKERS = 2
+
+
+class CountingEngine(DutchEngine):
+    """A Dutch engine counting how often it generated a round pairing."""
+
+    calls = 0
+
+    @classmethod
+    def generate_pairings(cls, trf: ParsedTrf) -> list[Pairing]:
+        """Return the round pairing of the next round for the given TRF."""
+        cls.calls += 1
+        return super().generate_pairings(trf)
+
+
+def _get_trf() -> ParsedTrf:
+    """Return the TRF used for testing."""
+    return TrfParser.parse(DATA_DIRECTORY / "javafo_example.trf")
+
+
+def _get_trf_in_progress() -> tuple[ParsedTrf, list[Pairing]]:
+    """Return a TRF in which all but some games of the next round are finished as well as the unfinished games."""
+    trf = _get_trf()
+    pairings = DutchEngine.generate_pairings(trf)
+    unfinished_games = [pairing for pairing in pairings if pairing.black != 0][:UNFINISHED_GAMES]
+    player_sections = {player_section.starting_number: player_section for player_section in trf.player_sections}
+
+    for pairing in pairings:
+        if pairing in unfinished_games:
+            continue
+
+        if pairing.black == 0:
+            bye = RoundResult(id=0, color=ColorToken.BYE_OR_NOT_PAIRED, result=ResultToken.PAIRING_ALLOCATED_BYE)
+            round_results = [(pairing.white, bye)]
+        else:
+            round_results = [
+                (pairing.white, RoundResult(id=pairing.black, color=ColorToken.WHITE, result=ResultToken.DRAW)),
+                (pairing.black, RoundResult(id=pairing.white, color=ColorToken.BLACK, result=ResultToken.DRAW)),
+            ]
+
+        for player, round_result in round_results:
+            player_sections[player].results.append(round_result)
+            player_sections[player].points_times_ten += trf.x_section.scoring_point_system.get_points_times_ten(
+                round_result
+            )
+
+    # Players who are not paired, e.g. since they are absent, do not get any points for the round.
+    paired = {player for pairing in pairings for player in (pairing.white, pairing.black)}
+    for starting_number, player_section in player_sections.items():
+        if starting_number not in paired:
+            player_section.results.append(
+                RoundResult(id=0, color=ColorToken.BYE_OR_NOT_PAIRED, result=ResultToken.ZERO_POINT_BYE)
+            )
+
+    return trf, unfinished_games
+
+
+def test_fingerprint() -> None:
+    """Test whether the fingerprint only depends on pairing-relevant information."""
+    trf = _get_trf()
+    fingerprint = DutchEngine.get_fingerprint(trf)
+
+    assert DutchEngine.get_fingerprint(_get_trf()) == fingerprint
+    assert DubovEngine.get_fingerprint(trf) != fingerprint
+
+    trf.tournament_section.tournament_name = "Renamed"
+    trf.tournament_section.date_of_start = "2026-01-01"
+    trf.player_sections[0].name = "Renamed"
+    trf.player_sections[0].fide_rating = 1000
+    assert DutchEngine.get_fingerprint(trf) == fingerprint
+
+    # Ratings are relevant for the Dubov System.
+    assert DubovEngine.get_fingerprint(trf) != DubovEngine.get_fingerprint(_get_trf())
+
+    trf.x_section.zeroed_ids.add(1)
+    assert DutchEngine.get_fingerprint(trf) != fingerprint
+
+    trf = _get_trf()
+    trf.x_section.configuration.first_round_color = not trf.x_section.configuration.first_round_color
+    assert DutchEngine.get_fingerprint(trf) != fingerprint
+
+    trf = _get_trf()
+    trf.player_sections[0].results[0] = RoundResult(
+        id=0, color=ColorToken.BYE_OR_NOT_PAIRED, result=ResultToken.ZERO_POINT_BYE
+    )
+    assert DutchEngine.get_fingerprint(trf) != fingerprint
+
+
+def test_memory_pairing_cache() -> None:
+    """Test whether the in-memory cache avoids running the engine again and discards old entries."""
+    CountingEngine.calls = 0
+    cache = MemoryPairingCache(max_size=MAX_SIZE)
+    trf = _get_trf()
+
+    pairings = cache.generate_pairings(CountingEngine, trf)
+    assert pairings == DutchEngine.generate_pairings(trf)
+    assert cache.generate_pairings(CountingEngine, trf) == pairings
+    assert CountingEngine.calls == 1
+
+    for i in range(MAX_SIZE):
+        cache.set(str(i), [])
+    assert len(cache) == MAX_SIZE
+    assert cache.get(CountingEngine.get_fingerprint(trf)) is None
+
+    cache.clear()
+    assert len(cache) == 0
+
+    with pytest.raises(ValueError, match="Maximum size must be positive"):
+        MemoryPairingCache(max_size=0)
+
+
+def test_disk_pairing_cache(tmp_path: Path) -> None:
+    """Test whether round pairings are stored on disk and used by the in-memory cache."""
+    CountingEngine.calls = 0
+    trf = _get_trf()
+    fingerprint = CountingEngine.get_fingerprint(trf)
+
+    pairings = DiskPairingCache(tmp_path).generate_pairings(CountingEngine, trf)
+    assert DiskPairingCache(tmp_path).get(fingerprint) == pairings
+
+    cache = MemoryPairingCache(store=DiskPairingCache(tmp_path))
+    assert cache.generate_pairings(CountingEngine, trf) == pairings
+    assert len(cache) == 1
+    assert CountingEngine.calls == 1
+
+    # Corrupted files are treated as missing entries.
+    (tmp_path / f"{fingerprint}.json").write_text("corrupted", encoding="utf-8")
+    assert DiskPairingCache(tmp_path).get(fingerprint) is None
+    assert DiskPairingCache(tmp_path).get("missing") is None
+
+
+def test_speculative_pairer() -> None:
+    """Test whether the round pairings of all possible outcomes of the unfinished games are prepared."""
+    trf, unfinished_games = _get_trf_in_progress()
+    pairer = SpeculativePairer(DutchEngine, max_workers=MAX_WORKERS)
+
+    assert pairer.prepare(trf, unfinished_games) == len(GAME_OUTCOMES) ** UNFINISHED_GAMES
+
+    for scenario in pairer.get_scenarios(trf, unfinished_games):
+        pairings = pairer.cache.get(DutchEngine.get_fingerprint(scenario))
+        assert pairings == DutchEngine.generate_pairings(scenario)
+        assert pairer.generate_pairings(scenario) == pairings
+
+    pairer = SpeculativePairer(DutchEngine, forfeits=True)
+    scenarios = list(pairer.get_scenarios(trf, unfinished_games))
+    assert len(scenarios) == len(GAME_OUTCOMES + FORFEIT_OUTCOMES) ** UNFINISHED_GAMES
+
+    with pytest.raises(ValueError, match="multiple unfinished games"):
+        pairer.prepare(trf, [unfinished_games[0], unfinished_games[0]])
+
+    # Players need to complete the current round and all other players need to have finished it.
+    finished_game = next(
+        Pairing(white=section.starting_number, black=section.results[-1].id)
+        for section in trf.player_sections
+        if len(section.results) > min(len(other.results) for other in trf.player_sections)
+        and section.results[-1].color == ColorToken.WHITE
+    )
+    with pytest.raises(ValueError, match="already has a result"):
+        pairer.prepare(trf, [*unfinished_games, finished_game])
+    with pytest.raises(ValueError, match="different number of results"):
+        pairer.prepare(trf, unfinished_games[1:])
+
+
+def test_speculative_pairer_pending_round(tmp_path: Path) -> None:
+    """Test whether the TRF written by 'py4swiss pair -o' can be used to prepare the next round."""
+    pairings_file = tmp_path / "pairings.txt"
+    output_file = tmp_path / "output.trf"
+
+    sys.argv = ["py4swiss", "-t", str(DATA_DIRECTORY / "javafo_example.trf"), "-p", str(pairings_file)]
+    sys.argv += ["-o", str(output_file)]
+    main()
+
+    # Enter the results of all but some games, which remain pending.
+    trf = TrfParser.parse(output_file)
+    games = [pairing for pairing in Pairing.from_file(pairings_file) if pairing.white and pairing.black]
+    unfinished_games = games[:UNFINISHED_GAMES]
+    unfinished_players = {player for game in unfinished_games for player in (game.white, game.black)}
+    for player_section in trf.player_sections:
+        if (
+            player_section.results[-1].result == ResultToken.PENDING
+            and player_section.starting_number not in unfinished_players
+        ):
+            player_section.results[-1].result = ResultToken.DRAW
+            player_section.points_times_ten += trf.x_section.scoring_point_system.get_points_times_ten(
+                player_section.results[-1]
+            )
+
+    # The pending results are replaced, such that the scenarios are the same as without them.
+    pairer = SpeculativePairer(DutchEngine, max_workers=MAX_WORKERS)
+    assert pairer.prepare(trf, unfinished_games) == len(GAME_OUTCOMES) ** UNFINISHED_GAMES
+
+    trf_in_progress, unfinished_games_in_progress = _get_trf_in_progress()
+    assert unfinished_games_in_progress == unfinished_games
+    assert [DutchEngine.get_fingerprint(scenario) for scenario in pairer.get_scenarios(trf, unfinished_games)] == [
+        DutchEngine.get_fingerprint(scenario) for scenario in pairer.get_scenarios(trf_in_progress, unfinished_games)
+    ]
+
+    for scenario in pairer.get_scenarios(trf, unfinished_games):
+        assert not scenario.has_pending_results()
+        assert pairer.generate_pairings(scenario) == DutchEngine.generate_pairings(scenario)
+
+    # All pending results need to belong to the given unfinished games.
+    with pytest.raises(ValueError, match="no unfinished game"):
+        pairer.prepare(trf, unfinished_games[1:])
+    swapped_game = Pairing(white=unfinished_games[0].black, black=unfinished_games[0].white)
+    with pytest.raises(ValueError, match="different game"):
+        pairer.prepare(trf, [swapped_game, *unfinished_games[1:]])
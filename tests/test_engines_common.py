@@ -1,12 +1,82 @@
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import EntryPoint
 from pathlib import Path
 
+import numpy as np
 import pytest
 
-from py4swiss.engines.common import ColorPreferenceSide, Pairing, PairingEngine
+from py4swiss.engines import (
+    BursteinEngine,
+    DubovEngine,
+    DutchEngine,
+    burstein,
+    dubov,
+    dutch,
+    get_engine,
+    get_engine_names,
+    registry,
+)
+from py4swiss.engines.burstein.state import State as BursteinState
+from py4swiss.engines.common import (
+    ColorPreference,
+    ColorPreferenceSide,
+    ColorPreferenceStrength,
+    Pairing,
+    PairingEngine,
+    PairingError,
+    PairingFormat,
+    color_difference,
+    get_last_different_colors,
+    get_opponents,
+    had_white_last,
+    has_played,
+    last_two_same_color,
+)
+from py4swiss.engines.common.color_preference import (
+    codes_conflict,
+    get_side_code,
+    get_strength_code,
+)
+from py4swiss.engines.dubov.state import State as DubovState
+from py4swiss.engines.dutch.bracket import Bracket as DutchBracket
+from py4swiss.engines.matching import AbsoluteCriterion, Compatibility
+from py4swiss.simulation import SimulationSettings, TournamentSimulator
+from py4swiss.trf import ParsedTrf, TrfParser
+from py4swiss.trf.results import ColorToken, ResultToken, RoundResult
 
 DATA_DIRECTORY = Path(__file__).parent / "data"
 
 
+class CustomPlayer:
+    """A player identified by its ID only for testing purposes."""
+
+    def __init__(self, player_id: int) -> None:
+        """Initialize a new player with the given ID."""
+        self.id = player_id
+
+    def __hash__(self) -> int:
+        """Return the hash of the ID."""
+        return hash(self.id)
+
+
+class CustomCriterion(AbsoluteCriterion[CustomPlayer]):
+    """An absolute criterion only allowing players with IDs of different parity to be paired for testing purposes."""
+
+    @classmethod
+    def evaluate(cls, player_1: CustomPlayer, player_2: CustomPlayer) -> bool:
+        """Check whether the IDs of the given players have different parity."""
+        return (player_1.id - player_2.id) % 2 == 1
+
+
+class CustomEngine(PairingEngine):
+    """A pairing engine registered via an entry point for testing purposes."""
+
+    @classmethod
+    def generate_pairings(cls, trf: ParsedTrf) -> list[Pairing]:
+        """Return an empty round pairing."""
+        return []
+
+
 def test_pairings(tmp_path: Path) -> None:
     """Test reading pairings from and writing pairíngs to files."""
     pairings_file = DATA_DIRECTORY / "pairings_example.txt"
@@ -23,6 +93,103 @@ def test_pairings(tmp_path: Path) -> None:
     assert hash(tuple(pairings)) == hash(tuple(pairings_copy))
 
 
+@pytest.mark.parametrize("pairing_format", list(PairingFormat))
+def test_pairing_formats(tmp_path: Path, pairing_format: PairingFormat) -> None:
+    """Test writing pairings to and reading them from files of all formats."""
+    pairings = [*Pairing.from_file(DATA_DIRECTORY / "pairings_example.txt"), Pairing(white=9, black=0)]
+    tmp_file = tmp_path / f"pairings.{pairing_format.value}"
+
+    PairingEngine.write_pairings_to_file(pairings, tmp_file)
+    assert PairingFormat.from_path(tmp_file) == pairing_format
+    assert Pairing.from_file(tmp_file) == pairings
+    assert Pairing.from_file(tmp_file, pairing_format) == pairings
+
+    # The format can also be given explicitly regardless of the suffix.
+    other_file = tmp_path / "pairings.out"
+    PairingEngine.write_pairings_to_file(pairings, other_file, pairing_format)
+    assert other_file.read_bytes() == tmp_file.read_bytes()
+    assert Pairing.from_file(other_file, pairing_format) == pairings
+
+    array = Pairing.to_array(pairings)
+    assert array.dtype == np.int32
+    assert array.shape == (len(pairings), 2)
+    assert Pairing.from_array(array) == pairings
+    assert Pairing.from_array(Pairing.to_array([])) == []
+
+    with pytest.raises(ValueError):
+        Pairing.from_array(np.array([[1, 1]]))
+    with pytest.raises(ValueError):
+        Pairing.from_array(np.array([1, 2, 3]))
+
+
+def test_pairings_to_trf(tmp_path: Path) -> None:
+    """Test adding a round pairing to a TRF as a new round with pending results."""
+    settings = SimulationSettings(number_of_players=11, number_of_rounds=3, seed=47)
+    trf = TournamentSimulator(settings).simulate(DutchEngine).trf
+    trf.x_section.number_of_rounds += 1
+
+    # A requested bye for the next round is kept.
+    player_section = trf.player_sections[0]
+    requested_bye = RoundResult(id=0, color=ColorToken.BYE_OR_NOT_PAIRED, result=ResultToken.HALF_POINT_BYE)
+    player_section.results.append(requested_bye)
+    player_section.points_times_ten += trf.x_section.scoring_point_system.get_points_times_ten(requested_bye)
+
+    pairings = DutchEngine.generate_pairings(trf)
+    with pytest.raises(ValueError, match="already has a result"):
+        DutchEngine.write_pairings_to_trf([Pairing(white=player_section.starting_number, black=0)], trf)
+    DutchEngine.write_pairings_to_trf(pairings, trf)
+
+    trf_file = tmp_path / "pending.trf"
+    trf.write_to_file(trf_file)
+    parsed_trf = TrfParser.parse(trf_file)
+    assert parsed_trf == trf
+    assert parsed_trf.has_pending_results()
+
+    round_results = {section.starting_number: section.results[-1] for section in parsed_trf.player_sections}
+    assert round_results[player_section.starting_number] == requested_bye
+    for pairing in pairings:
+        if not bool(pairing.white) or not bool(pairing.black):
+            assert round_results[pairing.white or pairing.black].result == ResultToken.PAIRING_ALLOCATED_BYE
+            continue
+        assert (round_results[pairing.white].id, round_results[pairing.white].color) == (
+            pairing.black,
+            ColorToken.WHITE,
+        )
+        assert (round_results[pairing.black].id, round_results[pairing.black].color) == (
+            pairing.white,
+            ColorToken.BLACK,
+        )
+        assert round_results[pairing.white].result == round_results[pairing.black].result == ResultToken.PENDING
+
+    # Pending results do not award any points, while other unknown results are still rejected.
+    scoring_point_system = trf.x_section.scoring_point_system
+    pending_result = RoundResult(id=1, color=ColorToken.WHITE, result=ResultToken.PENDING)
+    assert scoring_point_system.get_points_times_ten(pending_result) == 0
+    with pytest.raises(KeyError):
+        scoring_point_system.get_points_times_ten(
+            RoundResult(id=0, color=ColorToken.BYE_OR_NOT_PAIRED, result=ResultToken.WIN)
+        )
+
+    # The next round can only be paired once all results are known.
+    with pytest.raises(PairingError):
+        DutchEngine.generate_pairings(parsed_trf)
+
+    for player_section in parsed_trf.player_sections:
+        if player_section.results[-1].result == ResultToken.PENDING:
+            player_section.results[-1].result = ResultToken.DRAW
+            player_section.points_times_ten += 5
+
+    parsed_trf.validate_contents()
+    assert not parsed_trf.has_pending_results()
+    assert DutchEngine.generate_pairings(parsed_trf)
+
+    # Players need to be part of the TRF and may not be paired twice.
+    with pytest.raises(ValueError, match="missing"):
+        DutchEngine.write_pairings_to_trf([Pairing(white=1, black=99)], parsed_trf)
+    with pytest.raises(ValueError, match="multiple pairings"):
+        DutchEngine.write_pairings_to_trf([Pairing(white=1, black=2), Pairing(white=3, black=1)], parsed_trf)
+
+
 def test_pairing_error() -> None:
     """Test whether reading invalid pairing files throws pairing errors."""
     pairings_file = DATA_DIRECTORY / "malformed_pairings.txt"
@@ -53,3 +220,184 @@ def test_color_preference() -> None:
     assert not ColorPreferenceSide.NONE.conflicts(ColorPreferenceSide.WHITE)
     assert not ColorPreferenceSide.NONE.conflicts(ColorPreferenceSide.BLACK)
     assert not ColorPreferenceSide.NONE.conflicts(ColorPreferenceSide.NONE)
+
+    for side in ColorPreferenceSide:
+        for strength in ColorPreferenceStrength:
+            color_preference = ColorPreference.get(side, strength)
+            assert color_preference == ColorPreference(side=side, strength=strength)
+            assert color_preference is ColorPreference.get(side, strength)
+            assert color_preference is ColorPreference.from_code(color_preference.code)
+            assert get_side_code(color_preference.code) == side
+            assert get_strength_code(color_preference.code) == strength
+
+    color_preferences = [
+        ColorPreference.get(side, strength) for side in ColorPreferenceSide for strength in ColorPreferenceStrength
+    ]
+    for color_preference_1 in color_preferences:
+        for color_preference_2 in color_preferences:
+            conflict = color_preference_1.side.conflicts(color_preference_2.side)
+            assert color_preference_1.conflicts(color_preference_2) == conflict
+            assert codes_conflict(color_preference_1.code, color_preference_2.code) == conflict
+
+
+def test_engine_registry(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the resolution of pairing engines by name."""
+    assert get_engine_names() == ["burstein", "dubov", "dutch"]
+    assert get_engine("dutch") is DutchEngine
+
+    with pytest.raises(ValueError):
+        get_engine("knockout")
+
+    custom = EntryPoint(name="custom", value="tests.test_engines_common:CustomEngine", group=registry.ENTRY_POINT_GROUP)
+    invalid = EntryPoint(name="invalid", value="pathlib:Path", group=registry.ENTRY_POINT_GROUP)
+    monkeypatch.setattr(registry, "entry_points", lambda group: [custom, invalid])
+
+    assert get_engine_names() == ["burstein", "custom", "dubov", "dutch", "invalid"]
+    assert get_engine("custom") is CustomEngine
+
+    with pytest.raises(TypeError):
+        get_engine("invalid")
+
+
+def test_concurrent_pairings() -> None:
+    """Test whether pairing the same TRF concurrently yields the same round pairings as pairing it sequentially."""
+    number_of_players, number_of_rounds, number_of_workers = 31, 5, 4
+    settings = SimulationSettings(number_of_players=number_of_players, number_of_rounds=number_of_rounds, seed=1105)
+
+    for name in get_engine_names():
+        engine = get_engine(name)
+        trf = TournamentSimulator(settings).simulate(engine, number_of_rounds - 1).trf
+        expected = engine.generate_pairings(trf)
+
+        with ThreadPoolExecutor(max_workers=number_of_workers) as executor:
+            results = list(executor.map(engine.generate_pairings, number_of_workers * [trf]))
+
+        assert all(pairings == expected for pairings in results)
+
+
+def test_concurrent_roles() -> None:
+    """Test whether brackets over the same players keep their own roles, even when they are set up concurrently."""
+    number_of_players, number_of_rounds, number_of_workers = 31, 5, 4
+    settings = SimulationSettings(number_of_players=number_of_players, number_of_rounds=number_of_rounds, seed=1106)
+
+    def get_dutch_roles(players: list[dutch.player.Player], roles: dict[int, dutch.player.PlayerRole]) -> list[int]:
+        mdp_list, resident_list, lower_list = (
+            [player for player in players if roles[player.id] == role] for role in dutch.player.PlayerRole
+        )
+        bracket = DutchBracket.from_data(mdp_list, resident_list, lower_list, number_of_rounds, collapsed=False)
+        return [bracket.get_role(player) for player in players]
+
+    def get_dubov_roles(players: list[dubov.player.Player], roles: dict[int, dubov.player.PlayerRole]) -> list[int]:
+        state = DubovState.from_data(players, roles, number_of_rounds, number_of_rounds, set(), initial_color=True)
+        return [state.get_role(player) for player in players]
+
+    def get_burstein_roles(
+        players: list[burstein.player.Player], roles: dict[int, burstein.player.PlayerRole]
+    ) -> list[int]:
+        state = BursteinState.from_data(players, roles, set(), initial_color=True)
+        return [state.get_role(player) for player in players]
+
+    for engine, module, get_roles in (
+        (DutchEngine, dutch, get_dutch_roles),
+        (DubovEngine, dubov, get_dubov_roles),
+        (BursteinEngine, burstein, get_burstein_roles),
+    ):
+        # The roles are kept by the brackets and states only, rather than written onto the players.
+        assert "role" not in module.player.Player.model_fields
+
+        trf = TournamentSimulator(settings).simulate(engine, number_of_rounds - 1).trf
+        players = module.player.get_player_infos_from_trf(trf)
+        role_list = list(module.player.PlayerRole)
+
+        # Each player has a different role in each of the brackets, all of which share the same players.
+        roles_list = [
+            {player.id: role_list[(i + shift) % len(role_list)] for i, player in enumerate(players)}
+            for shift in range(number_of_workers * len(role_list))
+        ]
+        with ThreadPoolExecutor(max_workers=number_of_workers) as executor:
+            results = list(executor.map(get_roles, len(roles_list) * [players], roles_list))
+
+        for result, roles in zip(results, roles_list, strict=True):
+            assert result == [roles[player.id] for player in players]
+
+
+def test_reuse_matcher(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test whether reusing the matcher between brackets yields the same round pairings as setting up new ones."""
+    settings = SimulationSettings(number_of_players=41, number_of_rounds=7, forfeit_ratio=0.1, bye_ratio=0.1, seed=837)
+
+    for engine in (DubovEngine, BursteinEngine):
+        report = TournamentSimulator(settings).simulate(engine)
+
+        monkeypatch.setattr(engine, "REUSE_MATCHER", False)
+        report_without_reuse = TournamentSimulator(settings).simulate(engine)
+
+        assert report.trf == report_without_reuse.trf
+
+
+def test_compatibility() -> None:
+    """Test determining which players are allowed to be paired with each other."""
+    players = [CustomPlayer(player_id) for player_id in range(1, 7)]
+    forbidden_pairs = {(1, 2), (6, 3)}
+    compatibility = Compatibility(players, (CustomCriterion,), forbidden_pairs)
+
+    for player_1 in players:
+        for player_2 in players:
+            is_forbidden = bool({(player_1.id, player_2.id), (player_2.id, player_1.id)} & forbidden_pairs)
+            is_allowed = CustomCriterion.evaluate(player_1, player_2) and not is_forbidden
+            assert compatibility.is_allowed_pair(player_1, player_2) == is_allowed
+
+
+def test_absolute_criterion_masks() -> None:
+    """Test whether the bitmasks of the absolute criteria agree with evaluating the criteria for each pair of players."""
+    number_of_players, number_of_rounds = 36, 6
+    settings = SimulationSettings(number_of_players=number_of_players, number_of_rounds=number_of_rounds, seed=2203)
+
+    for engine, module in ((DutchEngine, dutch), (DubovEngine, dubov), (BursteinEngine, burstein)):
+        trf = TournamentSimulator(settings).simulate(engine, number_of_rounds - 1).trf
+        players = module.player.get_player_infos_from_trf(trf)
+
+        for criterion in (module.criteria.absolute.C1, module.criteria.absolute.C3):
+            masks = criterion.get_masks(players)
+            for i, player_1 in enumerate(players):
+                for j, player_2 in enumerate(players):
+                    if i != j:
+                        assert bool(masks[i] >> j & 1) == criterion.evaluate(player_1, player_2)
+
+
+def test_player_history() -> None:
+    """Test whether the packed histories of the players agree with their round results."""
+    number_of_players, number_of_rounds = 23, 7
+    settings = SimulationSettings(
+        number_of_players=number_of_players, number_of_rounds=number_of_rounds, forfeit_ratio=0.1, seed=1312
+    )
+
+    for engine, module in ((DutchEngine, dutch), (DubovEngine, dubov), (BursteinEngine, burstein)):
+        trf = TournamentSimulator(settings).simulate(engine, number_of_rounds - 1).trf
+        players = module.player.get_player_infos_from_trf(trf)
+        sections = {section.starting_number: section for section in trf.player_sections}
+
+        colors_dict = {}
+        for player in players:
+            games = [round_result for round_result in sections[player.id].results if round_result.result.is_played()]
+            opponents = [round_result.id for round_result in games]
+            colors = [round_result.color == ColorToken.WHITE for round_result in games]
+            colors_dict[player.id] = colors
+
+            assert player.games == len(games)
+            assert list(get_opponents(player)) == sorted(opponents)
+            assert all(has_played(player, player_id) == (player_id in opponents) for player_id in sections)
+            assert color_difference(player) == 2 * sum(colors) - len(colors)
+            assert last_two_same_color(player) == (len(colors) > 1 and colors[-1] == colors[-2])
+            assert had_white_last(player) == (len(colors) > 0 and colors[-1])
+
+        for player_1 in players:
+            for player_2 in players:
+                different_colors = [
+                    color_1
+                    for color_1, color_2 in zip(
+                        colors_dict[player_1.id][::-1], colors_dict[player_2.id][::-1], strict=False
+                    )
+                    if color_1 != color_2
+                ]
+                expected = different_colors[0] if different_colors else None
+                assert get_last_different_colors(player_1, player_2) == expected
@@ -1,12 +1,53 @@
+import subprocess
 import sys
 from pathlib import Path
 
 import pytest
 
+from py4swiss import engines
+from py4swiss.engines import DutchEngine
+from py4swiss.engines.common import Pairing, PairingFormat
 from py4swiss.main import main
+from py4swiss.profiling import Profile, replay_trace
+from py4swiss.simulation import SimulationSettings, TournamentSimulator
+from py4swiss.standings import Standings, Tiebreak
+from py4swiss.trf import TrfParser
+from py4swiss.trf.results import ColorToken, ResultToken
+from py4swiss.verification import VerificationReport
 
 DATA_DIRECTORY = Path(__file__).parent / "data"
 
+# Modules which are only needed by some commands or options and should thus not be imported by the command line entry
+# point itself, since they would slow down the startup of every pairing run.
+LAZY_MODULES = (
+    "concurrent.futures.process",
+    "multiprocessing",
+    "py4swiss.caching",
+    "py4swiss.profiling",
+    "py4swiss.standings.standings_table",
+    "py4swiss.tiebreaks",
+    "py4swiss.verification",
+)
+
+NUMBER_OF_PLAYERS = 20
+NUMBER_OF_ROUNDS = 4
+
+
+def _get_import_times(module: str) -> dict[str, int]:
+    """Return a map from each module imported by the given module to its cumulative import time in microseconds."""
+    cmd = [sys.executable, "-X", "importtime", "-c", f"import {module}"]
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+
+    import_times = {}
+    for line in result.stderr.splitlines():
+        # Format: "import time: <self [us]> | <cumulative [us]> | <imported package>"
+        parts = line.removeprefix("import time:").split("|")
+        if len(parts) != 1 + 2 or not parts[1].strip().isdigit():
+            continue
+        import_times[parts[2].strip()] = int(parts[1])
+
+    return import_times
+
 
 def test_engine_dutch(tmp_path: Path) -> None:
     """Test running py4swiss using the Dutch engine."""
@@ -17,6 +58,126 @@ def test_engine_dutch(tmp_path: Path) -> None:
     main()
 
 
+def test_pairing_format(tmp_path: Path) -> None:
+    """Test running py4swiss with pairings written in different formats."""
+    trf_file = DATA_DIRECTORY / "javafo_example.trf"
+    text_file = tmp_path / "pairings.txt"
+    npy_file = tmp_path / "pairings.npy"
+    csv_file = tmp_path / "pairings.out"
+
+    sys.argv = ["py4swiss", "-t", str(trf_file), "-p", str(text_file)]
+    main()
+    sys.argv = ["py4swiss", "-t", str(trf_file), "-p", str(npy_file)]
+    main()
+    sys.argv = ["py4swiss", "-t", str(trf_file), "-p", str(csv_file), "-f", "csv"]
+    main()
+
+    pairings = Pairing.from_file(text_file)
+    assert Pairing.from_file(npy_file) == pairings
+    assert Pairing.from_file(csv_file, PairingFormat.CSV) == pairings
+
+
+def test_trf_output(tmp_path: Path) -> None:
+    """Test running py4swiss with the round pairing added to the TRF."""
+    trf_file = DATA_DIRECTORY / "javafo_example.trf"
+    pairings_file = tmp_path / "pairings.txt"
+    output_file = tmp_path / "output.trf"
+
+    sys.argv = ["py4swiss", "-t", str(trf_file), "-p", str(pairings_file), "-o", str(output_file)]
+    main()
+
+    trf = TrfParser.parse(trf_file)
+    output_trf = TrfParser.parse(output_file)
+    assert output_trf.has_pending_results()
+
+    games = set()
+    for player_section, output_player_section in zip(trf.player_sections, output_trf.player_sections, strict=True):
+        assert output_player_section.results[:-1] == player_section.results
+        round_result = output_player_section.results[-1]
+        if round_result.result == ResultToken.PENDING and round_result.color == ColorToken.WHITE:
+            games.add(Pairing(white=player_section.starting_number, black=round_result.id))
+
+    assert games == {pairing for pairing in Pairing.from_file(pairings_file) if pairing.white and pairing.black}
+
+
+def test_profile(tmp_path: Path) -> None:
+    """Test running py4swiss with a profile of the pairing run."""
+    trf_file = DATA_DIRECTORY / "javafo_example.trf"
+    pairings_file = tmp_path / "pairings.txt"
+    profile_file = tmp_path / "profile.json"
+
+    sys.argv = ["py4swiss", "-t", str(trf_file), "-p", str(pairings_file), "--profile", str(profile_file)]
+    main()
+
+    profile = Profile.model_validate_json(profile_file.read_text(encoding="utf-8"))
+    assert {"parse", "pairing", "write"} <= set(profile.phases)
+    assert profile.counters["solves"] > 0
+
+
+def test_cache(tmp_path: Path) -> None:
+    """Test running py4swiss twice with a cache of round pairings."""
+    trf_file = DATA_DIRECTORY / "javafo_example.trf"
+    pairings_file = tmp_path / "pairings.txt"
+    cache_directory = tmp_path / "cache"
+
+    sys.argv = ["py4swiss", "-t", str(trf_file), "-p", str(pairings_file), "--cache", str(cache_directory)]
+    main()
+    pairings = pairings_file.read_text(encoding="utf-8")
+    main()
+
+    assert len(list(cache_directory.iterdir())) == 1
+    assert pairings_file.read_text(encoding="utf-8") == pairings
+
+
+def test_trace(tmp_path: Path) -> None:
+    """Test running py4swiss with a trace of the pairing run."""
+    trf_file = DATA_DIRECTORY / "javafo_example.trf"
+    pairings_file = tmp_path / "pairings.txt"
+    trace_file = tmp_path / "pairing.trace"
+
+    sys.argv = ["py4swiss", "-t", str(trf_file), "-p", str(pairings_file), "--trace", str(trace_file)]
+    main()
+
+    result = replay_trace(trace_file)
+    assert result["computations"] > 0
+    assert result["mismatches"] == 0
+
+
+def test_verify(tmp_path: Path) -> None:
+    """Test verifying all published rounds of a TRF."""
+    trf_file = tmp_path / "tournament.trf"
+    report_file = tmp_path / "report.json"
+
+    settings = SimulationSettings(number_of_players=NUMBER_OF_PLAYERS, number_of_rounds=NUMBER_OF_ROUNDS)
+    TournamentSimulator(settings).simulate(DutchEngine).trf.write_to_file(trf_file)
+
+    sys.argv = ["py4swiss", "verify", "-t", str(trf_file), "-w", "1", "--report", str(report_file)]
+    main()
+
+    report = VerificationReport.model_validate_json(report_file.read_text(encoding="utf-8"))
+    assert len(report.rounds) == NUMBER_OF_ROUNDS
+    assert report.mismatches == []
+
+    # Rounds are reported as mismatches if the engine does not produce the published round pairings.
+    sys.argv = ["py4swiss", "verify", "-e", "dubov", "-t", str(trf_file), "-w", "1"]
+    with pytest.raises(SystemExit):
+        main()
+
+
+def test_standings(tmp_path: Path) -> None:
+    """Test computing the standings of a TRF."""
+    trf_file = DATA_DIRECTORY / "javafo_example.trf"
+    standings_file = tmp_path / "standings.json"
+
+    sys.argv = ["py4swiss", "standings", "-t", str(trf_file), "-b", "BH", "ARO", "-c", "-o", str(standings_file)]
+    main()
+
+    standings = Standings.model_validate_json(standings_file.read_text(encoding="utf-8"))
+    assert standings.tiebreaks == [Tiebreak.BUCHHOLZ, Tiebreak.ARO]
+    assert [entry.rank for entry in standings.entries] == list(range(1, len(standings.entries) + 1))
+    assert all(len(entry.results) == standings.number_of_rounds for entry in standings.entries)
+
+
 def test_engine_value_error(tmp_path: Path) -> None:
     """Test whether py4swiss throws value errors for invalid engines."""
     trf_file = DATA_DIRECTORY / "javafo_example.trf"
@@ -25,3 +186,30 @@ def test_engine_value_error(tmp_path: Path) -> None:
     with pytest.raises(ValueError):
         sys.argv = ["py4swiss", "-e", "knockout", "-t", str(trf_file), "-p", str(pairings_file)]
         main()
+
+
+def test_lazy_engines() -> None:
+    """Test whether engines are only imported once they are accessed."""
+    import_times = _get_import_times("py4swiss.main")
+
+    assert not any(module.startswith("py4swiss.engines.burstein") for module in import_times)
+    assert not any(module.startswith("py4swiss.engines.dubov") for module in import_times)
+    assert not any(module.startswith("py4swiss.engines.dutch") for module in import_times)
+    assert "py4swiss.matching_computer" not in import_times
+    assert "py4swiss.dynamicuint" not in import_times
+
+    import_times = _get_import_times("py4swiss.engines.dubov")
+
+    assert not any(module.startswith("py4swiss.engines.burstein") for module in import_times)
+    assert not any(module.startswith("py4swiss.engines.dutch") for module in import_times)
+
+    with pytest.raises(AttributeError):
+        _ = engines.KnockoutEngine
+
+
+def test_lazy_imports() -> None:
+    """Test whether the modules only needed by some commands or options are not imported at startup."""
+    import_times = _get_import_times("py4swiss.main")
+
+    for module in LAZY_MODULES:
+        assert module not in import_times
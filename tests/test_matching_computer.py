@@ -0,0 +1,153 @@
+import pickle
+
+import numpy as np
+
+from py4swiss.dynamicuint import DynamicUint
+from py4swiss.matching_computer import ComputerDutchOptimality, ComputerDutchValidity
+
+# A graph with eight vertices whose maximum matching requires forming and dissolving blossoms.
+EDGES = [(0, 1), (0, 4), (0, 6), (0, 7), (1, 4), (1, 5), (1, 7), (2, 6), (2, 7), (3, 6), (4, 6), (5, 6), (5, 7)]
+SIZE = 8
+
+
+def test_stats_validity() -> None:
+    """Test the solver counters of the matching computer for validity checks."""
+    computer = ComputerDutchValidity(SIZE, 1)
+    for _ in range(SIZE):
+        computer.add_vertex()
+    for u, v in EDGES:
+        computer.set_edge_weight(u, v, 1)
+
+    computer.compute_matching()
+    matching = computer.get_matching()
+    stats = computer.stats()
+
+    assert all(matching[matching[i]] == i != matching[i] for i in range(SIZE))
+    assert stats["computations"] == 1
+    assert stats["augmentations"] == SIZE // 2
+    assert stats["blossoms_formed"] > 0
+    assert stats["blossoms_expanded"] > 0
+    assert stats["dual_adjustments"] > 0
+    assert stats["relabeled_vertices"] == len({u for u, _ in EDGES})
+    assert stats["peak_root_blossoms"] >= SIZE
+    assert stats["peak_parent_blossoms"] > 0
+
+    # Only modified vertices are re-labeled by an incremental update.
+    computer.set_edge_weight(2, 7, 0)
+    computer.set_edge_weight(2, 6, 0)
+    computer.compute_matching()
+
+    assert computer.stats()["computations"] == 1 + 1
+    assert computer.stats()["relabeled_vertices"] == stats["relabeled_vertices"] + 1
+
+
+def test_stats_optimality() -> None:
+    """Test the solver counters of the matching computer for optimality."""
+    computer = ComputerDutchOptimality(SIZE, DynamicUint(2 * SIZE))
+    assert set(computer.stats().values()) == {0}
+
+    for _ in range(SIZE):
+        computer.add_vertex()
+    for u, v in EDGES:
+        computer.set_edge_weight(u, v, DynamicUint(u + v))
+
+    computer.compute_matching()
+    stats = computer.stats()
+
+    assert stats["computations"] == 1
+    assert stats["augmentations"] > 0
+    assert stats["peak_root_blossoms"] >= SIZE
+
+
+def test_wide_edge_weights() -> None:
+    """Test whether edge weights too wide to be stored inline yield the same matching as narrow ones."""
+    shift = 6 * 64
+    matchings = []
+
+    for extra_bits in (0, shift):
+        max_weight = DynamicUint(2 * SIZE)
+        max_weight.shift_grow(extra_bits)
+        zero = max_weight & 0
+
+        computer = ComputerDutchOptimality(SIZE, max_weight)
+        for _ in range(SIZE):
+            computer.add_vertex()
+        for u, v in EDGES:
+            computer.set_edge_weight(u, v, (zero | (u + v)) << extra_bits)
+
+        computer.compute_matching()
+        matchings.append(computer.get_matching())
+
+    assert matchings[0] == matchings[1]
+
+    wide_weight = DynamicUint(SIZE)
+    wide_weight.shift_grow(shift)
+
+    assert DynamicUint(wide_weight) == wide_weight
+    assert wide_weight >> shift == (wide_weight & 0) | SIZE
+
+
+def test_fused_weight_operations() -> None:
+    """Test whether the fused operations agree with the chained operators and with python integers."""
+    zero = DynamicUint(1)
+    zero.shift_grow(3 * 64)
+    zero &= 0
+    mask = (1 << 4 * 64) - 1
+
+    for offset in (0, 5, 63, 64, 130, 255, 256):
+        weight = DynamicUint(zero)
+        weight.set_bit(offset)
+        assert weight == (zero | 1) << offset
+
+        weight = DynamicUint(zero)
+        weight.add_at(3, offset)
+        weight.add_at(2**64 - 1, offset)
+        weight.subtract_at(7, offset)
+        assert weight.to_int() == ((3 + 2**64 - 1 - 7) << offset) & mask
+
+    weight = DynamicUint(zero)
+    weight.subtract_at(1, 70)
+    assert weight.to_int() == -(1 << 70) & mask
+
+    fields: list[tuple[DynamicUint | int, int]] = [(1, 0), ((zero | 5) << 64, 100), (3, 4), (0, 2)]
+    expected = ((((1 << 100) + (5 << 64)) << 4) + 3) << 2
+    assert zero.pack(fields).to_int() == expected
+    assert zero.pack(fields) == DynamicUint.from_int(expected, zero)
+
+    assert DynamicUint.from_int(2**200 + 1).to_int() == 2**200 + 1
+    assert DynamicUint.from_int(0).to_int() == 0
+
+
+def test_pickle() -> None:
+    """Test whether pickled instances and matching computers behave like the original ones."""
+    weight = DynamicUint(SIZE)
+    weight.shift_grow(2 * 64)
+
+    assert pickle.loads(pickle.dumps(weight)) == weight
+    assert DynamicUint(np.asarray(weight)) == weight
+    assert np.asarray(weight).tolist() == [0, 0, SIZE]
+    assert DynamicUint(np.array([SIZE, 1], dtype=np.uint64)).to_int() == (1 << 64) + SIZE
+
+    validity = ComputerDutchValidity(SIZE, 1)
+    optimality = ComputerDutchOptimality(SIZE, DynamicUint(2 * SIZE))
+    for _ in range(SIZE):
+        validity.add_vertex()
+        optimality.add_vertex()
+    for u, v in EDGES:
+        validity.set_edge_weight(u, v, 1)
+        optimality.set_edge_weight(u, v, DynamicUint(u + v))
+    validity.compute_matching()
+    optimality.compute_matching()
+
+    for computer in (validity, optimality):
+        copy = pickle.loads(pickle.dumps(computer))
+        assert copy.size() == computer.size()
+        assert copy.get_matching() == computer.get_matching()
+
+    # An unpickled computer supports incremental updates.
+    copy = pickle.loads(pickle.dumps(optimality))
+    for computer in (copy, optimality):
+        computer.set_edge_weight(0, 1, DynamicUint(0))
+        computer.set_edge_weight(2, 7, DynamicUint(0))
+        computer.compute_matching()
+    assert copy.get_matching() == optimality.get_matching()
@@ -0,0 +1,94 @@
+from pathlib import Path
+
+import pytest
+
+from py4swiss.engines import get_engine, get_engine_names
+from py4swiss.profiling import Profile, Profiler, count, get_profiler, phase, sample
+from py4swiss.trf import TrfParser
+
+DATA_DIRECTORY = Path(__file__).parent / "data"
+
+
+def test_profiler() -> None:
+    """Test whether all engines report into an active profiler."""
+    trf = TrfParser.parse(DATA_DIRECTORY / "javafo_example.trf")
+
+    for name in get_engine_names():
+        with Profiler() as profiler:
+            get_engine(name).generate_pairings(trf)
+        profile = profiler.profile
+
+        assert {"player_build", "bracket_setup", "bracket_solve", "color_allocation"} <= set(profile.phases)
+        assert profile.counters["solves"] > 0
+        assert profile.counters["edge_updates"] > 0
+        assert profile.counters["solver_computations"] == profile.counters["solves"]
+        assert profile.counters["solver_augmentations"] > 0
+        assert profile.counters["solver_peak_root_blossoms"] > 0
+        assert profile.counters["brackets"] == len(profile.samples["bracket_sizes"])
+        assert profile.phases["bracket_setup"].calls == profile.counters["brackets"]
+
+        for phase_profile in profile.phases.values():
+            assert len(phase_profile.durations) == phase_profile.calls
+            assert phase_profile.seconds == sum(phase_profile.durations)
+
+
+def test_profiler_context() -> None:
+    """Test whether reporting only affects the profiler active in the current context."""
+    assert get_profiler() is None
+
+    # Reporting without an active profiler does nothing.
+    with phase("outside"):
+        count("outside")
+        sample("outside", 1)
+
+    with Profiler() as outer:
+        count("outer")
+        with Profiler() as inner:
+            assert get_profiler() is inner
+            count("inner", 2)
+            sample("inner", 3)
+        assert get_profiler() is outer
+        with phase("outer"):
+            pass
+
+    assert get_profiler() is None
+    assert outer.profile.counters == {"outer": 1}
+    assert set(outer.profile.phases) == {"outer"}
+    assert inner.profile.counters == {"inner": 2}
+    assert inner.profile.samples == {"inner": [3]}
+
+
+class CustomComputer:
+    """A computer whose counters grow with each call to 'stats' for testing purposes."""
+
+    def __init__(self) -> None:
+        """Initialize a new computer without any work performed."""
+        self.calls = 0
+
+    def stats(self) -> dict[str, int]:
+        """Return the counters of the computer."""
+        self.calls += 1
+        return {"computations": self.calls, "peak_root_blossoms": 2 * self.calls}
+
+
+def test_profiler_solve_error() -> None:
+    """Test whether the solver counters are recorded even if the computation raises."""
+    computer = CustomComputer()
+
+    with Profiler() as profiler, pytest.raises(RuntimeError), profiler.solve(computer):
+        raise RuntimeError
+
+    assert profiler.profile.counters == {"solves": 1, "solver_computations": 1, "solver_peak_root_blossoms": 4}
+
+
+def test_profile_write_to_file(tmp_path: Path) -> None:
+    """Test writing a profile to a file and reading it back."""
+    with Profiler() as profiler:
+        with phase("phase"):
+            count("counter")
+        sample("sample", 1)
+
+    file_path = tmp_path / "profile.json"
+    profiler.profile.write_to_file(file_path)
+
+    assert Profile.model_validate_json(file_path.read_text(encoding="utf-8")) == profiler.profile
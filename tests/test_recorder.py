@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import pytest
+
+from py4swiss.engines import get_engine, get_engine_names
+from py4swiss.matching_computer import ComputerDutchValidity, TraceWriter
+from py4swiss.profiling import Profiler, TraceRecorder, get_recorder, replay_trace
+from py4swiss.trf import TrfParser
+
+DATA_DIRECTORY = Path(__file__).parent / "data"
+
+
+def test_recorder(tmp_path: Path) -> None:
+    """Test whether replaying the trace of each engine reproduces all matchings."""
+    trf = TrfParser.parse(DATA_DIRECTORY / "javafo_example.trf")
+
+    for name in get_engine_names():
+        trace_file = tmp_path / f"{name}.trace"
+        with TraceRecorder(trace_file), Profiler() as profiler:
+            get_engine(name).generate_pairings(trf)
+        result = replay_trace(trace_file)
+
+        assert result["computers"] > 0
+        assert result["computations"] == profiler.profile.counters["solves"]
+        assert result["operations"] > result["computations"]
+        assert result["mismatches"] == 0
+
+
+def test_recorder_context(tmp_path: Path) -> None:
+    """Test whether computers are only recorded while a recorder is active."""
+    trf = TrfParser.parse(DATA_DIRECTORY / "javafo_example.trf")
+    trace_file = tmp_path / "empty.trace"
+
+    assert get_recorder() is None
+    with TraceRecorder(trace_file) as recorder:
+        assert get_recorder() is recorder
+    assert get_recorder() is None
+
+    get_engine("dutch").generate_pairings(trf)
+    assert replay_trace(trace_file)["operations"] == 0
+
+
+def test_record_non_empty(tmp_path: Path) -> None:
+    """Test recording a computer to which vertices were already added."""
+    computer = ComputerDutchValidity(2, 1)
+    computer.add_vertex()
+
+    with pytest.raises(RuntimeError):
+        computer.record(TraceWriter(str(tmp_path / "computer.trace")))
+
+
+def test_replay_invalid(tmp_path: Path) -> None:
+    """Test replaying files that are not valid traces."""
+    trace_file = tmp_path / "invalid.trace"
+
+    with pytest.raises(RuntimeError):
+        replay_trace(trace_file)
+
+    trace_file.write_bytes(b"invalid")
+    with pytest.raises(RuntimeError):
+        replay_trace(trace_file)
@@ -0,0 +1,103 @@
+import pytest
+from pydantic import ValidationError
+
+from py4swiss.engines import get_engine, get_engine_names
+from py4swiss.simulation import (
+    RatingDistribution,
+    SimulationSettings,
+    TournamentSimulator,
+)
+from py4swiss.trf.results import ResultToken
+
+RATING_LOW = 1400
+RATING_HIGH = 2200
+
+
+def test_simulation() -> None:
+    """Test simulating tournaments with all engines."""
+    number_of_players, number_of_rounds = 17, 7
+    settings = SimulationSettings(number_of_players=number_of_players, number_of_rounds=number_of_rounds, seed=2367)
+
+    for name in get_engine_names():
+        report = TournamentSimulator(settings).simulate(get_engine(name))
+        trf = report.trf
+
+        assert [round_report.round_number for round_report in report.rounds] == list(range(1, number_of_rounds + 1))
+        assert all(round_report.seconds >= 0.0 for round_report in report.rounds)
+        assert report.total_seconds == sum(round_report.seconds for round_report in report.rounds)
+        assert all(len(round_report.pairings) == (number_of_players + 1) // 2 for round_report in report.rounds)
+        assert all(len(section.results) == number_of_rounds for section in trf.player_sections)
+
+        trf.validate_contents()
+
+
+def test_simulation_reproducibility() -> None:
+    """Test whether simulations with identical settings yield identical results."""
+    settings = SimulationSettings(number_of_players=24, number_of_rounds=5, forfeit_ratio=0.2, bye_ratio=0.2, seed=42)
+    engine = get_engine("dutch")
+
+    report_1 = TournamentSimulator(settings).simulate(engine)
+    report_2 = TournamentSimulator(settings).simulate(engine)
+
+    assert [round_report.pairings for round_report in report_1.rounds] == [
+        round_report.pairings for round_report in report_2.rounds
+    ]
+    assert report_1.trf.player_sections == report_2.trf.player_sections
+
+    settings = settings.model_copy(update={"seed": 43})
+    report_3 = TournamentSimulator(settings).simulate(engine)
+
+    assert report_1.trf.player_sections != report_3.trf.player_sections
+
+
+def test_simulation_field() -> None:
+    """Test the generation of synthetic fields."""
+    settings = SimulationSettings(
+        number_of_players=50,
+        number_of_rounds=9,
+        rating_distribution=RatingDistribution.NORMAL,
+        rating_low=RATING_LOW,
+        rating_high=RATING_HIGH,
+        accelerated_rounds=2,
+        shuffle=True,
+        seed=7,
+    )
+    trf = TournamentSimulator(settings).get_initial_trf()
+    ratings = {section.starting_number: section.fide_rating or 0 for section in trf.player_sections}
+
+    assert all(RATING_LOW <= rating <= RATING_HIGH for rating in ratings.values())
+    assert all(ratings[i] >= ratings[i + 1] for i in range(1, 50))
+    assert [section.starting_number for section in trf.player_sections] != list(range(1, 51))
+    assert set(trf.x_section.accelerations) == set(range(1, 26))
+    assert trf.x_section.accelerations[1] == [10, 10, 0, 0, 0, 0, 0, 0, 0]
+
+
+def test_simulation_byes_and_forfeits() -> None:
+    """Test simulating tournaments in which every game is forfeited and byes are assigned."""
+    settings = SimulationSettings(number_of_players=12, number_of_rounds=3, forfeit_ratio=1.0, bye_ratio=0.5, seed=1)
+    report = TournamentSimulator(settings).simulate(get_engine("dutch"))
+    results = {round_result.result for section in report.trf.player_sections for round_result in section.results}
+
+    assert not any(result.is_played() for result in results)
+    assert bool(results & {ResultToken.HALF_POINT_BYE, ResultToken.FULL_POINT_BYE, ResultToken.ZERO_POINT_BYE})
+
+    report = TournamentSimulator(settings).simulate(get_engine("dutch"), number_of_rounds=1)
+
+    assert len(report.rounds) == 1
+
+    report = TournamentSimulator(settings).simulate(get_engine("dutch"), number_of_rounds=0)
+
+    assert not report.rounds
+    assert all(not section.results for section in report.trf.player_sections)
+
+
+def test_simulation_settings() -> None:
+    """Test whether invalid simulation settings are rejected."""
+    with pytest.raises(ValidationError):
+        SimulationSettings(number_of_players=1, number_of_rounds=5)
+
+    with pytest.raises(ValidationError):
+        SimulationSettings(number_of_players=10, number_of_rounds=5, forfeit_ratio=1.5)
+
+    with pytest.raises(ValidationError, match="exceeds the highest rating"):
+        SimulationSettings(number_of_players=10, number_of_rounds=5, rating_low=2000, rating_high=1500)
@@ -0,0 +1,92 @@
+from pathlib import Path
+
+import pytest
+
+from py4swiss.engines import DutchEngine
+from py4swiss.simulation import SimulationSettings, TournamentSimulator
+from py4swiss.standings import Standings, StandingsTable, Tiebreak
+from py4swiss.tiebreaks import TiebreakTable
+from py4swiss.trf import ParsedTrf
+from py4swiss.trf.results import ResultToken
+from tests.helpers.trf_helpers import get_trf_after_round
+
+NUMBER_OF_ROUNDS = 5
+TIEBREAKS = [Tiebreak.BUCHHOLZ, Tiebreak.SONNEBORN_BERGER, Tiebreak.ARO]
+
+
+def _get_expected_ranking(trf: ParsedTrf) -> list[int]:
+    """Return the starting numbers of all players ordered by points, tiebreaks and starting number."""
+    table = TiebreakTable.from_trf(trf)
+    values = zip(
+        table.points.tolist(),
+        table.get_buchholz().tolist(),
+        table.get_sonneborn_berger().tolist(),
+        table.get_aro().tolist(),
+        strict=True,
+    )
+    keys = {section.starting_number: value for section, value in zip(trf.player_sections, values, strict=True)}
+    return sorted(keys, key=lambda starting_number: ([-value for value in keys[starting_number]], starting_number))
+
+
+def test_standings_table() -> None:
+    """Test whether the standings agree with the tiebreaks, both when built at once and when updated per round."""
+    settings = SimulationSettings(
+        number_of_players=17, number_of_rounds=NUMBER_OF_ROUNDS, forfeit_ratio=0.2, bye_ratio=0.2, seed=45
+    )
+    trf = TournamentSimulator(settings).simulate(DutchEngine).trf
+    standings_table = StandingsTable(get_trf_after_round(trf, 0), TIEBREAKS)
+
+    for round_number in range(1, NUMBER_OF_ROUNDS + 1):
+        current_trf = get_trf_after_round(trf, round_number)
+        standings_table.append_round(current_trf)
+
+        for standings in (
+            standings_table.get_standings(crosstable=True),
+            StandingsTable(current_trf, TIEBREAKS).get_standings(crosstable=True),
+        ):
+            assert standings.number_of_rounds == round_number
+            assert [entry.rank for entry in standings.entries] == list(range(1, len(trf.player_sections) + 1))
+            assert [entry.starting_number for entry in standings.entries] == _get_expected_ranking(current_trf)
+
+            # Each crosstable entry refers to the rank of the opponent, whose entry refers back to the player.
+            ranks = {entry.starting_number: entry.rank for entry in standings.entries}
+            sections = {section.starting_number: section for section in current_trf.player_sections}
+            for entry in standings.entries:
+                assert len(entry.results) == round_number
+                for result, round_result in zip(entry.results, sections[entry.starting_number].results, strict=True):
+                    if round_result.id:
+                        expected = f"{ranks[round_result.id]}{round_result.color.value}{round_result.result.value}"
+                    else:
+                        expected = round_result.result.value
+                    assert result == expected
+
+    # The TRF needs to contain exactly one more round.
+    with pytest.raises(ValueError, match="exactly one round"):
+        standings_table.append_round(trf)
+
+    # The earlier results of the TRF need to be unchanged.
+    standings_table = StandingsTable(get_trf_after_round(trf, NUMBER_OF_ROUNDS - 1), TIEBREAKS)
+    round_result = trf.player_sections[0].results[0]
+    round_result.result = ResultToken.FORFEIT_LOSS if round_result.result.is_played() else ResultToken.FORFEIT_WIN
+    with pytest.raises(ValueError, match="exactly one round"):
+        standings_table.append_round(trf)
+
+
+def test_standings_output(tmp_path: Path) -> None:
+    """Test writing the standings as a table and as JSON."""
+    settings = SimulationSettings(number_of_players=10, number_of_rounds=3)
+    trf = TournamentSimulator(settings).simulate(DutchEngine).trf
+    standings = StandingsTable(trf).get_standings()
+
+    assert standings.tiebreaks == [Tiebreak.BUCHHOLZ, Tiebreak.SONNEBORN_BERGER]
+    assert all(entry.results == [] for entry in standings.entries)
+
+    json_file = tmp_path / "standings.json"
+    standings.write_to_file(json_file)
+    assert Standings.model_validate_json(json_file.read_text(encoding="utf-8")) == standings
+
+    text_file = tmp_path / "standings.txt"
+    standings.write_to_file(text_file)
+    lines = text_file.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1 + len(standings.entries)
+    assert lines[0].split()[-2:] == ["BH", "SB"]
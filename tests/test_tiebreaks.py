@@ -0,0 +1,79 @@
+import pytest
+
+from py4swiss.engines import DutchEngine
+from py4swiss.simulation import SimulationSettings, TournamentSimulator
+from py4swiss.tiebreaks import TiebreakTable
+from py4swiss.trf import ParsedTrf
+from py4swiss.trf.results import ColorToken, ResultMatrix, ResultToken
+from tests.helpers.trf_helpers import get_trf_after_round
+
+NUMBER_OF_ROUNDS = 6
+
+
+def _get_expected_tiebreaks(trf: ParsedTrf) -> tuple[list[int], list[int], list[int]]:
+    """Return the Buchholz, Sonneborn-Berger and ARO of all players by walking through their round results."""
+    scoring_point_system = trf.x_section.scoring_point_system
+    draw_points = scoring_point_system.score_dict[(ResultToken.HALF_POINT_BYE, ColorToken.BYE_OR_NOT_PAIRED)]
+    sections = {section.starting_number: section for section in trf.player_sections}
+
+    def get_opponent_points(starting_number: int) -> int:
+        section = sections[starting_number]
+        if all(round_result.result == ResultToken.ZERO_POINT_BYE for round_result in section.results):
+            return draw_points * len(section.results)
+        return section.points_times_ten
+
+    buchholz_list, sonneborn_berger_list, aro_list = [], [], []
+    for section in trf.player_sections:
+        buchholz, sonneborn_berger, ratings = 0, 0, []
+        for round_result in section.results:
+            points = scoring_point_system.get_points_times_ten(round_result)
+            if round_result.result.is_played():
+                buchholz += get_opponent_points(round_result.id)
+                sonneborn_berger += sections[round_result.id].points_times_ten * points
+                ratings.append(sections[round_result.id].fide_rating or 0)
+            else:
+                buchholz += section.points_times_ten
+                sonneborn_berger += section.points_times_ten * points
+        buchholz_list.append(buchholz)
+        sonneborn_berger_list.append(sonneborn_berger)
+        aro_list.append((2 * sum(ratings) + len(ratings)) // (2 * len(ratings)) if ratings else 0)
+
+    return buchholz_list, sonneborn_berger_list, aro_list
+
+
+def test_tiebreak_table() -> None:
+    """Test whether the tiebreaks agree with the round results, both when built at once and when updated per round."""
+    settings = SimulationSettings(
+        number_of_players=21, number_of_rounds=NUMBER_OF_ROUNDS, forfeit_ratio=0.2, bye_ratio=0.2, seed=44
+    )
+    trf = TournamentSimulator(settings).simulate(DutchEngine).trf
+
+    previous_trf = get_trf_after_round(trf, 0)
+    tiebreak_table = TiebreakTable.from_trf(previous_trf)
+
+    for round_number in range(1, NUMBER_OF_ROUNDS + 1):
+        current_trf = get_trf_after_round(trf, round_number)
+        result_matrix = previous_trf.get_result_matrix()
+
+        # Appending the results of a single round to the same TRF only reads the new round.
+        previous_trf.player_sections = current_trf.player_sections
+        assert result_matrix.can_append_round(current_trf.player_sections)
+        appended_result_matrix = previous_trf.get_result_matrix()
+        expected_result_matrix = ResultMatrix(current_trf.player_sections)
+        for name in ("opponents", "colors", "results", "played", "indices", "lengths"):
+            assert (getattr(appended_result_matrix, name) == getattr(expected_result_matrix, name)).all()
+
+        tiebreak_table.append_round(current_trf.player_sections, appended_result_matrix)
+        new_tiebreak_table = TiebreakTable.from_trf(current_trf)
+        buchholz_list, sonneborn_berger_list, aro_list = _get_expected_tiebreaks(current_trf)
+
+        for table in (tiebreak_table, new_tiebreak_table):
+            assert table.get_buchholz().tolist() == buchholz_list
+            assert table.get_sonneborn_berger().tolist() == sonneborn_berger_list
+            assert table.get_aro().tolist() == aro_list
+
+        previous_trf = current_trf
+
+    # The result matrix needs to contain exactly one more round.
+    with pytest.raises(ValueError, match="exactly one round"):
+        tiebreak_table.append_round(trf.player_sections, trf.get_result_matrix())
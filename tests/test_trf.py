@@ -2,14 +2,19 @@ from pathlib import Path
 
 import pytest
 
-from py4swiss.trf import TrfLine, TrfParser
+from py4swiss.engines import DutchEngine
+from py4swiss.simulation import SimulationSettings, TournamentSimulator
+from py4swiss.trf import ParsedTrf, TrfLine, TrfParser, TrfWriter
 from py4swiss.trf.exceptions import ConsistencyError, LineError, ParsingError
+from py4swiss.trf.results import ColorToken, ResultToken, RoundResult
+from py4swiss.trf.results.result_matrix import COLOR_CODES, RESULT_CODES
 from py4swiss.trf.sections import (
     PlayerSection,
     TeamSection,
     TournamentSection,
     XSection,
 )
+from tests.helpers.trf_helpers import get_trf_after_round
 
 DATA_DIRECTORY = Path(__file__).parent / "data"
 
@@ -239,6 +244,113 @@ def test_trf_parser(tmp_path: Path) -> None:
     TrfParser.parse(trf_file)
 
 
+def _get_ranked_trf_after_round(trf: ParsedTrf, round_number: int) -> ParsedTrf:
+    """Return a copy of the given TRF containing only the results up to the given round and ranks depending on it."""
+    truncated_trf = get_trf_after_round(trf, round_number)
+
+    for player_section in truncated_trf.player_sections:
+        player_section.rank = player_section.starting_number + round_number
+
+    return truncated_trf
+
+
+def test_trf_writer() -> None:
+    """Test whether the TRF writer agrees with the serializer of the player sections."""
+    settings = SimulationSettings(number_of_players=15, number_of_rounds=5, forfeit_ratio=0.2, bye_ratio=0.2, seed=46)
+    trfs = [TournamentSimulator(settings).simulate(DutchEngine).trf]
+
+    for trf_file in sorted(DATA_DIRECTORY.glob("*.trf")):
+        try:
+            trfs.append(TrfParser.parse(trf_file))
+        except (ConsistencyError, ParsingError):
+            continue
+
+    # Players with fewer results than others as well as players without any results.
+    trfs.append(get_trf_after_round(trfs[0], 0))
+    trfs[0].player_sections[0].results.pop()
+
+    for trf in trfs:
+        assert TrfWriter.get_player_strings(trf) == [
+            player_section.to_string() for player_section in trf.player_sections
+        ]
+
+
+def test_trf_writer_append_round(tmp_path: Path) -> None:
+    """Test whether appending rounds to a TRF file yields the same file as writing the TRF anew."""
+    number_of_rounds = 4
+    settings = SimulationSettings(
+        number_of_players=13, number_of_rounds=number_of_rounds, forfeit_ratio=0.2, bye_ratio=0.2, seed=46
+    )
+    trf = TournamentSimulator(settings).simulate(DutchEngine).trf
+
+    appended_file = tmp_path / "appended.trf"
+    written_file = tmp_path / "written.trf"
+    _get_ranked_trf_after_round(trf, 0).write_to_file(appended_file)
+
+    for round_number in range(1, number_of_rounds + 1):
+        current_trf = _get_ranked_trf_after_round(trf, round_number)
+        current_trf.append_round_to_file(appended_file)
+        current_trf.write_to_file(written_file)
+
+        assert appended_file.read_bytes() == written_file.read_bytes()
+        assert TrfParser.parse(appended_file) == current_trf
+
+    # The file needs to contain exactly one round less.
+    with pytest.raises(ValueError, match="exactly one round"):
+        trf.append_round_to_file(appended_file)
+
+
+def test_result_matrix() -> None:
+    """Test whether the result matrix of a TRF agrees with its player sections and is rebuilt once results change."""
+    parsed_trf = TrfParser.parse(DATA_DIRECTORY / "javafo_example.trf")
+    result_matrix = parsed_trf.get_result_matrix()
+
+    assert parsed_trf.get_result_matrix() is result_matrix
+    assert parsed_trf == parsed_trf.model_copy(deep=True)
+
+    for row, player_section in enumerate(parsed_trf.player_sections):
+        assert result_matrix.starting_numbers[row] == player_section.starting_number
+        assert result_matrix.lengths[row] == len(player_section.results)
+
+        for column, round_result in enumerate(player_section.results):
+            assert result_matrix.opponents[row, column] == round_result.id
+            assert result_matrix.colors[row, column] == COLOR_CODES[round_result.color]
+            assert result_matrix.results[row, column] == RESULT_CODES[round_result.result]
+            assert result_matrix.played[row, column] == round_result.result.is_played()
+
+    round_result = RoundResult(id=0, color=ColorToken.BYE_OR_NOT_PAIRED, result=ResultToken.ZERO_POINT_BYE)
+    parsed_trf.player_sections[0].results.append(round_result)
+    updated_result_matrix = parsed_trf.get_result_matrix()
+
+    assert updated_result_matrix is not result_matrix
+    assert updated_result_matrix.lengths[0] == len(parsed_trf.player_sections[0].results)
+    assert updated_result_matrix.results[0, -1] == RESULT_CODES[ResultToken.ZERO_POINT_BYE]
+
+    # Results changed in place are picked up as well, e.g. once an earlier result is corrected.
+    parsed_trf.player_sections[0].results.pop()
+    parsed_trf.validate_contents()
+    round_result = parsed_trf.player_sections[0].results[0]
+    round_result.result = ResultToken.FORFEIT_LOSS if round_result.result.is_played() else ResultToken.FORFEIT_WIN
+    corrected_result_matrix = parsed_trf.get_result_matrix()
+
+    assert corrected_result_matrix.results[0, 0] == RESULT_CODES[round_result.result]
+    assert parsed_trf.get_result_matrix() is corrected_result_matrix
+    with pytest.raises(ConsistencyError):
+        parsed_trf.validate_contents()
+
+    # Appending a round does not take over earlier results, which were corrected at the same time.
+    for player_section in parsed_trf.player_sections:
+        player_section.results.append(
+            RoundResult(id=0, color=ColorToken.BYE_OR_NOT_PAIRED, result=ResultToken.ZERO_POINT_BYE)
+        )
+    round_result.result = ResultToken.DRAW
+    appended_result_matrix = parsed_trf.get_result_matrix()
+
+    assert not corrected_result_matrix.can_append_round(parsed_trf.player_sections)
+    assert appended_result_matrix.results[0, 0] == RESULT_CODES[round_result.result]
+    assert appended_result_matrix.results[0, -1] == RESULT_CODES[ResultToken.ZERO_POINT_BYE]
+
+
 def test_trf_parser_consistency_error() -> None:
     """Test whether the TRF parser throws consistency errors for TRFs with inconsistent contents."""
     trf_files = [
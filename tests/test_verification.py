@@ -0,0 +1,56 @@
+from pathlib import Path
+
+from py4swiss.engines import get_engine, get_engine_names
+from py4swiss.simulation import SimulationSettings, TournamentSimulator
+from py4swiss.trf import TrfParser
+from py4swiss.trf.results import ResultToken
+from py4swiss.verification import TournamentVerifier
+
+DATA_DIRECTORY = Path(__file__).parent / "data"
+
+NUMBER_OF_PLAYERS = 25
+NUMBER_OF_ROUNDS = 5
+MAX_WORKERS = 2
+
+
+def test_verify() -> None:
+    """Test whether all rounds of simulated tournaments are verified by the engine that paired them."""
+    settings = SimulationSettings(
+        number_of_players=NUMBER_OF_PLAYERS,
+        number_of_rounds=NUMBER_OF_ROUNDS,
+        forfeit_ratio=0.1,
+        bye_ratio=0.1,
+    )
+
+    for name in get_engine_names():
+        engine = get_engine(name)
+        simulation_report = TournamentSimulator(settings).simulate(engine)
+        verification_report = TournamentVerifier(simulation_report.trf).verify(engine, max_workers=MAX_WORKERS)
+
+        assert len(verification_report.rounds) == NUMBER_OF_ROUNDS
+        assert verification_report.mismatches == []
+        for round_report, round_verification in zip(simulation_report.rounds, verification_report.rounds, strict=True):
+            assert set(round_verification.published) == set(round_report.pairings)
+
+
+def test_get_round_trf() -> None:
+    """Test whether the state before each round only contains the results known at that time."""
+    trf = TrfParser.parse(DATA_DIRECTORY / "javafo_example.trf")
+    verifier = TournamentVerifier(trf)
+    scoring_point_system = trf.x_section.scoring_point_system
+
+    for round_number in range(1, verifier.number_of_rounds + 1):
+        round_trf = verifier.get_round_trf(round_number)
+        assert round_trf.x_section.zeroed_ids == set()
+
+        for player_section, round_player_section in zip(trf.player_sections, round_trf.player_sections, strict=True):
+            assert player_section.results[: round_number - 1] == round_player_section.results[: round_number - 1]
+            assert len(round_player_section.results) in (round_number - 1, round_number)
+            assert round_player_section.points_times_ten == sum(
+                scoring_point_system.get_points_times_ten(result) for result in round_player_section.results
+            )
+            if len(round_player_section.results) == round_number:
+                assert round_player_section.results[-1].result != ResultToken.PAIRING_ALLOCATED_BYE
+
+    # The original TRF remains unchanged.
+    assert trf == TrfParser.parse(DATA_DIRECTORY / "javafo_example.trf")